@@ -0,0 +1,103 @@
+"""
+
+File:
+    benchmarks/caller_resolution.py
+
+Author:
+    Inspyre Softworks
+
+Description:
+    Compares the throughput (records per second) of the legacy ``inspect.stack()`` record factory with the
+    frame-walking caller resolver in :mod:`inspy_logger.engine.caller`.
+
+    Run with:
+
+        $ python benchmarks/caller_resolution.py [n_records]
+
+"""
+import inspect
+import logging
+import sys
+from time import perf_counter
+
+from inspy_logger.engine.caller import find_caller, install_record_factory
+
+
+N_RECORDS = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+ORIGINAL_FACTORY = logging.getLogRecordFactory()
+
+
+class FormattingNullHandler(logging.Handler):
+    """A handler that formats each record (so `file_name` is used) and throws the result away."""
+
+    def emit(self, record):
+        self.format(record)
+
+
+def legacy_record_factory(*args, **kwargs):
+    record = ORIGINAL_FACTORY(*args, **kwargs)
+    frame = inspect.stack()[1]
+    record.file_name = frame.filename
+    return record
+
+
+def build_logger():
+    logger = logging.getLogger('benchmarks.caller_resolution')
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+
+    handler = FormattingNullHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s |-| %(file_name)s:%(lineno)d'))
+    logger.addHandler(handler)
+
+    return logger
+
+
+def nested_call(logger, depth):
+    """Logs from `depth` frames down so the stack resembles a real application."""
+    if depth:
+        return nested_call(logger, depth - 1)
+
+    for i in range(N_RECORDS):
+        logger.info('Record number %d', i)
+
+
+def measure(label, logger, depth=20):
+    start = perf_counter()
+    nested_call(logger, depth)
+    elapsed = perf_counter() - start
+
+    print(f'{label:<40} {N_RECORDS / elapsed:>12,.0f} records/s')
+
+
+def measure_resolver(label, resolver, depth=20):
+    def nested(remaining):
+        if remaining:
+            return nested(remaining - 1)
+
+        start = perf_counter()
+        for _ in range(N_RECORDS):
+            resolver()
+        return perf_counter() - start
+
+    elapsed = nested(depth)
+    print(f'{label:<40} {N_RECORDS / elapsed:>12,.0f} lookups/s')
+
+
+def main():
+    logger = build_logger()
+
+    logging.setLogRecordFactory(legacy_record_factory)
+    measure('Legacy inspect.stack() factory', logger)
+
+    logging.setLogRecordFactory(ORIGINAL_FACTORY)
+    install_record_factory()
+    measure('inSPy caller factory', logger)
+
+    measure_resolver('inspect.stack()[1]', lambda: inspect.stack()[1])
+    measure_resolver('find_caller()', find_caller)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+
+File:
+    benchmarks/console_engines.py
+
+Author:
+    Inspyre Softworks
+
+Description:
+    Compares the lines per second of the two console engines of `HANDLER_TYPES['console']`: Rich and the plain
+    byte-buffered writer. Both are set up as `Logger.set_up_console` sets them up, and write to the null device (as
+    if the output were piped to a log collector).
+
+    Run with:
+
+        $ python benchmarks/console_engines.py [n_lines]
+
+"""
+import logging
+import os
+import sys
+from time import perf_counter
+
+from inspy_logger.constants import HANDLER_TYPES
+from inspy_logger.helpers import CustomFormatter
+
+
+N_LINES = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+
+def make_handler(mode):
+    handler = HANDLER_TYPES['console'](
+            mode=mode, show_level=True, markup=True, rich_tracebacks=True, tracebacks_show_locals=True
+            )
+    handler.setFormatter(CustomFormatter('[benchmarks.console_engines] %(message)s'))
+
+    return handler
+
+
+def run(handler):
+    records = [
+            logging.LogRecord('benchmarks.console_engines', logging.INFO, __file__, 42, 'Processed item %d of %d',
+                              (index, N_LINES), None)
+            for index in range(N_LINES)
+            ]
+
+    start = perf_counter()
+
+    for record in records:
+        handler.handle(record)
+
+    handler.flush()
+
+    return perf_counter() - start
+
+
+def main():
+    stdout = sys.stdout
+    results = {}
+
+    with open(os.devnull, 'w') as null:
+        # Both engines write to `sys.stdout`, so point it at the null device while they run.
+        sys.stdout = null
+
+        try:
+            for mode in ('rich', 'plain'):
+                handler = make_handler(mode)
+                results[mode] = run(handler)
+                handler.close()
+        finally:
+            sys.stdout = stdout
+
+    for mode, seconds in results.items():
+        print(f'{mode:<6} {N_LINES / seconds:>12,.0f} lines/s  {seconds / N_LINES * 1e6:>8.2f} µs/line  '
+              f'{results["rich"] / seconds:>6.1f}x')
+
+
+if __name__ == '__main__':
+    main()
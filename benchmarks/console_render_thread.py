@@ -0,0 +1,101 @@
+"""
+
+File:
+    benchmarks/console_render_thread.py
+
+Author:
+    Inspyre Softworks
+
+Description:
+    Measures how long logging threads spend in their logging calls when several of them log through one Rich console
+    handler, with the records rendered on the logging threads and with the console render thread (one batch per
+    frame). Output goes to the null device, as a terminal forced on.
+
+    Run with:
+
+        $ python benchmarks/console_render_thread.py [n_threads] [n_lines_per_thread]
+
+"""
+import logging
+import os
+import sys
+import threading
+from time import perf_counter
+
+from inspy_logger.engine.handlers import ConsoleHandler
+from inspy_logger.engine.render import get_console_renderer
+from inspy_logger.helpers import CustomFormatter
+
+
+N_THREADS = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+
+N_LINES = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+
+
+def make_handler(threaded, null):
+    from rich.console import Console
+
+    handler = ConsoleHandler(
+            mode='rich', threaded=threaded, console=Console(file=null, force_terminal=True, width=120),
+            show_level=True, markup=True
+            )
+    handler.setFormatter(CustomFormatter('[benchmarks.console_render_thread] %(message)s'))
+
+    return handler
+
+
+def run(handler):
+    """
+    Returns the time the logging threads spent in their calls (summed) and the wall time until everything was written.
+    """
+    logger = logging.getLogger(f'benchmarks.console_render_thread.{handler.threaded}')
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.handlers[:] = [handler]
+
+    in_calls = []
+
+    def work(index):
+        spent = 0
+
+        for line in range(N_LINES):
+            start = perf_counter()
+            logger.info('Thread %d processed item %d', index, line)
+            spent += perf_counter() - start
+
+        in_calls.append(spent)
+
+    threads = [threading.Thread(target=work, args=(index,)) for index in range(N_THREADS)]
+
+    start = perf_counter()
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    handler.flush()
+
+    return sum(in_calls), perf_counter() - start
+
+
+def main():
+    total = N_THREADS * N_LINES
+
+    with open(os.devnull, 'w') as null:
+        for threaded in (False, True):
+            handler = make_handler(threaded, null)
+            in_calls, wall = run(handler)
+            handler.close()
+
+            print(f'{"render thread" if threaded else "logging threads":<16} '
+                  f'{in_calls / total * 1e6:>8.2f} µs/call in logging threads  '
+                  f'{total / wall:>10,.0f} lines/s overall')
+
+    renderer = get_console_renderer()
+    print(f'{renderer.rendered:,} line(s) rendered in {renderer.frames:,} frame(s), {renderer.dropped:,} dropped')
+
+
+if __name__ == '__main__':
+    main()
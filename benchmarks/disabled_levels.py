@@ -0,0 +1,68 @@
+"""
+
+File:
+    benchmarks/disabled_levels.py
+
+Author:
+    Inspyre Softworks
+
+Description:
+    Microbenchmarks for calls to a disabled level (here: `debug` on a logger at INFO), comparing a bare function
+    call, the standard library, and an inSPy-Logger `Logger` with and without the disabled-level fast path.
+
+    Run with:
+
+        $ python benchmarks/disabled_levels.py [n_calls]
+
+"""
+import logging
+import sys
+from timeit import timeit
+
+from inspy_logger import Logger
+
+
+N_CALLS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+
+def bare_function(*args, **kwargs):
+    pass
+
+
+def report(label, seconds, baseline=None):
+    per_call = seconds / N_CALLS * 1e9
+    relative = f'{seconds / baseline:>6.2f}x' if baseline else '  1.00x'
+    print(f'{label:<40} {per_call:>8.1f} ns/call  {relative}')
+
+
+def main():
+    std_logger = logging.getLogger('benchmarks.disabled_levels.stdlib')
+    std_logger.setLevel(logging.INFO)
+
+    slow = Logger('benchmarks.disabled_levels.slow', console_level='info', no_file_logging=True)
+    fast = Logger('benchmarks.disabled_levels.fast', console_level='info', no_file_logging=True, fast_path=True)
+
+    namespace = {'bare_function': bare_function, 'std_logger': std_logger, 'slow': slow, 'fast': fast}
+
+    baseline = timeit("bare_function('Value: %s', 42)", globals=namespace, number=N_CALLS)
+    report('Bare function call', baseline)
+
+    report(
+            'logging.Logger.debug',
+            timeit("std_logger.debug('Value: %s', 42)", globals=namespace, number=N_CALLS),
+            baseline
+            )
+    report(
+            'Logger.debug',
+            timeit("slow.debug('Value: %s', 42)", globals=namespace, number=N_CALLS),
+            baseline
+            )
+    report(
+            'Logger.debug (fast_path=True)',
+            timeit("fast.debug('Value: %s', 42)", globals=namespace, number=N_CALLS),
+            baseline
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+
+File:
+    benchmarks/formatter.py
+
+Author:
+    Inspyre Softworks
+
+Description:
+    Measures formatter throughput on a burst of records (most of them sharing the same second) with the file handler's
+    format string, comparing `logging.Formatter` with `CustomFormatter` (compiled format and per-second timestamp
+    cache), with microsecond and monotonic-anchored timestamps, and with the formatted text shared by an identical
+    formatter that already formatted the record.
+
+    Run with:
+
+        $ python benchmarks/formatter.py [n_records]
+
+"""
+import logging
+import sys
+from time import perf_counter
+
+from inspy_logger.engine.caller import install_record_factory
+from inspy_logger.helpers.formatting import CustomFormatter
+
+
+N_RECORDS = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+FILE_FORMAT = '%(asctime)s - [%(name)s] - %(levelname)s - %(message)s |-| %(file_name)s:%(lineno)d'
+
+
+def make_records():
+    factory = install_record_factory()
+
+    return [
+            factory('benchmarks.formatter', logging.INFO, __file__, 42, 'Processed item %d of %d', (index, N_RECORDS),
+                    None)
+            for index in range(N_RECORDS)
+            ]
+
+
+def run(formatter, records, repeat=3, shared_with=None):
+    """
+    Returns the best time of `repeat` passes of `formatter` over the records. With `shared_with`, each record is
+    first formatted by that formatter (untimed), as another handler would.
+    """
+    best = None
+
+    for _ in range(repeat):
+        elapsed = 0
+
+        for record in records:
+            if shared_with is not None:
+                shared_with.format(record)
+
+            start = perf_counter()
+            formatter.format(record)
+            elapsed += perf_counter() - start
+
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def report(label, seconds, baseline=None):
+    per_record = seconds / N_RECORDS * 1e9
+    relative = f'{baseline / seconds:>6.2f}x' if baseline else '  1.00x'
+    print(f'{label:<45} {per_record:>8.1f} ns/record  {N_RECORDS / seconds:>12,.0f} records/s  {relative}')
+
+
+def main():
+    records = make_records()
+
+    baseline = run(logging.Formatter(FILE_FORMAT), records)
+    report('logging.Formatter', baseline)
+
+    custom = CustomFormatter(FILE_FORMAT)
+
+    report('CustomFormatter', run(custom, records), baseline)
+    report(
+            'CustomFormatter (us precision)',
+            run(CustomFormatter(FILE_FORMAT, timestamp_precision='us'), records),
+            baseline
+            )
+    report(
+            'CustomFormatter (monotonic, us precision)',
+            run(CustomFormatter(FILE_FORMAT, timestamp_precision='us', monotonic_timestamps=True), records),
+            baseline
+            )
+
+    # A second, identical formatter (e.g. another handler on the same file) reuses the text of the first one.
+    report(
+            'CustomFormatter (shared output)',
+            run(CustomFormatter(FILE_FORMAT), records, shared_with=custom),
+            baseline
+            )
+
+
+if __name__ == '__main__':
+    main()
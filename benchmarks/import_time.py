@@ -0,0 +1,92 @@
+"""
+
+File:
+    benchmarks/import_time.py
+
+Author:
+    Inspyre Softworks
+
+Description:
+    Enforces an import-time budget for ``import inspy_logger``.
+
+    Runs ``python -X importtime -c "import inspy_logger"`` in fresh interpreters and takes the median cumulative
+    import time of the package. It also checks that the heavy optional dependencies (Rich, requests, the public suffix
+    list, packaging) are not loaded by a plain import, since Rich should only load on the first console emit.
+
+    Exits with status 1 if the budget is exceeded or a deferred dependency is loaded.
+
+    Run with:
+
+        $ python benchmarks/import_time.py [budget_ms] [n_runs]
+
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+
+BUDGET_MS = float(sys.argv[1]) if len(sys.argv) > 1 else 100.0
+
+N_RUNS = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+
+DEFERRED_MODULES = ('rich', 'requests', 'public_suffix_list', 'packaging', 'pypattyrn')
+"""Modules a plain `import inspy_logger` must not load."""
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(*args):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [PROJECT_ROOT, os.environ.get('PYTHONPATH')])))
+
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, env=env, check=True)
+
+
+def measure_import_us():
+    """Returns the cumulative import time of `inspy_logger`, in microseconds, from a fresh interpreter."""
+    stderr = run_python('-X', 'importtime', '-c', 'import inspy_logger').stderr
+
+    for line in stderr.splitlines():
+        _, cumulative, name = line.split('|')
+        if name.strip() == 'inspy_logger':
+            return int(cumulative)
+
+    raise RuntimeError('`inspy_logger` not found in the -X importtime output.')
+
+
+def find_loaded_deferred_modules():
+    """Returns the deferred modules that a plain `import inspy_logger` loaded."""
+    stdout = run_python(
+            '-c',
+            'import sys, inspy_logger; '
+            f'print(" ".join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))'
+            ).stdout
+
+    return stdout.split()
+
+
+def main():
+    samples = [measure_import_us() / 1000 for _ in range(N_RUNS)]
+    median = statistics.median(samples)
+
+    print(f'import inspy_logger: median {median:.1f} ms over {N_RUNS} runs '
+          f'(min {min(samples):.1f} ms, max {max(samples):.1f} ms); budget {BUDGET_MS:.1f} ms')
+
+    failed = False
+
+    if median > BUDGET_MS:
+        print(f'FAIL: over budget by {median - BUDGET_MS:.1f} ms')
+        failed = True
+
+    if loaded := find_loaded_deferred_modules():
+        print(f'FAIL: loaded deferred module(s): {", ".join(loaded)}')
+        failed = True
+
+    if not failed:
+        print('OK')
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
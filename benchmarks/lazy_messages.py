@@ -0,0 +1,142 @@
+"""
+
+File:
+    benchmarks/lazy_messages.py
+
+Author:
+    Inspyre Softworks
+
+Description:
+    Checks that deferred messages are never evaluated for a disabled level, through every level method, with and
+    without the disabled-level fast path, and that they render correctly once a handler emits them. Then times a
+    disabled `debug` call with an eager f-string against the deferred forms.
+
+    Exits with status 1 if a check fails.
+
+    Run with:
+
+        $ python benchmarks/lazy_messages.py [n_calls]
+
+"""
+import logging
+import sys
+from timeit import timeit
+
+from inspy_logger import Logger
+from inspy_logger.engine.messages import lazy
+
+
+N_CALLS = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+LEVEL_METHODS = ('internal', 'debug', 'info', 'warning', 'error')
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.NOTSET)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class Expensive:
+    """Counts how many times it's rendered."""
+
+    renders = 0
+
+    def __repr__(self):
+        Expensive.renders += 1
+        return '<Expensive>'
+
+    __str__ = __repr__
+
+
+def compute(value):
+    Expensive.renders += 1
+    return value
+
+
+def call_every_form(log, method_name):
+    method = getattr(log, method_name)
+
+    method('%s and %r', Expensive(), Expensive())
+    method('{} and {!r}', Expensive(), Expensive(), style='{')
+    method(lambda: f'{Expensive()}')
+    method('Computed: %s', lazy(compute, 42))
+
+
+def check_disabled(fast_path):
+    log = Logger(f'benchmarks.lazy_messages.disabled.{fast_path}', console_level='critical', no_file_logging=True,
+                 fast_path=fast_path)
+    log.logger.handlers[:] = [CollectingHandler()]
+
+    Expensive.renders = 0
+
+    for method_name in LEVEL_METHODS:
+        call_every_form(log, method_name)
+
+    return Expensive.renders
+
+
+def check_enabled():
+    log = Logger('benchmarks.lazy_messages.enabled', console_level='internal', no_file_logging=True)
+    handler = CollectingHandler()
+    log.logger.handlers[:] = [handler]
+
+    for method_name in LEVEL_METHODS:
+        call_every_form(log, method_name)
+
+    expected = ['<Expensive> and <Expensive>', '<Expensive> and <Expensive>', '<Expensive>', 'Computed: 42']
+
+    return handler.messages == expected * len(LEVEL_METHODS), handler.messages
+
+
+def report(label, seconds, baseline=None):
+    per_call = seconds / N_CALLS * 1e9
+    relative = f'{baseline / seconds:>6.2f}x' if baseline else '  1.00x'
+    print(f'{label:<45} {per_call:>8.1f} ns/call  {relative}')
+
+
+def main():
+    failed = False
+
+    for fast_path in (False, True):
+        if renders := check_disabled(fast_path):
+            print(f'FAIL: {renders} argument(s) evaluated at disabled levels (fast_path={fast_path})')
+            failed = True
+
+    ok, messages = check_enabled()
+
+    if not ok:
+        print(f'FAIL: unexpected messages at enabled levels: {messages}')
+        failed = True
+
+    log = Logger('benchmarks.lazy_messages.timing', console_level='info', no_file_logging=True)
+    namespace = {'log': log, 'value': Expensive(), 'lazy': lazy, 'repr': repr}
+
+    baseline = timeit("log.debug(f'Value: {value!r}')", globals=namespace, number=N_CALLS)
+    report('Disabled debug, eager f-string', baseline)
+    report(
+            'Disabled debug, %-args',
+            timeit("log.debug('Value: %r', value)", globals=namespace, number=N_CALLS),
+            baseline
+            )
+    report(
+            'Disabled debug, lambda',
+            timeit("log.debug(lambda: f'Value: {value!r}')", globals=namespace, number=N_CALLS),
+            baseline
+            )
+    report(
+            'Disabled debug, lazy()',
+            timeit("log.debug('Value: %s', lazy(repr, value))", globals=namespace, number=N_CALLS),
+            baseline
+            )
+
+    print('FAIL' if failed else 'OK')
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+
+File:
+    benchmarks/loggable_methods.py
+
+Author:
+    Inspyre Softworks
+
+Description:
+    Runs a `Loggable`-heavy class in a tight loop, where every method fetches its own method logger, both through a
+    `LoggableDescriptor` and through `Loggable.create_logger`. For comparison, the loop is also run with the legacy
+    ``inspect.stack()`` method-name lookup.
+
+    Run with:
+
+        $ python benchmarks/loggable_methods.py [n_calls]
+
+"""
+import inspect
+import sys
+from time import perf_counter
+
+from inspy_logger import Logger
+from inspy_logger.helpers.base_classes import Loggable, LoggableDescriptor
+
+
+N_CALLS = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+
+class LegacyLoggableDescriptor(LoggableDescriptor):
+    """The descriptor as it was before method names were resolved with `sys._getframe`."""
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return owner.class_logger
+
+        for frame_record in inspect.stack()[1:]:
+            if 'self' in frame_record.frame.f_locals and frame_record.frame.f_locals['self'] is instance:
+                return instance.log_device.get_child(frame_record.function, evictable=True)
+
+        raise Exception("Could not determine the calling method's name.")
+
+
+class Worker(Loggable):
+    log = LoggableDescriptor()
+
+    def step(self, value):
+        self.log.debug(f'Stepping with {value}')
+        return self.finish(value)
+
+    def finish(self, value):
+        log = self.create_logger()
+        log.debug(f'Finishing with {value}')
+        return value + 1
+
+
+class LegacyWorker(Worker):
+    log = LegacyLoggableDescriptor()
+
+    def create_logger(self, **kwargs):
+        kwargs.setdefault('name', inspect.stack()[1][3])
+        return self.create_child_logger(**kwargs)
+
+
+def run(worker):
+    start = perf_counter()
+
+    for value in range(N_CALLS):
+        worker.step(value)
+
+    return perf_counter() - start
+
+
+def report(label, seconds, baseline=None):
+    per_call = seconds / N_CALLS * 1e6
+    relative = f'{baseline / seconds:>7.1f}x' if baseline else '   1.0x'
+    print(f'{label:<40} {per_call:>9.2f} µs/iteration  {relative}')
+
+
+def main():
+    parent_log_device = Logger('benchmarks.loggable_methods', console_level='info', no_file_logging=True)
+
+    legacy = LegacyWorker(parent_log_device=parent_log_device)
+    current = Worker(parent_log_device=parent_log_device)
+
+    # Warm up, so both variants have created their child loggers.
+    legacy.step(0)
+    current.step(0)
+
+    baseline = run(legacy)
+    report('inspect.stack() lookup', baseline)
+    report('sys._getframe() lookup (cached logger)', run(current), baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+
+File:
+    benchmarks/rate_limits.py
+
+Author:
+    Inspyre Softworks
+
+Description:
+    Runs a hot loop that logs from a single call site, unlimited and then with per-call-site sampling and rate
+    limiting (passed with the call and attached with `rate_limited`). Records go to a handler that only counts them,
+    so the numbers reflect the cost of deciding, not of rendering.
+
+    Run with:
+
+        $ python benchmarks/rate_limits.py [n_calls]
+
+"""
+import logging
+import sys
+from time import perf_counter
+
+from inspy_logger import Logger
+from inspy_logger.engine.limits import rate_limited
+
+
+N_CALLS = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+
+class CountingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def emit(self, record):
+        self.count += 1
+
+
+def unlimited(log):
+    for value in range(N_CALLS):
+        log.info('Value: %s', value)
+
+
+def sampled(log):
+    for value in range(N_CALLS):
+        log.info('Value: %s', value, sample=0.01)
+
+
+def limited(log):
+    for value in range(N_CALLS):
+        log.info('Value: %s', value, rate_limit=100)
+
+
+@rate_limited(sample=0.01, deterministic=True)
+def decorated(log):
+    for value in range(N_CALLS):
+        log.info('Value: %s', value)
+
+
+def main():
+    log = Logger('benchmarks.rate_limits', console_level='info', no_file_logging=True)
+    handler = CountingHandler()
+    log.logger.handlers[:] = [handler]
+
+    baseline = None
+
+    for label, loop in (
+            ('Unlimited', unlimited),
+            ('sample=0.01', sampled),
+            ('rate_limit=100', limited),
+            ('@rate_limited(sample=0.01)', decorated),
+            ):
+        handler.count = 0
+
+        start = perf_counter()
+        loop(log)
+        seconds = perf_counter() - start
+
+        baseline = baseline or seconds
+        print(f'{label:<30} {seconds / N_CALLS * 1e9:>8.1f} ns/call  {baseline / seconds:>6.2f}x  '
+              f'{handler.count:>8} record(s) emitted')
+
+    print(f'Suppressed records reported: {log.report_suppressed()}')
+
+
+if __name__ == '__main__':
+    main()
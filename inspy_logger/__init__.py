@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
+import bisect
 import contextlib
 import sys
-import inspect
 import os
 import logging
-from pypattyrn.behavioral.null import Null
 from inspy_logger.common import PROG_NAME as ISL_PROG_NAME, DEFAULT_LOGGING_LEVEL, DEFAULT_LOG_FILE_PATH, LEVELS
-from inspy_logger.helpers import find_variable_in_call_stack, check_preemptive_level_set, find_argument_parser, determine_start_block, determine_level
+from inspy_logger.helpers import find_variable_in_call_stack, check_preemptive_level_set, find_argument_parser, determine_start_block, determine_level, discover_config_vars
 
 from inspy_logger.helpers import (
     translate_to_logging_level,
@@ -16,19 +15,13 @@ from inspy_logger.helpers import (
     determine_log_file_path
 )
 
-# Existing log record factory
-old_factory = logging.getLogRecordFactory()
+from inspy_logger.engine.caller import install_record_factory, register_internal_file
 
+# Set the `file_name` attribute on every log record from the caller already resolved for it.
+record_factory = install_record_factory()
 
-def record_factory(*args, **kwargs):
-    record = old_factory(*args, **kwargs)
-    # Set the file_name attribute to the name of the file where the log is called
-    frame = inspect.stack()[1]
-    record.file_name = frame.filename
-    return record
-
-
-logging.setLogRecordFactory(record_factory)
+# The deprecated `getLogger` shim warns on its caller's behalf.
+register_internal_file(__file__)
 
 
 from inspy_logger.engine import Logger
@@ -56,9 +49,9 @@ MODULE_OBJ = sys.modules[__name__]
 
 CLIENT_PROG_NAME = determine_client_prog_name()
 
-INIT_LOG_LEVEL = determine_level(CLIENT_PROG_NAME)
+INIT_LOG_LEVEL = determine_level(CLIENT_PROG_NAME, discover_config_vars())
 
-INTERACTIVE_SESSION = find_variable_in_call_stack('INSPY_INTERACTIVE_SESSION', default=False)
+INTERACTIVE_SESSION = discover_config_vars().get('INSPY_INTERACTIVE_SESSION', default=False)
 
 
 def start_logger(override_block=True):
@@ -96,6 +89,8 @@ def start_logger(override_block=True):
 
         LOG_DEVICE.replay_and_setup_handlers()
     elif CLIENT_PROG_NAME:
+        from pypattyrn.behavioral.null import Null
+
         prog_logger = Null()
 
     with contextlib.suppress(NameError):
@@ -103,7 +98,7 @@ def start_logger(override_block=True):
 
         PROG_LOGGER = prog_logger
 
-        if isinstance(PROG_LOGGER, Null):
+        if not isinstance(PROG_LOGGER, Logger):
             from rich import print
             print("The logger has been blocked from starting. To start the logger, run `start_logger()`.")
 
@@ -111,16 +106,22 @@ def start_logger(override_block=True):
 InspyLogger = Logger
 
 
-def _get_loggable():
-    from inspy_logger.helpers.base_classes import Loggable
-    import bisect
-    # Add the `Loggable` class to `__all__` in alphabetical order.
-    bisect.insort(__all__, 'Loggable')
+def __getattr__(name):
+    """
+    Imports `Loggable` (and the machinery behind it) on first access rather than with the package.
+    """
+    if name == 'Loggable':
+        from inspy_logger.helpers.base_classes import Loggable
+
+        globals()['Loggable'] = Loggable
+
+        return Loggable
 
-    return Loggable
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
-Loggable = _get_loggable()
+# Add the `Loggable` class to `__all__` in alphabetical order.
+bisect.insort(__all__, 'Loggable')
 
 
 start_logger(override_block=False)
@@ -18,15 +18,9 @@ Description:
 
 
 import logging
-from rich.logging import RichHandler
 
 DEFAULT_LOGGING_LEVEL = logging.DEBUG
 
-HANDLER_TYPES = {
-        'console': RichHandler,
-        'file': logging.FileHandler
-        }
-
 LEVEL_MAP = {
     'internal': 5,
     'debug': logging.DEBUG,
@@ -46,3 +40,22 @@ INTERNAL = LEVEL_MAP['debug'] - 5
 
 INTERACTIVE_SESSION = __name__ != '__main__'
 """A flag to indicate whether the session is interactive."""
+
+
+def __getattr__(name):
+    """
+    Resolves the constants that are built lazily, so importing this module doesn't import the handlers (or Rich).
+
+    `HANDLER_TYPES` maps handler type names to the handler classes attached by `Logger`.
+    """
+    if name == 'HANDLER_TYPES':
+        from inspy_logger.engine.handlers import ConsoleHandler
+
+        handler_types = globals()['HANDLER_TYPES'] = {
+                'console': ConsoleHandler,
+                'file': logging.FileHandler
+                }
+
+        return handler_types
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
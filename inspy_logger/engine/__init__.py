@@ -2,14 +2,24 @@ import inspect
 import os
 import logging
 import sys
+import weakref
 
 from time import time
 
-from rich.logging import RichHandler
-
 from inspy_logger.config import DEFAULT_LOG_FILE_PATH
-from inspy_logger.constants import LEVELS, INTERACTIVE_SESSION, INTERNAL, HANDLER_TYPES
-from inspy_logger.engine.handlers import BufferingHandler
+from inspy_logger.constants import LEVELS, LEVEL_MAP, INTERACTIVE_SESSION, INTERNAL, HANDLER_TYPES
+from inspy_logger.engine.caller import UNKNOWN_CALLER, describe_caller, find_caller, find_caller_frame, \
+    register_internal_file
+from inspy_logger.engine.cache import ChildCache, OnceCache
+from inspy_logger.engine import context as _context
+from inspy_logger.engine.index import NameTrie
+from inspy_logger.engine.limits import SiteLimiter, get_code_policy, get_policy, has_code_policies
+from inspy_logger.engine.messages import MESSAGE_STYLES, wrap_message
+from inspy_logger.engine.handlers import BufferingHandler, BufferedFileHandler, CoalescingHandler, ConsoleHandler, \
+    DeferredSetupHandler, QueueingHandler, SharedFileHandler
+from inspy_logger.engine.pipeline import AsyncPipeline, get_default_pipeline
+from inspy_logger.engine.tracebacks import TRACEBACK_TIERS, ExceptionTable, TracebackTiers, format_repeat
+from inspy_logger.engine.writers import ensure_file
 from inspy_logger.models.announcement import Announcement
 from inspy_logger.common import InspyLogger, DEFAULT_LOGGING_LEVEL
 from inspy_logger.helpers import (
@@ -23,6 +33,120 @@ from pathlib import Path
 from warnings import warn
 
 
+# Frames from the engine, from the decorators wrapping its level methods, and from announcements (which log on their
+# owner's behalf) are never reported as the caller.
+register_internal_file(__file__)
+register_internal_file(sys.modules[count_invocations.__module__].__file__)
+register_internal_file(sys.modules[Announcement.__module__].__file__)
+
+
+def _forget_logger(name):
+    """
+    Removes the name of a garbage-collected `Logger` from the name trie (its registry entry is dropped automatically).
+    """
+    if Logger.get_instance(name) is None:
+        Logger.names.discard(name)
+
+
+def _remove_logging_logger(name):
+    """
+    Removes the `logging.Logger` with the given name from the logging manager, so it can be garbage-collected.
+
+    Loggers below it are re-attached to a placeholder, as if it had never been created, and the placeholders above it
+    forget it; `logging.getLogger(name)` creates a fresh logger afterwards.
+    """
+    manager = logging.Logger.manager
+
+    with logging._lock:
+        logger = manager.loggerDict.get(name)
+
+        if not isinstance(logger, logging.Logger):
+            return
+
+        children = [
+                other for other in manager.loggerDict.values()
+                if isinstance(other, logging.Logger) and other.parent is logger
+                ]
+
+        if children:
+            placeholder = logging.PlaceHolder(children[0])
+
+            for child in children:
+                placeholder.append(child)
+                child.parent = logger.parent
+
+            manager.loggerDict[name] = placeholder
+        else:
+            del manager.loggerDict[name]
+
+        index = name.rfind('.')
+
+        while index > 0:
+            ancestor = manager.loggerDict.get(name[:index])
+
+            if isinstance(ancestor, logging.PlaceHolder):
+                ancestor.loggerMap.pop(logger, None)
+
+                if not ancestor.loggerMap:
+                    del manager.loggerDict[name[:index]]
+
+            index = name.rfind('.', 0, index)
+
+        manager._clear_cache()
+
+
+def _release_dynamic_logger(name):
+    """
+    Closes the handlers of a garbage-collected dynamic `Logger` and removes its `logging.Logger` from the logging
+    manager, unless a new `Logger` has taken its name since.
+    """
+    if Logger.get_instance(name) is not None:
+        return
+
+    logger = logging.Logger.manager.loggerDict.get(name)
+
+    if isinstance(logger, logging.Logger):
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+
+    _remove_logging_logger(name)
+
+
+def _weak_start_hook(instance):
+    """
+    Builds the `start` hook placed on the underlying `logging.Logger`, without keeping `instance` alive.
+    """
+    start = weakref.WeakMethod(instance.start)
+
+    def start_hook():
+        if (method := start()) is not None:
+            return method()
+
+    return start_hook
+
+
+def _weak_set_up_hook(instance):
+    """
+    Builds the callback a `DeferredSetupHandler` uses to set up the handlers of `instance`, without keeping it alive.
+    """
+    set_up = weakref.WeakMethod(instance.set_up_handlers)
+
+    def set_up_hook():
+        if (method := set_up()) is not None:
+            method()
+
+    return set_up_hook
+
+
+def _disabled_level_method(*args, **kwargs):
+    """
+    Stands in for a level method (e.g. `Logger.debug`) whose level is disabled while the fast path is on.
+
+    It is stored on the instance as a plain function, so calling it costs no more than a bare function call.
+    """
+
+
 @add_aliases
 class Logger(InspyLogger):
     """
@@ -32,7 +156,28 @@ class Logger(InspyLogger):
     LEVELS = LEVELS
     INTERACTIVE_SESSION = INTERACTIVE_SESSION
 
-    instances = {}  # A dictionary to hold instances of the Logger class.
+    LEVEL_METHODS = ('internal', 'debug', 'info', 'warning', 'error')
+    """The level methods that are swapped for a no-op while their level is disabled and the fast path is on."""
+
+    instances = {}
+    """
+    The registry of `Logger` instances, keyed by name.
+
+    Root and named loggers are held here until they're closed, so `Logger(name)` always returns the same, configured
+    instance. Dynamic children are registered in `dynamic_instances` instead.
+    """
+
+    dynamic_instances = weakref.WeakValueDictionary()
+    """
+    The registry of dynamically created child loggers (see `get_child(evictable=True)`) and their descendants, keyed
+    by name.
+
+    Entries are weak: their parent holds them while they're in its `child_cache`, and a dynamic logger that nothing
+    references anymore is dropped automatically.
+    """
+
+    names = NameTrie()
+    """A trie over the names of every `Logger` instance, used for prefix searches."""
 
     def __new__(cls, name, *args, **kwargs):
         """
@@ -47,11 +192,64 @@ class Logger(InspyLogger):
                 An instance of the Logger class.
         """
 
-        if name not in cls.instances:
+        if (instance := cls.get_instance(name)) is None:
             instance = super(Logger, cls).__new__(cls)
             cls.instances[name] = instance
-            return instance
-        return cls.instances[name]
+            cls.names.add(name)
+            weakref.finalize(instance, _forget_logger, name)
+
+        return instance
+
+    @classmethod
+    def get_instance(cls, name: str) -> Optional['Logger']:
+        """
+        Gets the live logger with the given name, from either registry.
+
+        Parameters:
+            name (str):
+                The name of the logger.
+
+        Returns:
+            Optional[Logger]:
+                The logger, or None if no live logger has that name.
+
+        Since:
+            v3.3.0
+        """
+        if (instance := cls.instances.get(name)) is None:
+            instance = cls.dynamic_instances.get(name)
+
+        return instance
+
+    @classmethod
+    def get_instances(cls) -> dict:
+        """
+        Gets a snapshot of every live logger, from both registries, keyed by name.
+
+        Returns:
+            dict:
+                The loggers.
+
+        Since:
+            v3.3.0
+        """
+        return {**dict(cls.dynamic_instances.items()), **cls.instances}
+
+    def __make_dynamic(self) -> None:
+        """
+        Moves this logger (a dynamic child, or the descendant of one) to the weak `dynamic_instances` registry, so it
+        doesn't outlive its last reference; its handlers and its `logging.Logger` are released once it's collected.
+        """
+        if self.__dynamic:
+            return
+
+        self.__dynamic = True
+        weakref.finalize(self, _release_dynamic_logger, self.name)
+
+        if Logger.instances.get(self.name) is self:
+            del Logger.instances[self.name]
+
+        Logger.dynamic_instances[self.name] = self
 
     def __init__(
             self,
@@ -66,7 +264,23 @@ class Logger(InspyLogger):
             init_announcement: Optional[Announcement] = None,
             init_announcement_template: str = None,
             announce_on_init: bool = True,
-            announcement_level: Union[int, str] = 'debug'
+            announcement_level: Union[int, str] = 'debug',
+            capture_caller: bool = True,
+            fast_path: bool = False,
+            async_emit: Union[bool, AsyncPipeline] = False,
+            buffered_file: Union[bool, dict] = False,
+            max_dynamic_children: Optional[int] = 256,
+            dynamic_child_ttl: Optional[float] = None,
+            lazy_handlers: bool = False,
+            suppression_report_interval: float = 60.0,
+            coalesce: Union[bool, float] = False,
+            warn_once_max_size: Optional[int] = 1024,
+            warn_once_ttl: Optional[float] = None,
+            message_style: str = '%',
+            console_mode: str = 'auto',
+            threaded_console: bool = False,
+            repeated_tracebacks: str = 'compact',
+            exception_window: Optional[float] = 60.0
             ):
         """
         Initializes a logger instance.
@@ -108,12 +322,104 @@ class Logger(InspyLogger):
                         - {time_started}: The time the logger was started.
                         - {parent}: The name of the parent logger.
 
+            capture_caller (bool, optional):
+                Whether to resolve the file, line and function that made each logging call. Disabling this skips the
+                frame walk entirely; records then carry '(unknown file)' as their location. Defaults to True.
+
+            fast_path (bool, optional):
+                Whether calls to disabled levels should short-circuit before any bookkeeping (invocation counting,
+                argument packing, level checks). See :meth:`refresh_level_methods`. Defaults to False.
+
+            async_emit (Union[bool, AsyncPipeline], optional):
+                Whether to emit records through an asynchronous pipeline, so the calling thread only enqueues them
+                and background workers do the rendering, formatting and writing. Pass True to use the process-wide
+                default pipeline, or an `AsyncPipeline` instance to use that one. Defaults to False.
+
+            buffered_file (Union[bool, dict], optional):
+                Whether to write the log file through a `BufferedFileHandler`, which batches lines into a single
+                write instead of flushing after every record. Pass True for the default flush policy, or a dictionary
+                of `BufferedFileHandler` options (`buffer_size`, `flush_interval`, `flush_level`). Defaults to False.
+
+            max_dynamic_children (int, optional):
+                The maximum number of dynamically created children (see `get_child(evictable=True)`) held by this
+                logger before the least recently used one is evicted. None means unbounded. Defaults to 256.
+
+            dynamic_child_ttl (float, optional):
+                The number of seconds a dynamically created child may go unused before it's evicted. None means
+                they never expire. Defaults to None.
+
+            lazy_handlers (bool, optional):
+                Whether to defer building the console and file handlers (and creating the log file) until the first
+                enabled record reaches the logger. Defaults to False.
+
+            suppression_report_interval (float, optional):
+                The minimum number of seconds between two summaries of the records suppressed at the same call site
+                by a `sample` or `rate_limit` (see :meth:`_log` and :func:`~inspy_logger.engine.limits.rate_limited`).
+                Defaults to 60.
+
+            coalesce (Union[bool, float], optional):
+                Whether to collapse runs of identical consecutive records (same logger, level, template and arguments)
+                into one record and a "repeated N times" summary before they reach the console and file handlers.
+                Pass True for a one-second window, or the window in seconds. See `CoalescingHandler`. Defaults to
+                False.
+
+            warn_once_max_size (int, optional):
+                The maximum number of one-time warnings remembered by :meth:`warn_once`; past it, the least recently
+                repeated one is forgotten. None means unbounded. Defaults to 1024.
+
+            warn_once_ttl (float, optional):
+                The number of seconds after which a one-time warning may be issued again. None means never. Defaults
+                to None.
+
+            message_style (str, optional):
+                How messages are merged with the positional arguments of a logging call: '%' for %-style templates
+                (as with :mod:`logging`) or '{' for `str.format`-style templates. Either way, the message is only
+                rendered when a handler emits the record. Defaults to '%'.
+
+            console_mode (str, optional):
+                The console rendering engine; one of `ConsoleHandler.MODES`. 'rich' renders with Rich, 'plain'
+                writes pre-formatted plain lines (much cheaper when a log collector reads the output), and 'auto'
+                picks plain when the console isn't a terminal. Defaults to 'auto'.
+
+            threaded_console (bool, optional):
+                Whether the console handler hands its records to the process-wide console render thread, which
+                renders everything queued in a frame in one pass, instead of rendering them on the logging thread.
+                Logging threads then never block on terminal writes. Defaults to False.
+
+            repeated_tracebacks (str, optional):
+                How the console handler renders a traceback it has already rendered (same exception type, raised
+                along the same code path); one of `TRACEBACK_TIERS`. Tracebacks are rendered in full, with locals,
+                the first time only; 'compact' then shows a few frames without locals, and 'line' just the
+                exception. 'full' renders every traceback in full. A traceback passed on in full again once its
+                `exception_window` has expired is rendered in full too. Defaults to 'compact'.
+
+            exception_window (float, optional):
+                Logged exceptions are fingerprinted (by type and the code locations along the traceback) and counted
+                in the logger's `exceptions` table; the handlers only get the full traceback of a fingerprint once
+                every `exception_window` seconds, and a one-line summary for the repeats in between. 0 passes every
+                traceback on; None only the first one of each fingerprint. Defaults to 60 seconds.
+
+        Raises:
+            ValueError:
+                If `message_style` is not one of `MESSAGE_STYLES`, `console_mode` is not one of
+                `ConsoleHandler.MODES`, or `repeated_tracebacks` is not one of `TRACEBACK_TIERS`.
 
         """
         # Check if the logger has already been initialized.
         if hasattr(self, 'logger'):
             return
 
+        if message_style not in MESSAGE_STYLES:
+            raise ValueError(f'Invalid message style: {message_style}. Please provide one of {MESSAGE_STYLES}.')
+
+        if console_mode not in ConsoleHandler.MODES:
+            raise ValueError(f'Invalid console mode: {console_mode}. Please provide one of {ConsoleHandler.MODES}.')
+
+        if repeated_tracebacks not in TRACEBACK_TIERS:
+            raise ValueError(
+                    f'Invalid traceback tier: {repeated_tracebacks}. Please provide one of {TRACEBACK_TIERS}.'
+                    )
+
         self.__time_started = time()
 
         self.__announcement_made = False
@@ -123,21 +429,53 @@ class Logger(InspyLogger):
         self.__file_level = translate_to_logging_level(file_level)
 
         self.__children = []
+        self.__child_index = {}
+        self.__dynamic = False
+        self.__child_cache = ChildCache(max_dynamic_children, dynamic_child_ttl)
 
         self.__name = name
         self.__no_file_logging = None
         self.__file_path = None
-        self.__warnings_issued = set()
+        self.__warnings_issued = OnceCache(warn_once_max_size, warn_once_ttl)
+        self.__capture_caller = capture_caller
+        self.__handler_capture = {}
+        self.__fast_path = fast_path
+        self.__pipeline = get_default_pipeline() if async_emit is True else (async_emit or None)
+        self.__buffered_file = buffered_file
+        self.__lazy_handlers = lazy_handlers
+        self.__site_limiter = SiteLimiter(suppression_report_interval)
+        self.__coalesce = coalesce
+        self.__message_style = message_style
+        self.__console_mode = console_mode
+        self.__threaded_console = threaded_console
+        self.__repeated_tracebacks = repeated_tracebacks
+        self.__exceptions = ExceptionTable(exception_window)
+
+        # A logger that doesn't exist yet has no descendants with cached levels, so its level can be set without
+        # `setLevel`, which clears the level cache of every logger in the process.
+        is_new_logger = name not in logging.Logger.manager.loggerDict
 
         self.logger = logging.getLogger(name)
 
-        self.logger.setLevel(translate_to_logging_level(console_level))
+        if is_new_logger:
+            self.logger.level = translate_to_logging_level(console_level)
+        else:
+            self.logger.setLevel(translate_to_logging_level(console_level))
+
+        self.refresh_level_methods()
 
         self.logger.propagate = False
 
         self.parent = parent
 
-        self.logger.start = self.start
+        # A previous instance with this name, since garbage-collected, may have left its handlers behind.
+        handlers_ready = getattr(self.logger, 'inspy_handlers_ready', False)
+
+        for handler in list(self.logger.handlers):
+            if isinstance(handler, DeferredSetupHandler):
+                self.logger.removeHandler(handler)
+
+        self.logger.start = _weak_start_hook(self)
 
         if 'inSPy-Logger' in self.logger.name:
             self.buffering_handler = BufferingHandler()
@@ -150,8 +488,16 @@ class Logger(InspyLogger):
 
         self._file_path = Path(file_path).expanduser().absolute().joinpath(file_name)
 
-        if not getattr(self, 'buffering_handler', None):
-            self.set_up_handlers()
+        if handlers_ready:
+            self.__apply_level_change('file')
+            self.__apply_level_change('console')
+        elif not getattr(self, 'buffering_handler', None):
+            if lazy_handlers:
+                self.logger.addHandler(
+                        DeferredSetupHandler(self.logger, _weak_set_up_hook(self), self.__lowest_handler_level())
+                        )
+            else:
+                self.set_up_handlers()
 
         self.__announcement = None
 
@@ -196,6 +542,20 @@ class Logger(InspyLogger):
     def announcement_made(self) -> bool:
         return self.announcement.announced
 
+    @property
+    def buffered_file(self) -> Union[bool, dict]:
+        """
+        The buffered-file setting the logger was created with (see `BufferedFileHandler`).
+
+        Since:
+            v3.3.0
+
+        Returns:
+            Union[bool, dict]:
+                False for a plain `logging.FileHandler`, True for the default flush policy, or the handler options.
+        """
+        return self.__buffered_file
+
     @property
     def call_counts(self) -> dict:
         """
@@ -208,6 +568,39 @@ class Logger(InspyLogger):
         """
         return self.__call_counts
 
+    @property
+    def capture_caller(self) -> bool:
+        """
+        Whether the logger resolves the location of each logging call.
+
+        Since:
+            v3.3.0
+
+        Returns:
+            bool:
+                True if caller capture is enabled for this logger, else False.
+        """
+        return self.__capture_caller
+
+    @capture_caller.setter
+    @validate_type(bool)
+    def capture_caller(self, new):
+        self.__capture_caller = new
+
+    @property
+    def child_cache(self) -> ChildCache:
+        """
+        The cache policy tracking this logger's dynamically created children.
+
+        Since:
+            v3.3.0
+
+        Returns:
+            ChildCache:
+                The child cache, including its hit, miss and eviction counters.
+        """
+        return self.__child_cache
+
     @property
     def child_names(self):
         return self.get_child_names()
@@ -219,6 +612,18 @@ class Logger(InspyLogger):
     @children.deleter
     def children(self):
         self.__children = []
+        self.__child_index = {}
+        self.__child_cache.clear()
+
+    @property
+    def coalesce(self) -> Union[bool, float]:
+        """
+        Whether (and with which window, in seconds) identical consecutive records are coalesced.
+
+        Since:
+            v3.3.0
+        """
+        return self.__coalesce
 
     @property
     def console_level(self) -> int:
@@ -260,6 +665,46 @@ class Logger(InspyLogger):
         self.internal('Test message')
         return get_level_name(self.console_level)
 
+    @property
+    def console_mode(self) -> str:
+        """
+        The console rendering engine requested for the logger: 'auto', 'rich' or 'plain'.
+
+        Since:
+            v3.3.0
+        """
+        return self.__console_mode
+
+    @property
+    def exceptions(self) -> ExceptionTable:
+        """
+        The table of the exceptions logged so far, aggregated by fingerprint.
+
+        Since:
+            v3.3.0
+        """
+        return self.__exceptions
+
+    @property
+    def repeated_tracebacks(self) -> str:
+        """
+        How the console handler renders repeated tracebacks: 'full', 'compact' or 'line'.
+
+        Since:
+            v3.3.0
+        """
+        return self.__repeated_tracebacks
+
+    @property
+    def threaded_console(self) -> bool:
+        """
+        Whether the console handler renders its records on the console render thread.
+
+        Since:
+            v3.3.0
+        """
+        return self.__threaded_console
+
     @property
     def device(self):
         """
@@ -273,6 +718,26 @@ class Logger(InspyLogger):
         logger.start = self.start.__get__(logger)
         return logger
 
+    @property
+    def fast_path(self) -> bool:
+        """
+        Whether calls to disabled levels short-circuit to a no-op.
+
+        Since:
+            v3.3.0
+
+        Returns:
+            bool:
+                True if the disabled-level fast path is on, else False.
+        """
+        return self.__fast_path
+
+    @fast_path.setter
+    @validate_type(bool)
+    def fast_path(self, new):
+        self.__fast_path = new
+        self.refresh_level_methods()
+
     @property
     def file_level(self) -> int:
         """
@@ -335,6 +800,26 @@ class Logger(InspyLogger):
     def isEnabledFor(self, level):
         return self.logger.isEnabledFor(level)
 
+    @property
+    def lazy_handlers(self) -> bool:
+        """
+        Whether the logger defers building its handlers until the first enabled record reaches it.
+
+        Since:
+            v3.3.0
+        """
+        return self.__lazy_handlers
+
+    @property
+    def message_style(self) -> str:
+        """
+        The default template style of the logger's messages; one of `MESSAGE_STYLES`.
+
+        Since:
+            v3.3.0
+        """
+        return self.__message_style
+
     @property
     def name(self) -> str:
         """
@@ -355,6 +840,30 @@ class Logger(InspyLogger):
     def no_file_logging(self, new):
         self.__no_file_logging = new
 
+    @property
+    def pipeline(self) -> Optional[AsyncPipeline]:
+        """
+        The asynchronous pipeline the logger emits through, if any.
+
+        Since:
+            v3.3.0
+
+        Returns:
+            Optional[AsyncPipeline]:
+                The pipeline, or None if records are emitted on the calling thread.
+        """
+        return self.__pipeline
+
+    @property
+    def site_limiter(self) -> SiteLimiter:
+        """
+        The per-call-site rate limiter and sampler applied to this logger's records.
+
+        Since:
+            v3.3.0
+        """
+        return self.__site_limiter
+
     @property
     def time_started(self) -> float:
         """
@@ -363,16 +872,16 @@ class Logger(InspyLogger):
         return self.__time_started
 
     @property
-    def warnings_issued(self) -> set:
+    def warnings_issued(self) -> OnceCache:
         """
         Returns the one-time warnings issued by the logger.
 
         Since:
-            v3.2.0
+            v3.2.0 (a bounded `OnceCache` of warning keys since v3.3.0)
 
         Returns:
-            set:
-                A set containing the one-time warnings issued by the logger.
+            OnceCache:
+                The keys of the one-time warnings issued by the logger; supports `in`, `len()` and iteration.
         """
         return self.__warnings_issued
 
@@ -400,21 +909,32 @@ class Logger(InspyLogger):
 
         level = getattr(self, f'{handler_type}_level')
 
-        for handler in self.logger.handlers:
+        for handler in self.iter_handlers():
             if isinstance(handler, HANDLER_TYPES[handler_type]):
                 handler.setLevel(level)
+            elif isinstance(handler, DeferredSetupHandler):
+                handler.setLevel(self.__lowest_handler_level())
 
         self.logger.setLevel(translate_to_logging_level(level))
 
+        self.refresh_level_methods()
+
         for child in self.children:
             child.set_level(**{f'{handler_type}_level': level})
 
-    def __build_name_from_caller(self, caller: inspect.FrameInfo, name: str = None):
+    def __lowest_handler_level(self) -> int:
+        """
+        The lowest level accepted by any of the logger's handlers, used by a `DeferredSetupHandler` to wait for the
+        first enabled record.
+        """
+        return min(self.__console_level, self.__file_level)
+
+    def __build_name_from_caller(self, caller, name: str = None):
         """
         Builds a name for a child logger from the caller's frame.
 
         Parameters:
-            caller (inspect.FrameInfo):
+            caller (frame):
                 The frame of the caller.
 
         Returns:
@@ -423,20 +943,86 @@ class Logger(InspyLogger):
 
         """
         if name is None:
-            name = caller.function
+            name = caller.f_code.co_name
 
-        caller_self = caller.frame.f_locals.get("self", None)
+        caller_self = caller.f_locals.get("self", None)
         separator = ":" if caller_self and hasattr(caller_self, name) else "."
         return f"{self.logger.name}{separator}{name}"
 
+    def __add_child(self, child: InspyLogger) -> None:
+        """
+        Adds a child logger to the children list and to the name index.
+
+        Parameters:
+            child (InspyLogger):
+                The child logger to add.
+
+        Returns:
+            None
+        """
+        self.__children.append(child)
+        self.__child_index[child.name] = child
+
+    def __evict_child(self, child: InspyLogger) -> None:
+        """
+        Evicts a dynamically created child: detaches it from this logger.
+
+        The child isn't closed, as it may still be used elsewhere (e.g. by the instance that created it); it keeps
+        working until nothing references it anymore, and is then released (see `dynamic_instances`). Looking it up
+        again in the meantime re-attaches it.
+
+        Parameters:
+            child (InspyLogger):
+                The child logger to evict.
+
+        Returns:
+            None
+        """
+        self.internal(f'Evicting child logger: {child.name}')
+        self.__detach_child(child)
+
+    def __detach_child(self, child: InspyLogger) -> None:
+        """
+        Removes a child from this logger's children, index and eviction cache, if it's there.
+
+        Parameters:
+            child (InspyLogger):
+                The child logger to detach.
+
+        Returns:
+            None
+        """
+        if self.__child_index.get(child.name) is not child:
+            return
+
+        self.__children.remove(child)
+        del self.__child_index[child.name]
+        self.__child_cache.discard(child.name)
+
+    def _wants_caller(self) -> bool:
+        """
+        Checks whether the location of a logging call needs to be resolved.
+
+        The caller is resolved only if this logger has caller capture enabled and at least one of its handlers has
+        not opted out (see :meth:`set_caller_capture`).
+
+        Returns:
+            bool:
+                True if the caller should be resolved, else False.
+        """
+        return self.__capture_caller and any(
+                getattr(handler, 'capture_caller', True) for handler in self.logger.handlers
+                )
+
     def ensure_log_file_path(self):
         """
         Ensures that the log file path exists.
-        """
-        if not self.no_file_logging and not self.file_path.exists():
-            self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            self.file_path.touch()
+        Files already ensured by this process are remembered per directory, so this only touches the filesystem once
+        per log file.
+        """
+        if not self.no_file_logging:
+            ensure_file(self.file_path)
 
     def get_file_handler(self):
         """
@@ -446,10 +1032,88 @@ class Logger(InspyLogger):
             logging.FileHandler:
                 The file handler for the logger.
         """
-        for handler in self.logger.handlers:
+        for handler in self.iter_handlers():
             if isinstance(handler, logging.FileHandler):
                 return handler
 
+    def close(self) -> None:
+        """
+        Closes the logger: closes its children and its handlers, detaches it from its parent, and removes it from the
+        registry and its `logging.Logger` from the logging manager.
+
+        A logger with the same name can be created again afterwards; it will set up fresh handlers.
+
+        Returns:
+            None
+
+        Since:
+            v3.3.0
+        """
+        for child in list(self.__children):
+            child.close()
+
+        del self.children
+
+        self.report_suppressed()
+
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()
+
+        self.logger.inspy_handlers_ready = False
+
+        if self.parent is not None:
+            self.parent.__detach_child(self)
+
+        if Logger.get_instance(self.name) is self:
+            Logger.instances.pop(self.name, None)
+            Logger.dynamic_instances.pop(self.name, None)
+            Logger.names.discard(self.name)
+            _remove_logging_logger(self.name)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flushes the logger's handlers, first waiting for its asynchronous pipeline (if any) to drain.
+
+        Parameters:
+            timeout (float, optional):
+                The maximum number of seconds to wait for the pipeline. Waits indefinitely if None. Defaults to None.
+
+        Returns:
+            bool:
+                True if everything was flushed, False if the pipeline didn't drain before the timeout.
+
+        Since:
+            v3.3.0
+        """
+        drained = self.pipeline.flush(timeout) if self.pipeline else True
+
+        for handler in self.iter_handlers():
+            handler.flush()
+
+        return drained
+
+    def iter_handlers(self):
+        """
+        Iterates over the logger's handlers, including those behind a `QueueingHandler` or a `CoalescingHandler`.
+
+        Yields:
+            logging.Handler:
+                The next handler.
+
+        Since:
+            v3.3.0
+        """
+        pending = list(reversed(self.logger.handlers))
+
+        while pending:
+            handler = pending.pop()
+
+            if isinstance(handler, (QueueingHandler, CoalescingHandler)):
+                pending.extend(reversed(handler.targets))
+            else:
+                yield handler
+
     def has_child(self, name):
         """
         Checks if the logger has a child with the specified name.
@@ -463,7 +1127,31 @@ class Logger(InspyLogger):
                 True if the logger has a child with the specified name, else False.
         """
 
-        return name in self.child_names
+        return name in self.__child_index
+
+    def refresh_level_methods(self) -> None:
+        """
+        Rebinds the level methods according to the logger's current level.
+
+        While the fast path is on, each level method whose level is disabled is replaced on the instance by a no-op,
+        so a call like `log.debug(...)` returns before any bookkeeping. Enabled levels (and every level while the fast
+        path is off) use the regular methods.
+
+        Note:
+            This runs whenever the levels are changed through the `Logger` API. If the level of the underlying
+            `logging.Logger` is changed directly (or `logging.disable()` is called), call this method afterwards.
+
+        Returns:
+            None
+
+        Since:
+            v3.3.0
+        """
+        for method_name in self.LEVEL_METHODS:
+            if self.__fast_path and not self.logger.isEnabledFor(LEVEL_MAP[method_name]):
+                setattr(self, method_name, _disabled_level_method)
+            else:
+                self.__dict__.pop(method_name, None)
 
     @validate_type(str, Path, preferred_type=Path)
     def set_file_path(self, file_path):
@@ -484,35 +1172,178 @@ class Logger(InspyLogger):
             self.file_path = old
             raise
 
+    def set_caller_capture(self, enabled: bool, handler_type: str = None) -> None:
+        """
+        Enables or disables caller capture for the logger, or only for its handlers of a given type.
+
+        Parameters:
+            enabled (bool):
+                Whether caller capture should be enabled.
+
+            handler_type (str, optional):
+                One of the keys of `HANDLER_TYPES` (e.g. 'console' or 'file'). If provided, only handlers of that type
+                are switched; the caller is still resolved as long as any other handler wants it. The setting also
+                applies to handlers of that type built later on (e.g. with `lazy_handlers`). If omitted, the switch
+                applies to the whole logger. Defaults to None.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError:
+                If the handler type is invalid.
+
+        Since:
+            v3.3.0
+        """
+        if handler_type is None:
+            self.capture_caller = enabled
+            return
+
+        handler_type = handler_type.lower()
+        if handler_type not in HANDLER_TYPES:
+            raise ValueError(
+                    f'Invalid handler type: {handler_type}. '
+                    f'Please provide a valid handler type; one of {HANDLER_TYPES}'
+                    )
+
+        self.__handler_capture[handler_type] = enabled
+
+        for handler in self.iter_handlers():
+            if isinstance(handler, HANDLER_TYPES[handler_type]):
+                handler.capture_caller = enabled
+            elif isinstance(handler, DeferredSetupHandler):
+                # The real handlers aren't built yet; answer for the ones it will build.
+                handler.capture_caller = any(self.__handler_capture.get(name, True) for name in HANDLER_TYPES)
+
+    def __apply_caller_capture(self, handler: logging.Handler, handler_type: str) -> None:
+        """
+        Applies a caller capture setting made with :meth:`set_caller_capture` before `handler` was built.
+
+        Parameters:
+            handler (logging.Handler):
+                The newly built handler.
+
+            handler_type (str):
+                The key of `HANDLER_TYPES` the handler was built for.
+
+        Returns:
+            None
+        """
+        if handler_type in self.__handler_capture:
+            handler.capture_caller = self.__handler_capture[handler_type]
+
+    def set_up_async(self, pipeline: Optional[AsyncPipeline] = None) -> None:
+        """
+        Moves the logger's console and file handlers behind a `QueueingHandler`, so records are emitted by the
+        pipeline's worker threads instead of the calling thread.
+
+        Parameters:
+            pipeline (AsyncPipeline, optional):
+                The pipeline to use. Defaults to the logger's pipeline, or the process-wide default pipeline.
+
+        Returns:
+            None
+
+        Since:
+            v3.3.0
+        """
+        self.__pipeline = pipeline or self.__pipeline or get_default_pipeline()
+
+        targets = [
+                handler for handler in self.logger.handlers
+                if isinstance(handler, tuple(HANDLER_TYPES.values()))
+                ]
+
+        if not targets:
+            return
+
+        for handler in targets:
+            self.logger.removeHandler(handler)
+
+        self.internal(f'Emitting through {self.__pipeline!r}')
+        self.logger.addHandler(QueueingHandler(self.__pipeline, targets))
+
+    def set_up_coalescing(self, window: Optional[float] = None) -> None:
+        """
+        Moves the logger's console and file handlers (or the `QueueingHandler` in front of them) behind a
+        `CoalescingHandler`, so runs of identical consecutive records are collapsed before they're rendered or
+        written.
+
+        Parameters:
+            window (float, optional):
+                The coalescing window, in seconds. Defaults to the logger's `coalesce` window, or one second.
+
+        Returns:
+            None
+
+        Since:
+            v3.3.0
+        """
+        if window is None:
+            window = self.__coalesce if not isinstance(self.__coalesce, bool) else 1.0
+
+        self.__coalesce = window
+
+        targets = [
+                handler for handler in self.logger.handlers
+                if isinstance(handler, (QueueingHandler, *HANDLER_TYPES.values()))
+                ]
+
+        if not targets:
+            return
+
+        for handler in targets:
+            self.logger.removeHandler(handler)
+
+        self.logger.addHandler(CoalescingHandler(targets, window))
+
     def set_up_console(self):
         """
         Configures and attaches a console handler to the logger.
+
+        The engine is chosen by the logger's `console_mode`; Rich is only imported once the handler emits its first
+        record, and not at all with the plain engine. Tracebacks are rendered in full (with locals) the first time
+        they're seen, and as set by `repeated_tracebacks` afterwards, except for those the `exceptions` table passes
+        on in full again once its window has expired.
         """
 
         self.internal("Setting up console handler")
-        console_handler = RichHandler(
-                show_level=True, markup=True, rich_tracebacks=True,
-                tracebacks_show_locals=True
+        tiers = None if self.__repeated_tracebacks == 'full' else TracebackTiers(self.__repeated_tracebacks)
+        console_handler = ConsoleHandler(
+                mode=self.__console_mode, threaded=self.__threaded_console, traceback_tiers=tiers, show_level=True,
+                markup=True, rich_tracebacks=True, tracebacks_show_locals=True
                 )
         formatter = CustomFormatter(
                 f"[{self.logger.name}] %(message)s"
                 )
         console_handler.setFormatter(formatter)
         console_handler.setLevel(self.__console_level)
+        self.__apply_caller_capture(console_handler, 'console')
         self.logger.addHandler(console_handler)
 
     def set_up_file(self):
         """
         Configures and attaches a file handler to the logger.
+
+        The handler writes through the shared writer pool, so every logger targeting the same file shares a single
+        open file.
         """
 
         self.ensure_log_file_path()
-        file_handler = logging.FileHandler(self.file_path)
+
+        if self.buffered_file:
+            options = self.buffered_file if isinstance(self.buffered_file, dict) else {}
+            file_handler = BufferedFileHandler(self.file_path, **options)
+        else:
+            file_handler = SharedFileHandler(self.file_path)
+
         file_handler.setLevel(self.__file_level)
         formatter = CustomFormatter(
                 "%(asctime)s - [%(name)s] - %(levelname)s - %(message)s |-| %(file_name)s:%(lineno)d"
                 )
         file_handler.setFormatter(formatter)
+        self.__apply_caller_capture(file_handler, 'file')
         self.logger.addHandler(file_handler)
 
     def set_level(self, console_level=None, file_level=None, override=False, call_from_setter=False) -> None:
@@ -555,7 +1386,7 @@ class Logger(InspyLogger):
             self.__apply_level_change('file')
 
     @method_alias('add_child', 'add_child_logger', 'get_child_logger')
-    def get_child(self, name=None, console_level=None, file_level=None, **kwargs) -> InspyLogger:
+    def get_child(self, name=None, console_level=None, file_level=None, evictable=False, **kwargs) -> InspyLogger:
         """
         Retrieves or creates a nested child logger based on a dot-separated name.
     
@@ -570,6 +1401,11 @@ class Logger(InspyLogger):
     
             file_level (int or str, optional):
                 File log level for the child logger(s).
+
+            evictable (bool, optional):
+                Whether child loggers created by this call are dynamic (e.g. one per method or instance), and so may
+                be evicted by their parent's `child_cache` and transparently re-created on the next lookup. Defaults
+                to False.
     
         Returns:
             InspyLogger:
@@ -577,8 +1413,7 @@ class Logger(InspyLogger):
         """
         if name is None:
             # Get the name from the caller's function if not provided
-            caller_frame = inspect.stack()[1]
-            name = self.__build_name_from_caller(caller_frame, name)
+            name = self.__build_name_from_caller(sys._getframe(1), name)
 
         name_parts = name.split('.')
         current_logger = self
@@ -587,14 +1422,35 @@ class Logger(InspyLogger):
             # Build the full name for the child logger
             cl_name = f"{current_logger.name}.{part}"
 
-            if found_child := current_logger.find_child_by_name(
-                cl_name, exact_match=True
-            ):
+            found_child = current_logger.__child_index.get(cl_name)
+            cache = current_logger.__child_cache
+
+            if found_child is not None and cl_name in cache and not cache.touch(cl_name):
+                current_logger.__evict_child(found_child)
+                found_child = None
+
+            if found_child is not None:
                 current_logger = found_child
             else:
                 # Create a new child logger
                 console_level = console_level or current_logger.console_level
                 file_level = file_level or current_logger.file_level
+                kwargs.setdefault('capture_caller', current_logger.capture_caller)
+                kwargs.setdefault('fast_path', current_logger.fast_path)
+                kwargs.setdefault('async_emit', current_logger.pipeline or False)
+                kwargs.setdefault('buffered_file', current_logger.buffered_file)
+                kwargs.setdefault('max_dynamic_children', cache.max_size)
+                kwargs.setdefault('dynamic_child_ttl', cache.ttl)
+                kwargs.setdefault('lazy_handlers', current_logger.lazy_handlers)
+                kwargs.setdefault('suppression_report_interval', current_logger.site_limiter.report_interval)
+                kwargs.setdefault('coalesce', current_logger.coalesce)
+                kwargs.setdefault('warn_once_max_size', current_logger.warnings_issued.max_size)
+                kwargs.setdefault('warn_once_ttl', current_logger.warnings_issued.ttl)
+                kwargs.setdefault('message_style', current_logger.message_style)
+                kwargs.setdefault('console_mode', current_logger.console_mode)
+                kwargs.setdefault('threaded_console', current_logger.threaded_console)
+                kwargs.setdefault('repeated_tracebacks', current_logger.repeated_tracebacks)
+                kwargs.setdefault('exception_window', current_logger.exceptions.window)
 
                 child_logger = Logger(
                     name=cl_name,
@@ -603,7 +1459,15 @@ class Logger(InspyLogger):
                     parent=current_logger,
                     **kwargs
                 )
-                current_logger.children.append(child_logger)
+                current_logger.__add_child(child_logger)
+
+                if evictable or current_logger.__dynamic:
+                    child_logger.__make_dynamic()
+
+                if evictable:
+                    for evicted in cache.add(cl_name):
+                        current_logger.__evict_child(current_logger.__child_index[evicted])
+
                 current_logger = child_logger
 
         return current_logger
@@ -645,6 +1509,9 @@ class Logger(InspyLogger):
                             If exact_match is False, returns a list of Logger instances whose names contain the
                             search term.
         """
+        if exact_match and case_sensitive:
+            return self.__child_index.get(name, [])
+
         self.internal(f'Searching for child with name: {name}')
         results = []
 
@@ -737,7 +1604,7 @@ class Logger(InspyLogger):
         Returns:
             None
         """
-        self._log(logging.ERROR, message, args=(), stacklevel=2, **kwargs)
+        self._log(logging.ERROR, message, args=args, stacklevel=stack_level, **kwargs)
 
     def __repr__(self):
         name = self.name
@@ -785,6 +1652,54 @@ class Logger(InspyLogger):
 
         self.announcement.announce()
 
+    @classmethod
+    def find_loggers_by_prefix(cls, prefix: str) -> List[InspyLogger]:
+        """
+        Finds every logger (at any depth) whose name starts with the given prefix.
+
+        Parameters:
+            prefix (str):
+                The prefix to search for. The last dot-separated segment may be partial, e.g. 'MyApp.chi' matches
+                'MyApp.child' and 'MyApp.child.method'.
+
+        Returns:
+            List[InspyLogger]:
+                The matching loggers.
+
+        Since:
+            v3.3.0
+        """
+        found = (cls.get_instance(name) for name in cls.names.iter_prefix(prefix))
+
+        return [logger for logger in found if logger is not None]
+
+    @classmethod
+    def find_loggers_by_name(cls, name: str, case_sensitive=True) -> List[InspyLogger]:
+        """
+        Finds every logger (at any depth) whose name contains the given search term.
+
+        Parameters:
+            name (str):
+                The search term.
+
+            case_sensitive (bool, optional):
+                Whether the search should be case-sensitive. Defaults to True.
+
+        Returns:
+            List[InspyLogger]:
+                The matching loggers.
+
+        Since:
+            v3.3.0
+        """
+        if not case_sensitive:
+            name = name.lower()
+
+        return [
+                logger for logger_name, logger in cls.get_instances().items()
+                if name in (logger_name if case_sensitive else logger_name.lower())
+                ]
+
     @classmethod
     def create_logger_for_caller(cls):
         """
@@ -807,8 +1722,6 @@ class Logger(InspyLogger):
         Replays the buffered logs and sets up the handlers for the logger.
         """
         if self.buffering_handler:
-            self.buffering_handler.replay_logs(self.logger)
-
             # Remove the buffer handler
             self.logger.removeHandler(self.buffering_handler)
 
@@ -816,6 +1729,9 @@ class Logger(InspyLogger):
         if not self.logger.handlers:
             self.set_up_handlers()
 
+        if self.buffering_handler:
+            self.buffering_handler.replay_logs(self.logger)
+
     def set_up_handlers(self) -> None:
         """
         Sets up the handlers for the logger.
@@ -823,6 +1739,14 @@ class Logger(InspyLogger):
         self.set_up_console()
         self.set_up_file()
 
+        if self.pipeline:
+            self.set_up_async()
+
+        if self.coalesce:
+            self.set_up_coalescing()
+
+        self.logger.inspy_handlers_ready = True
+
     def to_dict(self):
         """
         Converts the logger properties into a dictionary format.
@@ -847,6 +1771,10 @@ class Logger(InspyLogger):
                         'Handlers': self.logger.handlers
                         },
                 'Call Counts':       self.call_counts,
+                'Child Cache':       self.child_cache.to_dict(),
+                'Rate Limits':       self.site_limiter.to_dict(),
+                'Warn Once':         self.warnings_issued.to_dict(),
+                'Exceptions':        self.exceptions.to_dict(),
                 'Buffering Handler': 'Yes' if getattr(self, 'buffering_handler', None) else 'No'
                 }
 
@@ -863,20 +1791,44 @@ class Logger(InspyLogger):
 
         return self
 
-    def warn_once(self, message):
+    def warn_once(self, message, *args, key=None, per_call_site=False, stack_level=2, **kwargs):
         """
-        Logs a warning message only once.
+        Logs a warning message only once (or once per `warn_once_ttl` seconds).
+
+        By default, a warning is identified by its message. When the message embeds changing values (like IDs),
+        pass a `key`, or identify the warning by the location of the call with `per_call_site`; otherwise every
+        variant is a new warning.
 
         Parameters:
             message:
                 The warning message to be logged.
 
+            key (Hashable, optional):
+                The identity of the warning. Defaults to the message.
+
+            per_call_site (bool, optional):
+                Whether to identify the warning by the file and line of the call rather than by its message. Ignored
+                if a `key` is given. Defaults to False.
+
+            stack_level (int, optional):
+                The stack-level to use when logging. Defaults to 2.
+
         Returns:
-            None
+            bool:
+                True if the warning was logged, False if it had already been issued.
         """
-        if message not in self.__warnings_issued:
-            self.warning(message)
-            self.warnings_issued.add(message)
+        if key is None:
+            if per_call_site and (frame := find_caller_frame()) is not None:
+                key = (frame.f_code.co_filename, frame.f_lineno)
+            else:
+                key = message
+
+        if not self.__warnings_issued.issue(key):
+            return False
+
+        self.warning(message, *args, stack_level=stack_level, **kwargs)
+
+        return True
 
     @staticmethod
     def _determine_module_path(frame):
@@ -897,16 +1849,233 @@ class Logger(InspyLogger):
             return relative_path.replace(os.path.sep, '.').rstrip('.py')
         return None
 
-    def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False, stacklevel=1):
+    def _log(
+            self,
+            level,
+            msg,
+            args,
+            exc_info=None,
+            extra=None,
+            stack_info=False,
+            stacklevel=1,
+            sample=None,
+            rate_limit=None,
+            style=None
+            ):
         """
-        Low-level logging implementation, passing stacklevel to findCaller.
+        Low-level logging implementation.
+
+        The caller is resolved with :func:`~inspy_logger.engine.caller.find_caller`, which skips inSPy-Logger's own
+        frames, and only if the logger (or one of its handlers) wants it.
+
+        Records can be sampled or rate limited per call site (the code location of the logging call, whatever the
+        message), either by passing `sample` or `rate_limit` to a level method, or by decorating the calling function
+        with :func:`~inspy_logger.engine.limits.rate_limited`. Suppressed records are counted, and the count is
+        reported periodically from the same site (see :meth:`report_suppressed`).
+
+        Nothing is rendered before a handler emits the record: `msg` may be a %-style or (with the '{' style) a
+        `str.format`-style template, or a lambda (or :class:`~inspy_logger.engine.messages.LazyMessage`) returning
+        the message, and arguments may be deferred with :func:`~inspy_logger.engine.messages.lazy`. None of them are
+        evaluated for a disabled level.
+
+        Parameters:
+            sample (float, optional):
+                The fraction of records from this call site to keep, e.g. 0.01 for one in a hundred.
+
+            rate_limit (Union[float, SitePolicy], optional):
+                The number of records per second this call site may emit, or a full
+                :class:`~inspy_logger.engine.limits.SitePolicy`.
+
+            style (str, optional):
+                The template style of `msg`; one of `MESSAGE_STYLES`. Defaults to the logger's `message_style`.
         """
-        # caller_frame = inspect.currentframe().f_back
         if INTERACTIVE_SESSION:
             stacklevel -= 1
 
-        if self.logger.isEnabledFor(level):
-            self.logger._log(level, msg, args, exc_info, extra, stack_info, stacklevel + 1)
+        logger = self.logger
+
+        if not logger.isEnabledFor(level):
+            return
+
+        frame = None
+        report = None
+
+        if sample is not None or rate_limit is not None or has_code_policies():
+            frame = find_caller_frame(stacklevel)
+
+            if sample is not None or rate_limit is not None:
+                policy = get_policy(rate_limit, sample)
+            else:
+                policy = get_code_policy(frame.f_code) if frame is not None else None
+
+            if policy is not None and frame is not None:
+                if (report := self.__site_limiter.check((frame.f_code, frame.f_lineno), policy)) is None:
+                    return
+
+        if not self._wants_caller():
+            file_name, line_no, func_name, _ = UNKNOWN_CALLER
+            stack_info = None
+        elif frame is not None:
+            file_name, line_no, func_name, stack_info = describe_caller(frame, stack_info)
+        else:
+            file_name, line_no, func_name, stack_info = find_caller(stacklevel, stack_info)
+
+        repeat = None
+        full_traceback = False
+
+        if exc_info:
+            if isinstance(exc_info, BaseException):
+                exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+            elif not isinstance(exc_info, tuple):
+                exc_info = sys.exc_info()
+
+            if exc_info[0] is not None:
+                fingerprint, count, full = self.__exceptions.observe(exc_info)
+
+                if not full:
+                    repeat = format_repeat(exc_info, fingerprint, count)
+                elif self.__exceptions.window:
+                    # Passed on in full once per window: the console renders it in full too, whatever its own tiers
+                    # remember of the signature.
+                    full_traceback = True
+
+        msg, args = wrap_message(msg, args, style or self.__message_style)
+
+        record = logger.makeRecord(
+                logger.name, level, file_name, line_no, msg, args, exc_info, func_name, extra, stack_info
+                )
+
+        if repeat is not None:
+            # The handlers render the summary instead of the traceback (which is released right away).
+            record.exc_info = None
+            record.exc_text = repeat
+        elif full_traceback:
+            record.full_traceback = True
+
+        logger.handle(record)
+
+        if report and report[0]:
+            self.__emit_suppressed(level, file_name, line_no, func_name, *report)
+
+    def __emit_suppressed(self, level, file_name, line_no, func_name, count, span):
+        """
+        Emits the summary of the records suppressed at a call site.
+        """
+        logger = self.logger
+
+        record = logger.makeRecord(
+                logger.name, level, file_name, line_no,
+                'Suppressed %d record(s) from this call site over the last %.1f second(s).', (count, span),
+                None, func_name, {'suppressed': count, 'suppressed_span': span}
+                )
+        logger.handle(record)
+
+    def report_suppressed(self) -> int:
+        """
+        Emits a summary, at INFO level, for every call site whose suppressed records haven't been reported yet.
+
+        This runs when the logger is closed; call it to report pending suppressions at any other point (e.g. on a
+        timer, or before exiting).
+
+        Returns:
+            int:
+                The number of suppressed records reported.
+
+        Since:
+            v3.3.0
+        """
+        total = 0
+
+        for (code, line_no), count, span in self.__site_limiter.pending():
+            if self.logger.isEnabledFor(logging.INFO):
+                self.__emit_suppressed(logging.INFO, code.co_filename, line_no, code.co_name, count, span)
+
+            total += count
+
+        return total
+
+    def bind(self, **fields):
+        """
+        Binds fields to the records logged from the current thread or asyncio task (by any logger), on top of the
+        fields already bound. They're appended to messages as ``key=value`` pairs, and set as ``record.context``.
+
+        The fields are kept in a context variable: other threads aren't affected, and asyncio tasks created
+        afterwards inherit them.
+
+        Parameters:
+            **fields:
+                The fields, e.g. `request_id=42`.
+
+        Returns:
+            contextvars.Token:
+                A token restoring the previous context when passed to :meth:`reset_context`.
+
+        Since:
+            v3.3.0
+        """
+        return _context.bind(**fields)
+
+    def unbind(self, *names):
+        """
+        Removes fields from the context of the current thread or asyncio task.
+
+        Parameters:
+            *names (str):
+                The names of the fields to remove.
+
+        Returns:
+            contextvars.Token:
+                A token restoring the previous context when passed to :meth:`reset_context`.
+
+        Since:
+            v3.3.0
+        """
+        return _context.unbind(*names)
+
+    def reset_context(self, token):
+        """
+        Restores the context that was current before the :meth:`bind` or :meth:`unbind` call that returned the
+        token.
+
+        Parameters:
+            token (contextvars.Token):
+                The token.
+
+        Since:
+            v3.3.0
+        """
+        _context.reset_context(token)
+
+    def contextualize(self, **fields):
+        """
+        Binds fields to the records logged within a `with` block, from the current thread or asyncio task.
+
+        Example:
+            >>> with logger.contextualize(request_id=42):
+            ...     logger.info('Handling request')  # Handling request request_id=42
+
+        Parameters:
+            **fields:
+                The fields, e.g. `request_id=42`.
+
+        Returns:
+            ContextManager[Mapping]:
+                The context manager, yielding the fields bound within the block.
+
+        Since:
+            v3.3.0
+        """
+        return _context.contextualize(**fields)
+
+    @property
+    def context(self):
+        """
+        The fields bound to the current thread or asyncio task. They must not be modified.
+
+        Since:
+            v3.3.0
+        """
+        return _context.get_context()
 
     def __rich__(self):
         # Create a rich table with logger properties
@@ -931,16 +2100,31 @@ class Logger(InspyLogger):
         else:
             table.add_row('Call Counts', 'No method calls recorded')
 
+        if self.exceptions.fingerprints:
+            table.add_row('Exceptions', self.exceptions)
+        else:
+            table.add_row('Exceptions', 'No exceptions recorded')
+
         if getattr(self, 'buffering_handler', None):
             table.add_row('Buffering Handler', 'Yes' if self.buffering_handler else 'No')
 
         return table
 
 
-def get_loggers():
-    import gc
+def get_loggers(prefix: str = None) -> dict:
+    """
+    Gets the live `Logger` instances from the registry.
+
+    Parameters:
+        prefix (str, optional):
+            Only return loggers whose name starts with this prefix (see `Logger.find_loggers_by_prefix`). Defaults to
+            None, which returns every logger.
 
-    gc.collect()
-    loggers = [obj for obj in gc.get_objects() if isinstance(obj, InspyLogger)]
+    Returns:
+        dict:
+            The loggers, keyed by name.
+    """
+    if prefix is None:
+        return Logger.get_instances()
 
-    return {str(logger).split(": ")[1].split(" w/")[0]: logger for logger in loggers}
+    return {logger.name: logger for logger in Logger.find_loggers_by_prefix(prefix)}
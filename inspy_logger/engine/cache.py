@@ -0,0 +1,360 @@
+"""
+
+
+Author:
+    Inspyre Softworks
+
+Project:
+    inSPy-Logger
+
+File:
+    inspy_logger/engine/cache.py
+
+
+Description:
+    Bounded LRU/TTL caches used by `Logger`.
+
+    Child loggers created per method, property or instance (see `property_logging`, `method_logger`, `Loggable` and
+    `LoggableDescriptor`) would otherwise accumulate for the life of the process. The `ChildCache` only tracks names
+    and access times; the parent logger owns the children and detaches the ones the cache evicts, which are released
+    once nothing else references them.
+
+    The `OnceCache` remembers which one-time warnings (see `Logger.warn_once`) have been issued, so that remembering
+    them can't grow without bound when messages embed IDs, and so a warning can fire again once its TTL has passed.
+
+"""
+from collections import OrderedDict
+from itertools import islice
+from time import monotonic
+from typing import Hashable, Iterator, List, Optional
+
+
+__all__ = [
+    'ChildCache',
+    'OnceCache',
+]
+
+
+class ChildCache:
+    """
+    Tracks dynamically created child loggers and decides which ones to evict.
+
+    A child is evicted when the cache holds more than `max_size` children (least recently used first), or when it
+    hasn't been looked up for `ttl` seconds.
+
+    Since:
+        v3.3.0
+    """
+
+    def __init__(self, max_size: Optional[int] = 256, ttl: Optional[float] = None):
+        """
+        Initializes the cache.
+
+        Parameters:
+            max_size (int, optional):
+                The maximum number of tracked children. None means unbounded. Defaults to 256.
+
+            ttl (float, optional):
+                The number of seconds a child may go unused before it's evicted. None means children never expire.
+                Defaults to None.
+
+        Raises:
+            ValueError:
+                If `max_size` is less than 1.
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError(f'Invalid cache size: {max_size}. The cache size must be at least 1 (or None).')
+
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self.__last_used = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @property
+    def evictions(self) -> int:
+        """
+        The number of children evicted so far.
+        """
+        return self.__evictions
+
+    @property
+    def hits(self) -> int:
+        """
+        The number of lookups that found a live child.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """
+        The number of dynamic children that had to be created (or re-created after eviction).
+        """
+        return self.__misses
+
+    def add(self, name: str) -> List[str]:
+        """
+        Starts tracking a newly created child.
+
+        Parameters:
+            name (str):
+                The name of the child.
+
+        Returns:
+            List[str]:
+                The names of the children that should now be evicted.
+        """
+        self.__misses += 1
+        self.__last_used[name] = monotonic()
+        self.__last_used.move_to_end(name)
+
+        evict = self.expired()
+
+        if self.max_size is not None:
+            overflow = len(self.__last_used) - len(evict) - self.max_size
+
+            if overflow > 0:
+                least_recent = (candidate for candidate in self.__last_used if candidate not in evict)
+                evict.extend(islice(least_recent, overflow))
+
+        return evict
+
+    def clear(self) -> None:
+        """
+        Stops tracking every child, without counting them as evicted. The counters are kept.
+
+        Returns:
+            None
+        """
+        self.__last_used.clear()
+
+    def discard(self, name: str) -> None:
+        """
+        Stops tracking a child, counting it as evicted.
+
+        Parameters:
+            name (str):
+                The name of the child.
+
+        Returns:
+            None
+        """
+        if self.__last_used.pop(name, None) is not None:
+            self.__evictions += 1
+
+    def expired(self) -> List[str]:
+        """
+        Finds the children that haven't been used for `ttl` seconds.
+
+        Returns:
+            List[str]:
+                The names of the expired children.
+        """
+        if self.ttl is None:
+            return []
+
+        cutoff = monotonic() - self.ttl
+        expired = []
+
+        # Entries are kept in order of last use, so the scan can stop at the first live one.
+        for name, last_used in self.__last_used.items():
+            if last_used > cutoff:
+                break
+
+            expired.append(name)
+
+        return expired
+
+    def touch(self, name: str) -> bool:
+        """
+        Records a lookup of a tracked child.
+
+        Parameters:
+            name (str):
+                The name of the child.
+
+        Returns:
+            bool:
+                True if the child is live (a hit), False if it has expired and should be evicted.
+        """
+        now = monotonic()
+
+        if self.ttl is not None and now - self.__last_used[name] >= self.ttl:
+            return False
+
+        self.__hits += 1
+        self.__last_used[name] = now
+        self.__last_used.move_to_end(name)
+
+        return True
+
+    def to_dict(self) -> dict:
+        """
+        Converts the cache statistics into a dictionary format.
+
+        Returns:
+            dict:
+                A dictionary containing the cache statistics.
+        """
+        return {
+                'Size':      len(self),
+                'Max Size':  self.max_size,
+                'TTL':       self.ttl,
+                'Hits':      self.hits,
+                'Misses':    self.misses,
+                'Evictions': self.evictions,
+                }
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__last_used
+
+    def __len__(self) -> int:
+        return len(self.__last_used)
+
+    def __repr__(self):
+        return f'<ChildCache: {len(self)}/{self.max_size} w/ {self.hits} hits, {self.misses} misses, ' \
+               f'{self.evictions} evictions>'
+
+
+class OnceCache:
+    """
+    Remembers which keys have been issued, to let each one through only once (or once per `ttl` seconds).
+
+    Keys are kept in order of last use; past `max_size` keys, the least recently used one is forgotten, so it would
+    be let through again.
+
+    Since:
+        v3.3.0
+    """
+
+    def __init__(self, max_size: Optional[int] = 1024, ttl: Optional[float] = None):
+        """
+        Initializes the cache.
+
+        Parameters:
+            max_size (int, optional):
+                The maximum number of remembered keys. None means unbounded. Defaults to 1024.
+
+            ttl (float, optional):
+                The number of seconds after which an issued key is let through again. None means never. Defaults to
+                None.
+
+        Raises:
+            ValueError:
+                If `max_size` is less than 1.
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError(f'Invalid cache size: {max_size}. The cache size must be at least 1 (or None).')
+
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self.__issued_at = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__expirations = 0
+
+    @property
+    def evictions(self) -> int:
+        """
+        The number of keys forgotten to stay within `max_size`.
+        """
+        return self.__evictions
+
+    @property
+    def expirations(self) -> int:
+        """
+        The number of keys let through again after their TTL passed.
+        """
+        return self.__expirations
+
+    @property
+    def hits(self) -> int:
+        """
+        The number of repeats held back.
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """
+        The number of keys let through (issued).
+        """
+        return self.__misses
+
+    def issue(self, key: Hashable) -> bool:
+        """
+        Checks whether a key should be let through, and remembers it if so.
+
+        Parameters:
+            key (Hashable):
+                The key.
+
+        Returns:
+            bool:
+                True if the key is new (or its TTL has passed), False if it was already issued.
+        """
+        now = monotonic()
+        issued = self.__issued_at
+
+        if (issued_at := issued.get(key)) is not None:
+            if self.ttl is None or now - issued_at < self.ttl:
+                self.__hits += 1
+                issued.move_to_end(key)
+
+                return False
+
+            self.__expirations += 1
+
+        self.__misses += 1
+        issued[key] = now
+        issued.move_to_end(key)
+
+        if self.max_size is not None and len(issued) > self.max_size:
+            issued.popitem(last=False)
+            self.__evictions += 1
+
+        return True
+
+    def clear(self) -> None:
+        """
+        Forgets every key. The counters are kept.
+
+        Returns:
+            None
+        """
+        self.__issued_at.clear()
+
+    def to_dict(self) -> dict:
+        """
+        Converts the cache statistics into a dictionary format.
+
+        Returns:
+            dict:
+                A dictionary containing the cache statistics.
+        """
+        return {
+                'Size':        len(self),
+                'Max Size':    self.max_size,
+                'TTL':         self.ttl,
+                'Hits':        self.hits,
+                'Misses':      self.misses,
+                'Evictions':   self.evictions,
+                'Expirations': self.expirations,
+                }
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__issued_at
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self.__issued_at))
+
+    def __len__(self) -> int:
+        return len(self.__issued_at)
+
+    def __repr__(self):
+        return f'<OnceCache: {len(self)}/{self.max_size} w/ {self.hits} hits, {self.misses} misses, ' \
+               f'{self.evictions} evictions>'
@@ -0,0 +1,208 @@
+"""
+
+
+Author:
+    Inspyre Softworks
+
+Project:
+    inSPy-Logger
+
+File:
+    inspy_logger/engine/caller.py
+
+
+Description:
+    Resolves the caller of a logging call.
+
+    Rather than building a full ``inspect.stack()`` (which creates a ``FrameInfo`` for every frame and reads source
+    context for each of them), the resolver walks ``sys._getframe()`` back only until it reaches the requested
+    frame outside inSPy-Logger and the standard ``logging`` package.
+
+    This module also provides the log-record factory that fills ``LogRecord.file_name``. The attribute is taken from
+    ``record.pathname`` so that records created by third-party loggers no longer pay for a stack walk at all. The
+    factory also stamps ``LogRecord.monotonic_ns``, for formatters rendering monotonic-anchored timestamps, and
+    ``LogRecord.context`` when fields are bound to the current context (see :mod:`inspy_logger.engine.context`).
+
+"""
+import logging
+import sys
+from time import monotonic_ns
+
+from inspy_logger.engine.context import get_context
+
+
+__all__ = [
+    'UNKNOWN_CALLER',
+    'describe_caller',
+    'find_caller',
+    'find_caller_frame',
+    'install_record_factory',
+    'is_internal_file',
+    'register_internal_file',
+]
+
+
+UNKNOWN_CALLER = ('(unknown file)', 0, '(unknown function)', None)
+"""The caller information used when caller capture is disabled, mirroring what :mod:`logging` uses."""
+
+_INTERNAL_FILES = {
+    logging.addLevelName.__code__.co_filename,
+    __file__,
+}
+
+
+def register_internal_file(file_path: str) -> None:
+    """
+    Registers a source file whose frames should never be reported as the caller of a logging call.
+
+    Parameters:
+        file_path (str):
+            The path of the source file, usually the ``__file__`` of the registering module.
+
+    Returns:
+        None
+    """
+    _INTERNAL_FILES.add(file_path)
+
+
+def is_internal_file(file_path: str) -> bool:
+    """
+    Checks whether frames from the given source file are skipped when resolving the caller.
+
+    Parameters:
+        file_path (str):
+            The path of the source file (as found in ``frame.f_code.co_filename``).
+
+    Returns:
+        bool:
+            True if the file belongs to inSPy-Logger or :mod:`logging` (or the import machinery), else False.
+    """
+    return file_path in _INTERNAL_FILES or ('importlib' in file_path and '_bootstrap' in file_path)
+
+
+def _format_stack(frame) -> str:
+    """
+    Formats the stack leading up to (and including) the given frame, the way :mod:`logging` does for `stack_info`.
+    """
+    import io
+    import traceback
+
+    with io.StringIO() as sio:
+        sio.write('Stack (most recent call last):\n')
+        traceback.print_stack(frame, file=sio)
+        return sio.getvalue().rstrip('\n')
+
+
+def find_caller_frame(stacklevel: int = 1):
+    """
+    Finds the frame of the caller of a logging call.
+
+    Frames belonging to inSPy-Logger internals and to :mod:`logging` are skipped, then `stacklevel` counts the
+    remaining frames, so a `stacklevel` of 1 is the code that called the logging method.
+
+    Parameters:
+        stacklevel (int, optional):
+            How many non-internal frames to walk back. Defaults to 1.
+
+    Returns:
+        frame:
+            The caller's frame, or None if there are no frames outside inSPy-Logger and :mod:`logging`.
+    """
+    frame = sys._getframe(1)
+    found = None
+
+    while frame is not None:
+        if not is_internal_file(frame.f_code.co_filename):
+            found = frame
+
+            if stacklevel <= 1:
+                break
+
+            stacklevel -= 1
+
+        frame = frame.f_back
+
+    return found
+
+
+def describe_caller(frame, stack_info: bool = False) -> tuple:
+    """
+    Describes a caller frame found by :func:`find_caller_frame`.
+
+    Parameters:
+        frame (frame):
+            The caller's frame, or None for an unknown caller.
+
+        stack_info (bool, optional):
+            Whether to also format the stack leading up to the caller. Defaults to False.
+
+    Returns:
+        tuple:
+            A tuple of ``(filename, lineno, function_name, stack_info)``, as expected by
+            :meth:`logging.Logger.makeRecord`.
+    """
+    if frame is None:
+        return UNKNOWN_CALLER
+
+    code = frame.f_code
+
+    return code.co_filename, frame.f_lineno, code.co_name, _format_stack(frame) if stack_info else None
+
+
+def find_caller(stacklevel: int = 1, stack_info: bool = False) -> tuple:
+    """
+    Finds the caller of a logging call.
+
+    Frames belonging to inSPy-Logger internals and to :mod:`logging` are skipped, then `stacklevel` counts the
+    remaining frames, so a `stacklevel` of 1 is the code that called the logging method.
+
+    Parameters:
+        stacklevel (int, optional):
+            How many non-internal frames to walk back. Defaults to 1.
+
+        stack_info (bool, optional):
+            Whether to also format the stack leading up to the caller. Defaults to False.
+
+    Returns:
+        tuple:
+            A tuple of ``(filename, lineno, function_name, stack_info)``, as expected by
+            :meth:`logging.Logger.makeRecord`.
+    """
+    return describe_caller(find_caller_frame(stacklevel), stack_info)
+
+
+def install_record_factory():
+    """
+    Installs the inSPy-Logger log-record factory on top of the currently installed factory.
+
+    The factory sets ``record.file_name`` from ``record.pathname``, which :mod:`logging` (or :func:`find_caller`)
+    has already resolved, so no additional frames are inspected per record, and ``record.monotonic_ns`` from
+    :func:`time.monotonic_ns`. When fields are bound to the current context, it sets ``record.context`` to them;
+    otherwise, the attribute is left unset.
+
+    Calling this more than once is harmless; the factory is only installed once.
+
+    Returns:
+        Callable:
+            The installed record factory.
+    """
+    base_factory = logging.getLogRecordFactory()
+
+    if getattr(base_factory, 'is_inspy_factory', False):
+        return base_factory
+
+    def record_factory(*args, **kwargs):
+        record = base_factory(*args, **kwargs)
+        record.file_name = record.pathname
+        record.monotonic_ns = monotonic_ns()
+
+        if context := get_context():
+            record.context = context
+
+        return record
+
+    record_factory.is_inspy_factory = True
+
+    logging.setLogRecordFactory(record_factory)
+
+    return record_factory
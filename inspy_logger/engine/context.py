@@ -0,0 +1,168 @@
+"""
+
+
+Author:
+    Inspyre Softworks
+
+Project:
+    inSPy-Logger
+
+File:
+    inspy_logger/engine/context.py
+
+
+Description:
+    Structured context bound to the records logged from the current thread or asyncio task.
+
+    Fields bound with :func:`bind` or :func:`contextualize` (or `Logger.bind`/`Logger.contextualize`) are kept in a
+    :class:`contextvars.ContextVar`, so each thread has its own context, and each asyncio task starts with a copy of
+    the context it was created in. The bound fields are a plain dictionary that's never modified once bound: binding
+    more fields creates a new one (copy-on-write), which is what lets every record of the same context share it.
+
+    The inSPy-Logger record factory sets ``record.context`` to the bound fields, only when there are any, so logging
+    without a bound context costs one context variable lookup and allocates nothing. Formatters render the fields
+    as a ``key=value`` suffix of the message (see :func:`render_context`); other handlers can read
+    ``record.context`` as structured keys.
+
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Iterator, Mapping
+
+
+__all__ = [
+    'bind',
+    'clear_context',
+    'contextualize',
+    'get_context',
+    'render_context',
+    'reset_context',
+    'unbind',
+]
+
+
+_EMPTY: Mapping = {}
+"""The context of threads and tasks without bound fields. Never modified."""
+
+_CONTEXT: ContextVar = ContextVar('inspy_logger_context', default=_EMPTY)
+
+_LAST_RENDERED = (None, '')
+"""The context rendered last and its suffix; records logged in the same context share both."""
+
+
+def get_context() -> Mapping:
+    """
+    Gets the fields bound to the current thread or task.
+
+    Returns:
+        Mapping:
+            The bound fields. They must not be modified; bind or unbind fields instead.
+    """
+    return _CONTEXT.get()
+
+
+def bind(**fields) -> Token:
+    """
+    Binds fields to the records logged from the current thread or task (and from the tasks it creates afterwards),
+    on top of the fields already bound.
+
+    Parameters:
+        **fields:
+            The fields, e.g. `request_id=42`.
+
+    Returns:
+        contextvars.Token:
+            A token restoring the previous context when passed to :func:`reset_context`.
+    """
+    return _CONTEXT.set({**_CONTEXT.get(), **fields})
+
+
+def unbind(*names: str) -> Token:
+    """
+    Removes fields from the context of the current thread or task.
+
+    Parameters:
+        *names (str):
+            The names of the fields to remove. Names that aren't bound are ignored.
+
+    Returns:
+        contextvars.Token:
+            A token restoring the previous context when passed to :func:`reset_context`.
+    """
+    context = _CONTEXT.get()
+
+    return _CONTEXT.set({name: value for name, value in context.items() if name not in names} or _EMPTY)
+
+
+def reset_context(token: Token) -> None:
+    """
+    Restores the context that was current before the :func:`bind` or :func:`unbind` call that returned the token.
+
+    Parameters:
+        token (contextvars.Token):
+            The token.
+
+    Returns:
+        None
+    """
+    _CONTEXT.reset(token)
+
+
+def clear_context() -> None:
+    """
+    Removes every field from the context of the current thread or task.
+
+    Returns:
+        None
+    """
+    _CONTEXT.set(_EMPTY)
+
+
+@contextmanager
+def contextualize(**fields) -> Iterator[Mapping]:
+    """
+    Binds fields to the records logged within a `with` block, from the current thread or task.
+
+    Parameters:
+        **fields:
+            The fields, e.g. `request_id=42`.
+
+    Yields:
+        Mapping:
+            The context within the block.
+    """
+    token = bind(**fields)
+
+    try:
+        yield _CONTEXT.get()
+    finally:
+        _CONTEXT.reset(token)
+
+
+def render_context(context: Mapping) -> str:
+    """
+    Renders bound fields as a message suffix: ``" key=value key=value"`` (string values containing spaces are
+    quoted).
+
+    Parameters:
+        context (Mapping):
+            The fields.
+
+    Returns:
+        str:
+            The suffix (empty if there are no fields).
+    """
+    global _LAST_RENDERED
+
+    last_context, suffix = _LAST_RENDERED
+
+    if context is last_context:
+        return suffix
+
+    suffix = ''.join(
+            f' {name}={value!r}' if isinstance(value, str) and (' ' in value or not value) else f' {name}={value}'
+            for name, value in context.items()
+            )
+    _LAST_RENDERED = (context, suffix)
+
+    return suffix
@@ -1,25 +1,181 @@
-from logging import Handler
+from collections import Counter, deque
+from logging import Handler, LogRecord
+from typing import Optional
+import contextlib
 import logging
+import os
+import pickle
+import sys
+import threading
+import weakref
+from time import monotonic, time
+
+from inspy_logger.engine.messages import BraceMessage
+from inspy_logger.engine.spill import SpillFile
+from inspy_logger.engine.tracebacks import TracebackTiers, format_record, tiered_rich_handler_class
+from inspy_logger.engine.writers import WRITER_POOL
+from inspy_logger.helpers.formatting import CustomFormatter, is_interactive_session
 
 
 class BufferingHandler(Handler):
+    """
+    Holds the records emitted before a logger's real handlers are set up (e.g. while `BLOCK_LOGGER_START` is set), in
+    a bounded ring buffer, and replays them to those handlers later.
+
+    The buffer is capped by record count and, optionally, by approximate size in bytes. Once it's full, the overflow
+    policy decides what happens to the next record:
+
+        - 'drop_oldest': The oldest buffered record is dropped.
+        - 'drop_below_level': Records below `drop_level` are dropped first (the incoming one, or the oldest buffered
+          one); if there are none, the oldest record is dropped.
+        - 'spill': The oldest records are moved to a temporary file through memory-mapped segments (see `SpillFile`)
+          and streamed back, in order, on replay, so millions of records can wait for a delayed start without being held
+          in memory.
+
+    Since:
+        v3.3.0 (the cap, overflow policies and stats)
+    """
+
+    DROP_OLDEST = 'drop_oldest'
+
+    DROP_BELOW_LEVEL = 'drop_below_level'
+
+    SPILL = 'spill'
+
+    POLICIES = (DROP_OLDEST, DROP_BELOW_LEVEL, SPILL)
+
+    RECORD_OVERHEAD = 512
+    """
+    The approximate size, in bytes, of a record apart from its message; used for the `max_bytes` cap.
+
+    The message is sized by its template and string arguments, so deferred messages aren't rendered to be counted.
+    """
+
+    def __init__(
+            self,
+            capacity: int = 10_000,
+            max_bytes: Optional[int] = None,
+            policy: str = DROP_OLDEST,
+            drop_level: int = logging.INFO,
+            spill_segment_size: int = 4 * 1024 * 1024,
+            spill_dir: Optional[str] = None
+            ):
+        """
+        Initializes the handler.
+
+        Parameters:
+            capacity (int, optional):
+                The maximum number of records held in memory. Defaults to 10,000.
+
+            max_bytes (int, optional):
+                The maximum approximate size of the records held in memory. None means only `capacity` applies.
+                Defaults to None.
+
+            policy (str, optional):
+                What to do when the buffer is full; one of `POLICIES`. Defaults to 'drop_oldest'.
+
+            drop_level (int, optional):
+                With the 'drop_below_level' policy, records below this level are dropped first. Defaults to
+                `logging.INFO`.
+
+            spill_segment_size (int, optional):
+                With the 'spill' policy, the size of each memory-mapped segment in bytes. Defaults to 4 MiB.
+
+            spill_dir (str, optional):
+                With the 'spill' policy, the directory to create the spill file in. Defaults to the system's
+                temporary directory.
+
+        Raises:
+            ValueError:
+                If `capacity` is less than 1, or `policy` isn't one of `POLICIES`.
+        """
+        if capacity < 1:
+            raise ValueError(f'Invalid capacity: {capacity}. The capacity must be at least 1.')
+
+        if policy not in self.POLICIES:
+            raise ValueError(f'Invalid overflow policy: {policy}. Please provide one of {self.POLICIES}')
 
-    def __init__(self):
         super().__init__()
-        self.buffer = []
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.drop_level = drop_level
+
+        self.buffer = deque()
         self.replaying = False
 
+        # The size each buffered record was counted with, in the same order as `buffer`.
+        self.__sizes = deque()
+
+        self.__bytes = 0
+        self.__below_drop_level = 0
+        self.__dropped = Counter()
+        self.__spill = SpillFile(spill_segment_size, spill_dir) if policy == self.SPILL else None
+
+    @property
+    def buffered_bytes(self) -> int:
+        """
+        The approximate size of the records held in memory.
+        """
+        return self.__bytes
+
+    @property
+    def dropped(self) -> int:
+        """
+        The number of records dropped because the buffer was full.
+        """
+        return sum(self.__dropped.values())
+
+    @property
+    def dropped_by_level(self) -> dict:
+        """
+        The number of dropped records, keyed by level name.
+        """
+        return {logging.getLevelName(level): count for level, count in sorted(self.__dropped.items())}
+
+    @property
+    def size(self) -> int:
+        """
+        The number of records waiting to be replayed, in memory and spilled.
+        """
+        return len(self.buffer) + self.spilled
+
+    @property
+    def spilled(self) -> int:
+        """
+        The number of records currently spilled to disk.
+        """
+        return len(self.__spill) if self.__spill is not None else 0
+
     def emit(self, record):
-        if not self.replaying:
-            self.buffer.append(record)
+        if self.replaying:
+            return
+
+        if self.policy == self.DROP_BELOW_LEVEL and self.__is_full() and record.levelno < self.drop_level:
+            self.__dropped[record.levelno] += 1
+            return
+
+        if self.policy == self.SPILL:
+            self.__prepare(record)
+
+        self.__append(record)
 
-    def replay_logs(self, logger):
+        while self.__is_full(overflowing=True):
+            self.__make_room()
+
+    def replay_logs(self, logger, handlers=None):
         """
-        Replays the buffered logs and restores the original logging level of the logger.
+        Replays the buffered records, oldest first, to the handlers of a logger, and empties the buffer.
+
+        Each record is passed straight to the handlers whose level it meets; records below every handler's level are
+        skipped without being handled.
 
         Parameters:
-            logger:
-                The logger instance to replay the logs to.
+            logger (logging.Logger):
+                The logger whose handlers receive the records.
+
+            handlers (Iterable[logging.Handler], optional):
+                The handlers to replay to instead of the logger's. Defaults to None.
 
         Returns:
             None
@@ -31,20 +187,1119 @@ class BufferingHandler(Handler):
             >>> logger.setLevel(logging.DEBUG)
             >>> logger.debug("Debug message")
             >>> logger.info("Info message")
-            >>> logger.warning("Warning message")
+            >>> logger.removeHandler(handler)
+            >>> logger.addHandler(logging.StreamHandler())
             >>> handler.replay_logs(logger)
-            # The buffered logs are replayed to the logger and the original logging level is restored.
+            # The buffered records are emitted by the stream handler.
         """
+        targets = [handler for handler in (logger.handlers if handlers is None else handlers) if handler is not self]
 
         self.replaying = True
-        orig_level = logger.level
-        logger.setLevel(logging.CRITICAL)
 
-        for record in self.buffer:
-            logger.handle(record)
+        try:
+            lowest_level = min((handler.level for handler in targets), default=None)
 
-        self.buffer.clear()
+            for record in self.__drain():
+                if lowest_level is None or record.levelno < lowest_level:
+                    continue
 
-        self.replaying = False
+                for handler in targets:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+        finally:
+            self.replaying = False
+
+    def close(self):
+        if self.__spill is not None:
+            self.__spill.close()
+
+        super().close()
+
+    def to_dict(self) -> dict:
+        """
+        Converts the buffer statistics into a dictionary format.
+
+        Returns:
+            dict:
+                A dictionary containing the buffer statistics.
+        """
+        return {
+                'Policy':           self.policy,
+                'Capacity':         self.capacity,
+                'Max Bytes':        self.max_bytes,
+                'Buffered':         len(self.buffer),
+                'Buffered Bytes':   self.buffered_bytes,
+                'Spilled':          self.spilled,
+                'Spill Segments':   self.__spill.segments if self.__spill is not None else 0,
+                'Dropped':          self.dropped,
+                'Dropped by Level': self.dropped_by_level,
+                }
+
+    def __append(self, record):
+        size = self.__size_of(record)
+        self.buffer.append(record)
+        self.__sizes.append(size)
+        self.__bytes += size
+
+        if record.levelno < self.drop_level:
+            self.__below_drop_level += 1
+
+    def __pop_oldest(self):
+        record = self.buffer.popleft()
+        self.__forget(record, self.__sizes.popleft())
+
+        return record
+
+    def __forget(self, record, size):
+        self.__bytes -= size
+
+        if record.levelno < self.drop_level:
+            self.__below_drop_level -= 1
+
+    def __is_full(self, overflowing=False) -> bool:
+        count, size = len(self.buffer), self.__bytes
+
+        if overflowing:
+            return count > self.capacity or (self.max_bytes is not None and size > self.max_bytes and count > 1)
+
+        return count >= self.capacity or (self.max_bytes is not None and size >= self.max_bytes)
+
+    def __make_room(self):
+        if self.policy == self.SPILL:
+            self.__spill_record(self.__pop_oldest())
+            return
+
+        if self.policy == self.DROP_BELOW_LEVEL and self.__below_drop_level:
+            for index, record in enumerate(self.buffer):
+                if record.levelno < self.drop_level:
+                    del self.buffer[index]
+                    self.__forget(record, self.__sizes[index])
+                    del self.__sizes[index]
+                    self.__dropped[record.levelno] += 1
+                    return
+
+        self.__dropped[self.__pop_oldest().levelno] += 1
+
+    def __size_of(self, record) -> int:
+        msg, args = record.msg, record.args
+
+        if isinstance(msg, BraceMessage):
+            msg, args = msg.template, msg.args
+
+        size = self.RECORD_OVERHEAD + (len(msg) if isinstance(msg, str) else 0)
+
+        if isinstance(args, tuple):
+            size += sum(len(arg) for arg in args if isinstance(arg, str))
+
+        return size
+
+    @staticmethod
+    def __prepare(record):
+        """
+        Makes a record picklable: merges its message with its arguments and renders its exception.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+
+            record.exc_info = None
+
+    def __spill_record(self, record):
+        try:
+            self.__spill.append(record)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # e.g. an unpicklable `extra` attribute; the record can't be spilled, so it's dropped.
+            self.__dropped[record.levelno] += 1
+
+    def __drain(self):
+        """
+        Yields every buffered record, oldest (spilled) first, emptying the buffer.
+        """
+        if self.__spill is not None:
+            yield from self.__spill.drain()
+
+        while self.buffer:
+            yield self.__pop_oldest()
+
+
+class QueueingHandler(Handler):
+    """
+    A handler that only places records on an :class:`~inspy_logger.engine.pipeline.AsyncPipeline`; the pipeline's
+    worker threads emit them to the target handlers.
+
+    Since:
+        v3.3.0
+    """
+
+    def __init__(self, pipeline, targets):
+        """
+        Initializes the handler.
+
+        Parameters:
+            pipeline (AsyncPipeline):
+                The pipeline to enqueue records on.
+
+            targets (Iterable[logging.Handler]):
+                The handlers the records are emitted to by the pipeline's workers.
+        """
+        super().__init__()
+        self.pipeline = pipeline
+        self.targets = list(targets)
+
+    @property
+    def capture_caller(self):
+        """
+        Whether any of the target handlers wants caller information.
+        """
+        return any(getattr(target, 'capture_caller', True) for target in self.targets)
+
+    def prepare(self, record):
+        """
+        Prepares a record for hand-off to another thread.
+
+        The message is merged with its arguments on the calling thread, so mutable arguments can't change before a
+        worker formats the record. Exception information is kept as-is and rendered by the worker.
+
+        Parameters:
+            record (logging.LogRecord):
+                The record to prepare.
+
+        Returns:
+            logging.LogRecord:
+                The prepared record.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+
+        return record
+
+    def handle(self, record):
+        """
+        Filters and enqueues the record without taking the handler lock; the pipeline's queue is thread-safe.
+        """
+        rv = self.filter(record)
+
+        if isinstance(rv, LogRecord):
+            record = rv
+
+        if rv:
+            self.emit(record)
+
+        return rv
+
+    def emit(self, record):
+        targets = self.targets
+
+        if not any(record.levelno >= target.level for target in targets):
+            return
+
+        try:
+            self.pipeline.enqueue(self.prepare(record), targets)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.pipeline.flush()
+
+        for target in self.targets:
+            target.flush()
+
+    def close(self):
+        """
+        Closes the handler, and its targets once the records already queued for them have been emitted.
+        """
+        self.pipeline.close_handlers(self.targets)
+        super().close()
+
+
+class CoalescingHandler(Handler):
+    """
+    A handler that collapses runs of identical consecutive records before they reach its target handlers.
+
+    Two records are identical if they come from the same logger, at the same level, with the same message template
+    and arguments. The first record of a run is passed on right away; the repeats that follow within `window`
+    seconds are only counted, and are summarized in a single record ("Last message repeated N more time(s)...") when
+    the run ends, i.e. when a different record arrives, the window runs out (checked on emit, and by the shared
+    flusher thread, so a storm that stops is summarized even if nothing is logged afterwards), or the handler is
+    flushed or closed.
+
+    During a failure storm, each target renders and writes at most two lines per window instead of one per record.
+
+    Since:
+        v3.3.0
+    """
+
+    SUMMARY_TEMPLATE = 'Last message repeated %d more time(s) over %.1f second(s).'
+
+    def __init__(self, targets, window: float = 1.0):
+        """
+        Initializes the handler.
+
+        Parameters:
+            targets (Iterable[logging.Handler]):
+                The handlers the records (and summaries) are passed on to.
+
+            window (float, optional):
+                The number of seconds, from the first record of a run, during which repeats are collapsed. A storm
+                lasting longer produces one record and one summary per window. Defaults to 1.
+
+        Raises:
+            ValueError:
+                If `window` is not positive.
+        """
+        if window <= 0:
+            raise ValueError(f'Invalid window: {window}. The window must be greater than 0.')
+
+        super().__init__()
+        self.targets = list(targets)
+        self.window = window
+
+        self.__key = None
+        self.__first = None
+        self.__repeats = 0
+        self.__last_created = 0.0
+        self.__coalesced = 0
+
+        _register_interval_flush(self)
+
+    @property
+    def capture_caller(self):
+        """
+        Whether any of the target handlers wants caller information.
+        """
+        return any(getattr(target, 'capture_caller', True) for target in self.targets)
+
+    @property
+    def coalesced(self) -> int:
+        """
+        The number of records collapsed into summaries so far.
+        """
+        return self.__coalesced
+
+    @property
+    def flush_interval(self) -> float:
+        """
+        How often the shared flusher thread checks whether the current run's window ran out; the window itself.
+        """
+        return self.window
+
+    @staticmethod
+    def get_key(record) -> tuple:
+        """
+        Gets the identity of a record for coalescing purposes.
+
+        Parameters:
+            record (logging.LogRecord):
+                The record.
+
+        Returns:
+            tuple:
+                The logger name, level, message template and arguments of the record.
+        """
+        return record.name, record.levelno, record.msg, record.args
+
+    def emit(self, record):
+        key = self.get_key(record)
+
+        if self.__first is not None and self.__is_repeat(key, record):
+            self.__repeats += 1
+            self.__last_created = record.created
+            return
+
+        self.__end_run()
+
+        self.__key = key
+        self.__first = record
+        self.__last_created = record.created
+
+        self.__forward(record)
+
+    def flush_if_due(self):
+        """
+        Passes on the summary of the current run if its window ran out.
+        """
+        if not self.__repeats:
+            return
+
+        with self.lock:
+            if self.__repeats and time() - self.__first.created > self.window:
+                self.__end_run()
+                self.__first = self.__key = None
+
+    def flush(self):
+        """
+        Passes on the summary of the current run (if any) and flushes the targets.
+        """
+        with self.lock:
+            self.__end_run()
+            self.__first = self.__key = None
+
+        for target in self.targets:
+            target.flush()
+
+    def close(self):
+        """
+        Passes on the summary of the current run (if any) and closes the targets.
+        """
+        with self.lock:
+            _INTERVAL_FLUSHED.discard(self)
+            self.__end_run()
+            self.__first = self.__key = None
+
+        for target in self.targets:
+            target.close()
+
+        super().close()
+
+    def __is_repeat(self, key, record) -> bool:
+        if record.created - self.__first.created > self.window:
+            return False
+
+        # Arguments may not be comparable (or may fail to compare); such records are simply never collapsed.
+        try:
+            return bool(key == self.__key)
+        except Exception:
+            return False
+
+    def __end_run(self):
+        if not self.__repeats:
+            return
+
+        first = self.__first
+
+        summary = logging.makeLogRecord(dict(
+                first.__dict__,
+                msg=self.SUMMARY_TEMPLATE,
+                args=(self.__repeats, self.__last_created - first.created),
+                created=self.__last_created,
+                msecs=(self.__last_created - int(self.__last_created)) * 1000,
+                exc_info=None,
+                exc_text=None,
+                stack_info=None,
+                repeated=self.__repeats
+                ))
+
+        self.__coalesced += self.__repeats
+        self.__repeats = 0
+
+        self.__forward(summary)
+
+    def __forward(self, record):
+        for target in self.targets:
+            if record.levelno >= target.level:
+                target.handle(record)
+
+    def __repr__(self):
+        return f'<CoalescingHandler: {len(self.targets)} target(s), {self.window}s window>'
+
+
+class DeferredSetupHandler(Handler):
+    """
+    Stands in for a logger's handlers until the first record reaches it.
+
+    It then has the real handlers built (removing itself from the logger first) and passes the record on to them, so
+    loggers that never emit an enabled record never build a console handler or touch their log file.
+
+    Since:
+        v3.3.0
+    """
+
+    def __init__(self, logger: logging.Logger, set_up, level=logging.NOTSET, capture_caller: bool = True):
+        """
+        Initializes the handler.
+
+        Parameters:
+            logger (logging.Logger):
+                The logger whose handlers this one stands in for.
+
+            set_up (Callable[[], None]):
+                Builds and attaches the real handlers to `logger`.
+
+            level (int, optional):
+                The lowest level any of the real handlers will accept. Defaults to `logging.NOTSET`.
+
+            capture_caller (bool, optional):
+                Whether any of the real handlers will want the caller of a logging call resolved. The owning logger
+                updates it as handler types opt in or out. Defaults to True.
+        """
+        super().__init__(level)
+        self.logger = logger
+        self.set_up = set_up
+        self.capture_caller = capture_caller
+
+    @property
+    def pending(self) -> bool:
+        """
+        Whether the real handlers are yet to be built.
+        """
+        return self.set_up is not None
+
+    def handle(self, record):
+        with self.lock:
+            if self.set_up is not None:
+                set_up, self.set_up = self.set_up, None
+
+                # Replace (rather than mutate) the handler list, since the logger is iterating over it right now.
+                self.logger.handlers = [handler for handler in self.logger.handlers if handler is not self]
+                set_up()
+
+        for handler in list(self.logger.handlers):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+        return True
+
+    def emit(self, record):
+        pass
+
+    def __repr__(self):
+        level = logging.getLevelName(self.level)
+        return f'<{self.__class__.__name__} ({level}){" (pending)" if self.pending else ""}>'
+
+
+class ConsoleHandler(Handler):
+    """
+    A console handler that renders records with one of two engines, built when the first record is emitted:
+
+        - 'rich': A `RichHandler`; Rich is only imported at that point.
+        - 'plain': A `PlainConsoleHandler`, which writes pre-formatted plain lines through the stream's shared writer.
+
+    In 'auto' mode (the default), the plain engine is used when the console isn't a terminal (e.g. output piped to
+    a log collector, or a container without a TTY) and the session isn't interactive, and Rich otherwise. The
+    `INSPY_CONSOLE_MODE` environment variable sets the mode of handlers left in 'auto' mode.
+
+    Level, formatter and options set beforehand are passed on to the engine's handler when it's built.
+
+    In threaded mode, records are handed to the process-wide :class:`~inspy_logger.engine.render.ConsoleRenderer`
+    instead of being rendered by the logging thread, so logging threads never wait on the terminal.
+
+    Since:
+        v3.3.0
+    """
+
+    MODES = ('auto', 'rich', 'plain')
+
+    MODE_VARIABLE = 'INSPY_CONSOLE_MODE'
+    """The environment variable that overrides the 'auto' mode."""
+
+    def __init__(self, level=logging.NOTSET, mode: str = 'auto', threaded: bool = False,
+                 traceback_tiers: Optional[TracebackTiers] = None, **options):
+        """
+        Initializes the handler.
+
+        Parameters:
+            level (int, optional):
+                The level of the handler. Defaults to `logging.NOTSET`.
+
+            mode (str, optional):
+                The rendering engine; one of `MODES`. Defaults to 'auto'.
+
+            threaded (bool, optional):
+                Whether to render the records on the console render thread (see
+                :func:`~inspy_logger.engine.render.get_console_renderer`), batched once per frame. Defaults to False.
+
+            traceback_tiers (TracebackTiers, optional):
+                Picks how each traceback is rendered (e.g. in full, with locals, only the first time it's seen). If
+                None, every traceback is rendered in full. Defaults to None.
+
+            **options:
+                Keyword arguments for `rich.logging.RichHandler` (e.g. `markup=True`). The plain engine honors those
+                in `PlainConsoleHandler.OPTIONS` (e.g. `show_path`, or `buffer_size` to buffer its lines), and ignores
+                the rest.
+
+        Raises:
+            ValueError:
+                If `mode` is not one of `MODES`.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f'Invalid console mode: {mode}. Please provide one of {self.MODES}.')
+
+        super().__init__(level)
+        self.mode = mode
+        self.threaded = threaded
+        self.traceback_tiers = traceback_tiers
+        self.options = options
+        self.__target = None
+
+    @property
+    def built(self) -> bool:
+        """
+        Whether the engine's handler has been built yet.
+        """
+        return self.__target is not None
+
+    @property
+    def engine(self) -> str:
+        """
+        The engine that renders (or will render) the records: 'rich' or 'plain'.
+        """
+        if self.__target is not None:
+            return 'plain' if isinstance(self.__target, PlainConsoleHandler) else 'rich'
+
+        return self.resolve_mode(self.mode)
+
+    @classmethod
+    def resolve_mode(cls, mode: str = 'auto', stream=None) -> str:
+        """
+        Resolves a console mode to the engine it selects.
+
+        Parameters:
+            mode (str, optional):
+                One of `MODES`. Defaults to 'auto'.
+
+            stream (IO, optional):
+                The console stream. Defaults to `sys.stdout`.
+
+        Returns:
+            str:
+                'rich' or 'plain'.
+        """
+        if mode == 'auto':
+            mode = os.environ.get(cls.MODE_VARIABLE, 'auto').lower()
+
+        if mode in ('rich', 'plain'):
+            return mode
+
+        stream = sys.stdout if stream is None else stream
+
+        try:
+            is_terminal = stream.isatty()
+        except (AttributeError, ValueError):
+            is_terminal = False
+
+        if is_terminal or is_interactive_session():
+            return 'rich'
+
+        return 'plain'
+
+    @property
+    def target(self):
+        """
+        The engine's handler, built on first access.
+        """
+        if self.__target is None:
+            with self.lock:
+                if self.__target is None:
+                    if self.engine == 'plain':
+                        target = PlainConsoleHandler(
+                                level=self.level,
+                                traceback_tiers=self.traceback_tiers,
+                                **{name: value for name, value in self.options.items()
+                                   if name in PlainConsoleHandler.OPTIONS}
+                                )
+                    else:
+                        target = tiered_rich_handler_class()(
+                                level=self.level,
+                                traceback_tiers=self.traceback_tiers or TracebackTiers('full'),
+                                **self.options
+                                )
+
+                    target.setFormatter(self.formatter)
+                    self.__target = target
+
+        return self.__target
+
+    def setFormatter(self, fmt):
+        super().setFormatter(fmt)
+
+        if self.__target is not None:
+            self.__target.setFormatter(fmt)
+
+    def setLevel(self, level):
+        super().setLevel(level)
+
+        if self.__target is not None:
+            self.__target.setLevel(level)
+
+    def handle(self, record):
+        """
+        Filters and emits the record. In threaded mode, the record is queued without taking the handler lock; the
+        renderer's queue is thread-safe, and the engine's handler takes its own lock on the render thread.
+        """
+        if not self.threaded:
+            return super().handle(record)
+
+        rv = self.filter(record)
+
+        if isinstance(rv, LogRecord):
+            record = rv
+
+        if rv:
+            self.emit(record)
+
+        return rv
+
+    def emit(self, record):
+        if not self.threaded:
+            self.target.emit(record)
+            return
+
+        from inspy_logger.engine.render import get_console_renderer
+
+        try:
+            # As with `QueueingHandler.prepare`, merge the arguments now, before they can change.
+            record.msg = record.getMessage()
+            record.args = None
+
+            get_console_renderer().submit(record, self.target)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        if self.threaded and self.__target is not None:
+            from inspy_logger.engine.render import get_console_renderer
+
+            get_console_renderer().flush()
+
+        if self.__target is not None:
+            self.__target.flush()
+
+    def close(self):
+        self.flush()
+
+        if self.__target is not None:
+            self.__target.close()
+
+        super().close()
+
+    def __repr__(self):
+        level = logging.getLevelName(self.level)
+        state = f' ({self.engine})' if self.built else f' ({self.engine}, not built)'
+        state += ' (threaded)' if self.threaded else ''
+        return f'<{self.__class__.__name__} ({level}){state}>'
+
+
+class PlainConsoleHandler(logging.StreamHandler):
+    """
+    A console handler that writes plain lines (no styling, no markup parsing) through the stream's shared writer.
+
+    Each line is laid out as ``<time> <LEVEL> <message> (<file>:<line>)``, the message being formatted by the
+    handler's formatter, encoded, and written through the :class:`~inspy_logger.engine.writers.SharedStreamWriter`
+    that every plain console handler writing to the same stream acquires from the writer pool. Sharing its lock keeps
+    the lines of every logger in the order they were logged.
+
+    By default, each line is written right away. With a `buffer_size`, lines are collected in the writer's shared
+    buffer instead, and written out in one call when:
+
+        - It holds at least `buffer_size` bytes.
+        - A record at or above `flush_level` is emitted.
+        - `flush_interval` seconds have passed since the last write (checked on emit, and by the shared flusher
+          thread).
+        - The handler is flushed or closed.
+
+    Since:
+        v3.3.0
+    """
+
+    OPTIONS = ('show_time', 'show_level', 'show_path', 'buffer_size', 'flush_interval', 'flush_level', 'stream')
+    """The options `ConsoleHandler` passes on to this handler."""
+
+    DEFAULT_BUFFER_SIZE = 0
+    DEFAULT_FLUSH_INTERVAL = 0.1
+    DEFAULT_FLUSH_LEVEL = logging.WARNING
+
+    def __init__(
+            self,
+            stream=None,
+            level=logging.NOTSET,
+            show_time: bool = True,
+            show_level: bool = True,
+            show_path: bool = True,
+            buffer_size: int = DEFAULT_BUFFER_SIZE,
+            flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+            flush_level: int = DEFAULT_FLUSH_LEVEL,
+            traceback_tiers: Optional[TracebackTiers] = None,
+            pool=None
+            ):
+        """
+        Initializes the handler.
+
+        Parameters:
+            stream (IO, optional):
+                The stream to write to. Defaults to `sys.stdout` (as it is when the handler is created), like Rich's
+                console.
+
+            level (int, optional):
+                The level of the handler. Defaults to `logging.NOTSET`.
+
+            show_time, show_level, show_path (bool, optional):
+                Whether to include the timestamp, the level name and the caller's file and line in each line.
+                Default to True.
+
+            buffer_size (int, optional):
+                The number of buffered bytes that triggers a write. 0 writes every line right away. Defaults to 0.
+
+            flush_interval (float, optional):
+                With a `buffer_size`, the maximum number of seconds a line stays buffered. Pass 0 (or None) to disable
+                time-based flushing. Defaults to 0.1 seconds.
+
+            flush_level (int, optional):
+                With a `buffer_size`, records at or above this level are written out immediately, together with
+                everything buffered before them. Defaults to `logging.WARNING`.
+
+            traceback_tiers (TracebackTiers, optional):
+                Picks how each traceback is rendered (in full the first time it's seen, then compactly). If None,
+                every traceback is rendered in full. Defaults to None.
+
+            pool (WriterPool, optional):
+                The pool to acquire the stream's writer from. Defaults to the process-wide `WRITER_POOL`.
+        """
+        super().__init__(sys.stdout if stream is None else stream)
+        self.setLevel(level)
+
+        self.show_time = show_time
+        self.show_level = show_level
+        self.show_path = show_path
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.traceback_tiers = traceback_tiers
+
+        self.pool = pool or WRITER_POOL
+        self.writer = self.pool.acquire_stream(self.stream)
+        self.lock = self.writer.lock
+
+        self.__time_formatter = CustomFormatter(rewrite_ipython_paths=False)
+
+        if buffer_size and flush_interval:
+            _register_interval_flush(self)
+
+    @property
+    def buffered(self) -> int:
+        """
+        The number of bytes currently buffered for the stream, by this handler and the others sharing its writer.
+        """
+        return self.writer.buffered if self.writer is not None else 0
+
+    def layout(self, record, message: str) -> str:
+        """
+        Lays out the line for a record around its formatted message.
+
+        Parameters:
+            record (logging.LogRecord):
+                The record.
+
+            message (str):
+                The formatted message (which may span several lines, e.g. with a traceback).
+
+        Returns:
+            str:
+                The line, without a terminator.
+        """
+        if self.show_path:
+            first, newline, rest = message.partition('\n')
+            message = f'{first} ({record.filename}:{record.lineno}){newline}{rest}'
+
+        if self.show_level:
+            message = f'{record.levelname:<8} {message}'
+
+        if self.show_time:
+            message = f'{self.__time_formatter.formatTime(record)} {message}'
+
+        return message
+
+    def emit(self, record):
+        try:
+            if self.traceback_tiers is not None and record.exc_info and record.exc_info[0] is not None:
+                tier = self.traceback_tiers.tier(record.exc_info, getattr(record, 'full_traceback', False))
+                message = format_record(self.formatter or logging.Formatter(), record, tier)
+            else:
+                message = self.format(record)
+
+            writer = self.writer
+
+            if writer is None:
+                return
+
+            data = (self.layout(record, message) + self.terminator).encode(writer.encoding, 'replace')
+
+            if (
+                    not self.buffer_size
+                    or writer.buffered + len(data) >= self.buffer_size
+                    or record.levelno >= self.flush_level
+                    or (self.flush_interval and monotonic() - writer.last_write >= self.flush_interval)
+                    ):
+                writer.write(data)
+            else:
+                writer.append(data)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush_if_due(self):
+        """
+        Writes the shared buffer out if `flush_interval` seconds have passed since the last write.
+        """
+        writer = self.writer
+
+        if writer is None or not writer.buffered or monotonic() - writer.last_write < self.flush_interval:
+            return
+
+        writer.flush()
+
+    def flush(self):
+        if self.writer is not None:
+            self.writer.flush()
+
+    def close(self):
+        self.acquire()
+        try:
+            _INTERVAL_FLUSHED.discard(self)
+
+            if self.writer is not None:
+                self.pool.release(self.writer)
+                self.writer = None
+        finally:
+            self.release()
+
+        logging.Handler.close(self)
+
+
+_INTERVAL_FLUSHED = weakref.WeakSet()
+"""
+The handlers the shared flusher thread visits on a time interval: buffered file (and plain console) handlers, and
+coalescing handlers with a run to summarize.
+"""
+
+_INTERVAL_FLUSHER_LOCK = threading.Lock()
+
+_INTERVAL_FLUSHER_WAKE = threading.Event()
+"""Set when a handler registers, so the flusher picks up a shorter interval than the one it's waiting out."""
+
+_INTERVAL_FLUSHER = None
+
+
+def _flush_buffered_handlers():
+    """
+    The shared flusher thread: periodically calls `flush_if_due` on each registered handler (see `_INTERVAL_FLUSHED`).
+    """
+    while True:
+        handlers = list(_INTERVAL_FLUSHED)
+
+        if _INTERVAL_FLUSHER_WAKE.wait(min((handler.flush_interval for handler in handlers), default=1.0)):
+            _INTERVAL_FLUSHER_WAKE.clear()
+            handlers = list(_INTERVAL_FLUSHED)
+
+        for handler in handlers:
+            # A failing write is reported by the handler on its next emit; it mustn't stop the flusher.
+            with contextlib.suppress(Exception):
+                handler.flush_if_due()
+
+
+def _register_interval_flush(handler):
+    global _INTERVAL_FLUSHER
+
+    with _INTERVAL_FLUSHER_LOCK:
+        _INTERVAL_FLUSHED.add(handler)
+        _INTERVAL_FLUSHER_WAKE.set()
+
+        if _INTERVAL_FLUSHER is None:
+            _INTERVAL_FLUSHER = threading.Thread(
+                    target=_flush_buffered_handlers,
+                    name='inSPy-Logger-FileFlusher',
+                    daemon=True
+                    )
+            _INTERVAL_FLUSHER.start()
+
+
+class SharedFileHandler(logging.FileHandler):
+    """
+    A file handler that writes through a pooled, reference-counted :class:`~inspy_logger.engine.writers.SharedWriter`.
+
+    Every handler for the same file shares a single stream (so a single file descriptor) and a single lock, so lines
+    from different loggers never interleave. The file is closed when the last handler using it is closed.
+
+    Since:
+        v3.3.0
+    """
+
+    def __init__(self, filename, mode='a', encoding=None, delay=False, errors=None, pool=None):
+        """
+        Initializes the handler.
+
+        Parameters:
+            filename, mode, encoding, delay, errors:
+                As for `logging.FileHandler`.
+
+            pool (WriterPool, optional):
+                The pool to acquire the writer from. Defaults to the process-wide `WRITER_POOL`.
+        """
+        self.pool = pool or WRITER_POOL
+        self.writer = None
+
+        super().__init__(filename, mode, encoding, delay=True, errors=errors)
+
+        self.__acquire_writer()
+
+        if not delay:
+            self.stream = self._open()
+
+    def __acquire_writer(self):
+        self.writer = self.pool.acquire(self.baseFilename, self.mode, self.encoding, self.errors)
+        self.lock = self.writer.lock
+
+    def _open(self):
+        if self.writer is None:
+            self.__acquire_writer()
+
+        return self.writer.stream
+
+    def close(self):
+        self.acquire()
+        try:
+            if self.stream:
+                self.flush()
+
+            self.stream = None
+
+            if self.writer is not None:
+                self.pool.release(self.writer)
+                self.writer = None
+        finally:
+            self.release()
+
+        logging.Handler.close(self)
+
+
+class BufferedFileHandler(SharedFileHandler):
+    """
+    A file handler that collects formatted lines in memory and writes them with a single `write` call.
+
+    The buffer is written out when any of these happen:
+
+        - It holds at least `buffer_size` characters.
+        - A record at or above `flush_level` is emitted.
+        - `flush_interval` seconds have passed since the last write (checked on emit, and by a shared background
+          thread so quiet periods don't leave lines stuck in memory).
+        - The handler is flushed or closed.
+
+    Being a `logging.FileHandler`, it is picked up as `HANDLER_TYPES['file']`, so level changes keep propagating to
+    it. Like `SharedFileHandler`, it writes through the writer pool.
+
+    Since:
+        v3.3.0
+    """
+
+    DEFAULT_BUFFER_SIZE = 64 * 1024
+    DEFAULT_FLUSH_INTERVAL = 1.0
+    DEFAULT_FLUSH_LEVEL = logging.ERROR
+
+    def __init__(
+            self,
+            filename,
+            mode='a',
+            encoding=None,
+            delay=False,
+            errors=None,
+            buffer_size: int = DEFAULT_BUFFER_SIZE,
+            flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+            flush_level: int = DEFAULT_FLUSH_LEVEL,
+            pool=None
+            ):
+        """
+        Initializes the handler.
+
+        Parameters:
+            filename, mode, encoding, delay, errors:
+                As for `logging.FileHandler`.
+
+            buffer_size (int, optional):
+                The number of buffered characters that triggers a write. Defaults to 64 KiB.
+
+            flush_interval (float, optional):
+                The maximum number of seconds a line stays buffered. Pass 0 (or None) to disable time-based
+                flushing. Defaults to 1 second.
+
+            flush_level (int, optional):
+                Records at or above this level are written out immediately, together with everything buffered
+                before them. Defaults to `logging.ERROR`.
+
+            pool (WriterPool, optional):
+                The pool to acquire the writer from. Defaults to the process-wide `WRITER_POOL`.
+        """
+        super().__init__(filename, mode, encoding, delay, errors, pool)
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+
+        self.__lines = []
+        self.__buffered = 0
+        self.__last_write = monotonic()
+
+        if flush_interval:
+            _register_interval_flush(self)
+
+    @property
+    def buffered(self) -> int:
+        """
+        The number of characters currently buffered.
+        """
+        return self.__buffered
+
+    def emit(self, record):
+        try:
+            line = self.format(record) + self.terminator
+            self.__lines.append(line)
+            self.__buffered += len(line)
+
+            if (
+                    self.__buffered >= self.buffer_size
+                    or record.levelno >= self.flush_level
+                    or (self.flush_interval and monotonic() - self.__last_write >= self.flush_interval)
+                    ):
+                self.__write_buffer()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def __write_buffer(self):
+        """
+        Writes the buffered lines with a single call. Expects the handler lock to be held.
+        """
+        self.__last_write = monotonic()
+
+        if not self.__lines:
+            return
+
+        if self.stream is None:
+            if self.mode != 'w' or not getattr(self, '_closed', False):
+                self.stream = self._open()
+
+        data = ''.join(self.__lines)
+        self.__lines.clear()
+        self.__buffered = 0
+
+        if self.stream:
+            self.stream.write(data)
+            self.stream.flush()
+
+    def flush_if_due(self):
+        """
+        Writes the buffer out if `flush_interval` seconds have passed since the last write.
+        """
+        if not self.__lines or monotonic() - self.__last_write < self.flush_interval:
+            return
+
+        self.flush()
+
+    def flush(self):
+        self.acquire()
+        try:
+            self.__write_buffer()
+        finally:
+            self.release()
+
+    def close(self):
+        self.acquire()
+        try:
+            _INTERVAL_FLUSHED.discard(self)
+            self.__write_buffer()
+        finally:
+            self.release()
 
-        logger.setLevel(orig_level)
+        super().close()
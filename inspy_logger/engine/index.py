@@ -0,0 +1,165 @@
+"""
+
+
+Author:
+    Inspyre Softworks
+
+Project:
+    inSPy-Logger
+
+File:
+    inspy_logger/engine/index.py
+
+
+Description:
+    A trie over dotted logger names, used for prefix searches over every logger in the process.
+
+    Names are split on '.', so each node holds one segment (e.g. 'MyApp' -> 'child' -> 'method'). Looking up a prefix
+    costs one dictionary hit per complete segment, followed by a scan of the last node's direct children for a
+    partial final segment.
+
+"""
+from typing import Iterator
+
+
+__all__ = [
+    'NameTrie',
+]
+
+
+class _Node:
+    __slots__ = ('children', 'name')
+
+    def __init__(self):
+        self.children = {}
+        self.name = None
+
+
+class NameTrie:
+    """
+    A set of dotted names supporting prefix searches.
+
+    Since:
+        v3.3.0
+    """
+
+    SEPARATOR = '.'
+
+    def __init__(self, names=()):
+        """
+        Initializes the trie.
+
+        Parameters:
+            names (Iterable[str], optional):
+                Names to add right away. Defaults to an empty tuple.
+        """
+        self.__root = _Node()
+        self.__size = 0
+
+        for name in names:
+            self.add(name)
+
+    def add(self, name: str) -> None:
+        """
+        Adds a name to the trie.
+
+        Parameters:
+            name (str):
+                The name to add.
+
+        Returns:
+            None
+        """
+        node = self.__root
+
+        for segment in name.split(self.SEPARATOR):
+            node = node.children.setdefault(segment, _Node())
+
+        if node.name is None:
+            node.name = name
+            self.__size += 1
+
+    def discard(self, name: str) -> None:
+        """
+        Removes a name from the trie, if present, pruning nodes that no longer lead to any name.
+
+        Parameters:
+            name (str):
+                The name to remove.
+
+        Returns:
+            None
+        """
+        path = [self.__root]
+
+        for segment in name.split(self.SEPARATOR):
+            node = path[-1].children.get(segment)
+            if node is None:
+                return
+            path.append(node)
+
+        if path[-1].name is None:
+            return
+
+        path[-1].name = None
+        self.__size -= 1
+
+        for segment, parent, node in zip(reversed(name.split(self.SEPARATOR)), reversed(path[:-1]), reversed(path)):
+            if node.children or node.name is not None:
+                break
+
+            del parent.children[segment]
+
+    def iter_prefix(self, prefix: str) -> Iterator[str]:
+        """
+        Iterates over the names starting with a prefix.
+
+        Parameters:
+            prefix (str):
+                The prefix. Its last segment may be partial, e.g. 'MyApp.chi' matches 'MyApp.child.method'.
+
+        Yields:
+            str:
+                The next matching name.
+        """
+        *segments, partial = prefix.split(self.SEPARATOR)
+        node = self.__root
+
+        for segment in segments:
+            node = node.children.get(segment)
+            if node is None:
+                return
+
+        for segment, child in list(node.children.items()):
+            if segment.startswith(partial):
+                yield from self.__iter_names(child)
+
+    def __iter_names(self, node):
+        stack = [node]
+
+        while stack:
+            node = stack.pop()
+
+            if node.name is not None:
+                yield node.name
+
+            stack.extend(node.children.values())
+
+    def __contains__(self, name: str) -> bool:
+        node = self.__root
+
+        for segment in name.split(self.SEPARATOR):
+            node = node.children.get(segment)
+            if node is None:
+                return False
+
+        return node.name is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return self.__iter_names(self.__root)
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __repr__(self):
+        return f'<NameTrie w/ {len(self)} name(s)>'
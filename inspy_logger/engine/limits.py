@@ -0,0 +1,406 @@
+"""
+
+
+Author:
+    Inspyre Softworks
+
+Project:
+    inSPy-Logger
+
+File:
+    inspy_logger/engine/limits.py
+
+
+Description:
+    Per-call-site rate limiting and sampling of log records.
+
+    A call site is a location in the code (a code object and a line number), not the text of the message, so a line
+    that logs a different message on every pass through a hot loop is still recognized as one site. Each site gets a
+    :class:`SitePolicy`, either passed with the logging call (``log.debug(..., sample=0.01)`` or
+    ``log.warning(..., rate_limit=10)``) or attached to every logging call made directly inside a function with the
+    :func:`rate_limited` decorator.
+
+    Suppressed records are counted per site. The count is reported as a summary record from the same site the next
+    time one of its records gets through after `report_interval` seconds, and whenever the owning logger reports its
+    pending suppressions (see `Logger.report_suppressed`).
+
+"""
+import math
+import random
+import threading
+from functools import lru_cache
+from time import monotonic
+from typing import Callable, Dict, Iterator, Optional, Tuple, Union
+
+
+__all__ = [
+    'SiteLimiter',
+    'SitePolicy',
+    'get_code_policy',
+    'get_policy',
+    'has_code_policies',
+    'rate_limited',
+]
+
+
+_CODE_POLICIES: Dict[object, 'SitePolicy'] = {}
+"""The policies attached with :func:`rate_limited`, keyed by the code object of the decorated function."""
+
+
+class SitePolicy:
+    """
+    How many records a call site may emit: a sampled fraction, a token-bucket rate, or both.
+
+    Sampling is applied first; the records it keeps are then subject to the rate limit.
+
+    Since:
+        v3.3.0
+    """
+
+    __slots__ = ('burst', 'deterministic', 'period', 'rate', 'sample')
+
+    def __init__(
+            self,
+            rate: Optional[float] = None,
+            burst: Optional[int] = None,
+            sample: Optional[float] = None,
+            deterministic: bool = False
+            ):
+        """
+        Initializes the policy.
+
+        Parameters:
+            rate (float, optional):
+                The number of records per second the site may emit on average. None means no rate limit. Defaults
+                to None.
+
+            burst (int, optional):
+                The number of records the site may emit at once before the rate applies (the size of the token
+                bucket). Defaults to `rate`, rounded up, and at least 1.
+
+            sample (float, optional):
+                The fraction of records to keep, between 0 (exclusive) and 1 (inclusive). None means no sampling.
+                Defaults to None.
+
+            deterministic (bool, optional):
+                Whether to keep exactly every n-th record (n being `1 / sample`, rounded) rather than a random
+                `sample` of them. Defaults to False.
+
+        Raises:
+            ValueError:
+                If `rate` is not positive, `burst` is less than 1, or `sample` is not in (0, 1].
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError(f'Invalid rate: {rate}. The rate must be greater than 0 (or None).')
+
+        if burst is not None and burst < 1:
+            raise ValueError(f'Invalid burst: {burst}. The burst must be at least 1.')
+
+        if sample is not None and not 0 < sample <= 1:
+            raise ValueError(f'Invalid sample: {sample}. The sample must be greater than 0 and at most 1 (or None).')
+
+        self.rate = rate
+        self.burst = burst or (max(1, math.ceil(rate)) if rate else None)
+        self.sample = sample
+        self.deterministic = deterministic
+        self.period = max(1, round(1 / sample)) if sample else 1
+
+    def __repr__(self):
+        return (f'<SitePolicy: rate={self.rate}, burst={self.burst}, sample={self.sample}, '
+                f'deterministic={self.deterministic}>')
+
+
+@lru_cache(maxsize=256)
+def get_policy(rate_limit: Union[float, SitePolicy, None] = None, sample: Optional[float] = None) -> SitePolicy:
+    """
+    Gets the policy for the `rate_limit` and `sample` arguments of a logging call.
+
+    Policies are cached, so passing the same literals on every call doesn't build a new policy each time.
+
+    Parameters:
+        rate_limit (Union[float, SitePolicy], optional):
+            The number of records per second, or a full policy. Defaults to None.
+
+        sample (float, optional):
+            The fraction of records to keep. Ignored if `rate_limit` is a policy. Defaults to None.
+
+    Returns:
+        SitePolicy:
+            The policy.
+    """
+    if isinstance(rate_limit, SitePolicy):
+        return rate_limit
+
+    return SitePolicy(rate=rate_limit, sample=sample)
+
+
+def has_code_policies() -> bool:
+    """
+    Checks whether any function has been decorated with :func:`rate_limited`.
+
+    Returns:
+        bool:
+            True if at least one policy is attached to a function.
+    """
+    return bool(_CODE_POLICIES)
+
+
+def get_code_policy(code) -> Optional[SitePolicy]:
+    """
+    Gets the policy attached (with :func:`rate_limited`) to the function a code object belongs to.
+
+    Parameters:
+        code (code):
+            The code object of the calling frame.
+
+    Returns:
+        Optional[SitePolicy]:
+            The policy, or None if the function has none.
+    """
+    return _CODE_POLICIES.get(code)
+
+
+def rate_limited(
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        sample: Optional[float] = None,
+        deterministic: bool = False
+        ) -> Callable:
+    """
+    A decorator that applies a :class:`SitePolicy` to every logging call made directly in the decorated function.
+
+    Each logging call in the function is still its own site, with its own bucket and counters. A policy passed with
+    the logging call itself takes precedence.
+
+    Parameters:
+        rate (float, optional):
+            See :class:`SitePolicy`.
+
+        burst (int, optional):
+            See :class:`SitePolicy`.
+
+        sample (float, optional):
+            See :class:`SitePolicy`.
+
+        deterministic (bool, optional):
+            See :class:`SitePolicy`.
+
+    Returns:
+        Callable:
+            The decorator.
+
+    Example:
+        >>> @rate_limited(rate=5)
+        ... def poll(log):
+        ...     log.warning('Still waiting for the device...')
+
+    Since:
+        v3.3.0
+    """
+    policy = SitePolicy(rate=rate, burst=burst, sample=sample, deterministic=deterministic)
+
+    def decorator(func):
+        # The logging calls run in `func`'s own frame, so `func` is registered as is rather than wrapped.
+        _CODE_POLICIES[func.__code__] = policy
+        func.site_policy = policy
+
+        return func
+
+    return decorator
+
+
+class _Site:
+    """
+    The state of one call site: its token bucket and its counters.
+    """
+
+    __slots__ = ('first_suppressed', 'last_report', 'passed', 'seen', 'suppressed', 'tokens', 'unreported', 'updated')
+
+    def __init__(self, policy: SitePolicy, now: float):
+        self.tokens = policy.burst or 0
+        self.updated = now
+        self.last_report = now
+        self.first_suppressed = None
+        self.seen = 0
+        self.passed = 0
+        self.suppressed = 0
+        self.unreported = 0
+
+
+class SiteLimiter:
+    """
+    Decides, per call site, whether a record is emitted or suppressed, and keeps count of the suppressed ones.
+
+    Since:
+        v3.3.0
+    """
+
+    def __init__(self, report_interval: float = 60.0, max_sites: int = 4096):
+        """
+        Initializes the limiter.
+
+        Parameters:
+            report_interval (float, optional):
+                The minimum number of seconds between two suppression summaries for the same site. Defaults to 60.
+
+            max_sites (int, optional):
+                The maximum number of tracked sites; the oldest one is forgotten past it. Defaults to 4096.
+
+        Raises:
+            ValueError:
+                If `max_sites` is less than 1.
+        """
+        if max_sites < 1:
+            raise ValueError(f'Invalid number of sites: {max_sites}. At least one site must be tracked.')
+
+        self.report_interval = report_interval
+        self.max_sites = max_sites
+
+        self.__sites: Dict[Tuple[object, int], _Site] = {}
+        self.__lock = threading.Lock()
+        self.__forgotten = 0
+
+    @property
+    def passed(self) -> int:
+        """
+        The number of records let through so far, across every tracked site.
+        """
+        with self.__lock:
+            return sum(site.passed for site in self.__sites.values())
+
+    @property
+    def sites(self) -> int:
+        """
+        The number of tracked sites.
+        """
+        return len(self.__sites)
+
+    @property
+    def suppressed(self) -> int:
+        """
+        The number of records suppressed so far, across every tracked site.
+        """
+        with self.__lock:
+            return sum(site.suppressed for site in self.__sites.values())
+
+    def check(self, key: Tuple[object, int], policy: SitePolicy) -> Optional[Tuple[int, float]]:
+        """
+        Checks whether a record from a call site gets through.
+
+        Parameters:
+            key (Tuple[code, int]):
+                The call site: the code object and line number of the logging call.
+
+            policy (SitePolicy):
+                The site's policy.
+
+        Returns:
+            Optional[Tuple[int, float]]:
+                None if the record is suppressed. Otherwise, the number of suppressions to report along with it (0 if
+                there's nothing to report yet) and the number of seconds they span.
+        """
+        now = monotonic()
+
+        with self.__lock:
+            if (site := self.__sites.get(key)) is None:
+                site = self.__add(key, policy, now)
+
+            site.seen += 1
+
+            if policy.sample is not None and not self.__sampled(site, policy):
+                return self.__suppress(site, now)
+
+            if policy.rate is not None:
+                site.tokens = min(policy.burst, site.tokens + (now - site.updated) * policy.rate)
+                site.updated = now
+
+                if site.tokens < 1:
+                    return self.__suppress(site, now)
+
+                site.tokens -= 1
+
+            site.passed += 1
+
+            if site.unreported and now - site.last_report >= self.report_interval:
+                return self.__report(site, now)
+
+            return 0, 0.0
+
+    def pending(self) -> Iterator[Tuple[Tuple[object, int], int, float]]:
+        """
+        Yields the sites with suppressions not reported yet, marking them as reported.
+
+        Yields:
+            Tuple[Tuple[code, int], int, float]:
+                The site, the number of suppressions to report and the number of seconds they span.
+        """
+        now = monotonic()
+
+        with self.__lock:
+            reports = [(key, *self.__report(site, now)) for key, site in self.__sites.items() if site.unreported]
+
+        yield from reports
+
+    def clear(self) -> None:
+        """
+        Forgets every tracked site.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__sites.clear()
+
+    def to_dict(self) -> dict:
+        """
+        Converts the limiter's statistics into a dictionary format.
+
+        Returns:
+            dict:
+                A dictionary containing the limiter's statistics.
+        """
+        return {
+                'Sites':      self.sites,
+                'Max Sites':  self.max_sites,
+                'Passed':     self.passed,
+                'Suppressed': self.suppressed,
+                'Forgotten':  self.__forgotten,
+                }
+
+    @staticmethod
+    def __sampled(site, policy) -> bool:
+        if policy.deterministic:
+            return (site.seen - 1) % policy.period == 0
+
+        return random.random() < policy.sample
+
+    @staticmethod
+    def __suppress(site, now):
+        if not site.unreported:
+            site.first_suppressed = now
+
+        site.suppressed += 1
+        site.unreported += 1
+
+    @staticmethod
+    def __report(site, now) -> Tuple[int, float]:
+        count, span = site.unreported, now - site.first_suppressed
+        site.unreported = 0
+        site.last_report = now
+
+        return count, span
+
+    def __add(self, key, policy, now) -> _Site:
+        sites = self.__sites
+
+        if len(sites) >= self.max_sites:
+            # Dictionaries keep insertion order, so the first site is the oldest one.
+            del sites[next(iter(sites))]
+            self.__forgotten += 1
+
+        site = sites[key] = _Site(policy, now)
+
+        return site
+
+    def __repr__(self):
+        return f'<SiteLimiter: {self.sites} site(s), {self.suppressed} record(s) suppressed>'
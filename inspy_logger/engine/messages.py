@@ -0,0 +1,241 @@
+"""
+
+
+Author:
+    Inspyre Softworks
+
+Project:
+    inSPy-Logger
+
+File:
+    inspy_logger/engine/messages.py
+
+
+Description:
+    Deferred log messages.
+
+    :mod:`logging` only merges a message with its arguments when a handler formats the record, by calling ``str()``
+    on the message and applying ``%`` to the arguments. The objects here hook into that step, so nothing is
+    rendered for a record that no handler emits:
+
+        - :class:`BraceMessage` renders a ``str.format``-style template (``'{} took {:.2f}s'``).
+        - :class:`LazyMessage` calls a function (e.g. a lambda building an f-string) for the message.
+        - :func:`lazy` wraps an expensive argument, which is computed only when it's formatted.
+
+    `Logger` wraps messages in these automatically: lambdas become a `LazyMessage`, and with the '{' message style
+    (see `Logger(message_style=...)` or the `style` argument of the level methods), templates become a
+    `BraceMessage`. Other callables (functions, classes, bound methods) are logged as objects, like :mod:`logging`
+    does; wrap them in a `LazyMessage` to have them called instead.
+
+"""
+from operator import index
+from types import FunctionType
+from typing import Any, Callable
+
+
+__all__ = [
+    'BraceMessage',
+    'Lazy',
+    'LazyMessage',
+    'MESSAGE_STYLES',
+    'lazy',
+    'wrap_message',
+]
+
+
+MESSAGE_STYLES = ('%', '{')
+"""The supported message styles: %-style (the :mod:`logging` default) and ``str.format``-style templates."""
+
+_UNSET = object()
+
+
+def _callable_identity(func: Callable) -> tuple:
+    """
+    Gets what identifies a deferred function, so two deferrals of the same code over the same values compare equal.
+
+    A plain function (e.g. a lambda) is identified by its code, the values its closure holds right now, and its
+    defaults; a new function object is created on every pass through a ``lambda`` expression, but those don't change.
+    Any other callable is identified by itself.
+    """
+    if type(func) is not FunctionType:
+        return (func,)
+
+    captured = []
+
+    for cell in func.__closure__ or ():
+        try:
+            captured.append(cell.cell_contents)
+        except ValueError:
+            # The variable isn't bound (yet).
+            captured.append(_UNSET)
+
+    return func.__code__, tuple(captured), func.__defaults__, func.__kwdefaults__
+
+
+class BraceMessage:
+    """
+    A ``str.format``-style template and its arguments, rendered when the record is formatted.
+
+    Since:
+        v3.3.0
+    """
+
+    __slots__ = ('args', 'kwargs', 'template')
+
+    def __init__(self, template: str, args: tuple = (), kwargs: dict = None):
+        self.template = template
+        self.args = args
+        self.kwargs = kwargs or {}
+
+    def __str__(self):
+        return str(self.template).format(*self.args, **self.kwargs)
+
+    def __eq__(self, other):
+        if not isinstance(other, BraceMessage):
+            return NotImplemented
+
+        return (self.template, self.args, self.kwargs) == (other.template, other.args, other.kwargs)
+
+    def __hash__(self):
+        return hash(self.template)
+
+    def __repr__(self):
+        return f'<BraceMessage: {self.template!r}>'
+
+
+class Lazy:
+    """
+    A value computed on first use, when it's formatted into a message; the result is cached.
+
+    Two deferrals compare equal when they call the same code (over the same captured values) with the same
+    arguments, so records carrying them can be coalesced without computing either.
+
+    Since:
+        v3.3.0
+    """
+
+    __slots__ = ('args', 'func', 'identity', 'kwargs', 'result')
+
+    def __init__(self, func: Callable[..., Any], *args, **kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.result = _UNSET
+
+        # Taken now: a closure over a loop variable shares its cell with the next pass, which may change it before
+        # the value is computed or compared.
+        self.identity = _callable_identity(func)
+
+    @property
+    def evaluated(self) -> bool:
+        """
+        Whether the value has been computed.
+        """
+        return self.result is not _UNSET
+
+    def get(self) -> Any:
+        """
+        Computes the value (only the first time) and returns it.
+
+        Returns:
+            Any:
+                The value.
+        """
+        if self.result is _UNSET:
+            self.result = self.func(*self.args, **self.kwargs)
+
+        return self.result
+
+    def __str__(self):
+        return str(self.get())
+
+    def __repr__(self):
+        return repr(self.get())
+
+    def __format__(self, format_spec):
+        return format(self.get(), format_spec)
+
+    def __eq__(self, other):
+        # Equal deferrals compute equal values, so records carrying them can be coalesced without rendering them.
+        if not isinstance(other, Lazy) or type(self) is not type(other):
+            return NotImplemented
+
+        return (self.identity, self.args, self.kwargs) == (other.identity, other.args, other.kwargs)
+
+    def __hash__(self):
+        return hash(self.identity[0])
+
+    def __int__(self):
+        return int(self.get())
+
+    def __index__(self):
+        return index(self.get())
+
+    def __float__(self):
+        return float(self.get())
+
+
+class LazyMessage(Lazy):
+    """
+    A message produced by a function, called when the record is formatted.
+
+    Since:
+        v3.3.0
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return f'<LazyMessage: {self.func!r}>' if not self.evaluated else repr(self.result)
+
+
+def lazy(func: Callable[..., Any], *args, **kwargs) -> Lazy:
+    """
+    Defers an expensive argument of a logging call until the record is formatted.
+
+    Parameters:
+        func (Callable):
+            The function computing the value.
+
+        *args, **kwargs:
+            The arguments to call `func` with.
+
+    Returns:
+        Lazy:
+            The deferred value.
+
+    Example:
+        >>> log.debug('State: %s', lazy(dump_state, machine))
+
+    Since:
+        v3.3.0
+    """
+    return Lazy(func, *args, **kwargs)
+
+
+def wrap_message(msg, args: tuple, style: str = '%') -> tuple:
+    """
+    Wraps the message of a logging call so it's rendered only when the record is formatted.
+
+    Parameters:
+        msg (Any):
+            The message: a template, or a lambda (or `LazyMessage`) returning the message. Any other object, callable
+            or not, is the message itself.
+
+        args (tuple):
+            The positional arguments of the logging call.
+
+        style (str, optional):
+            The template style; one of `MESSAGE_STYLES`. Defaults to '%'.
+
+    Returns:
+        tuple:
+            The message and the arguments to create the record with.
+    """
+    if type(msg) is FunctionType and msg.__name__ == '<lambda>':
+        msg = LazyMessage(msg)
+
+    if style == '{' and args:
+        return BraceMessage(msg, args), ()
+
+    return msg, args
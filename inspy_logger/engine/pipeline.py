@@ -0,0 +1,341 @@
+"""
+
+
+Author:
+    Inspyre Softworks
+
+Project:
+    inSPy-Logger
+
+File:
+    inspy_logger/engine/pipeline.py
+
+
+Description:
+    An asynchronous, queue-based emission pipeline.
+
+    Callers only enqueue their log records (see :class:`~inspy_logger.engine.handlers.QueueingHandler`); one or more
+    background worker threads hand them to the actual console and file handlers, so Rich rendering, formatting and
+    file I/O happen off the calling thread.
+
+    The queue is bounded. When it is full, callers either block until there is room (the default, which applies
+    back-pressure) or drop the record, in which case the drop is counted.
+
+    Every pipeline is drained when the interpreter exits.
+
+"""
+import atexit
+import logging
+import queue
+import threading
+import weakref
+from time import monotonic
+from typing import Iterable, Optional
+
+
+__all__ = [
+    'AsyncPipeline',
+    'get_default_pipeline',
+]
+
+
+_STOP = object()
+"""The sentinel that tells a worker thread to exit."""
+
+_CLOSE_HANDLERS = object()
+"""The sentinel record that tells a worker thread to close the handlers it comes with."""
+
+_PIPELINES = weakref.WeakSet()
+
+_DEFAULT_PIPELINE = None
+
+_DEFAULT_PIPELINE_LOCK = threading.Lock()
+
+
+class AsyncPipeline:
+    """
+    A bounded queue drained by background worker threads that emit records to their target handlers.
+
+    Note:
+        With more than one worker, records may reach the handlers out of order.
+
+    Since:
+        v3.3.0
+    """
+
+    def __init__(
+            self,
+            max_queue_size: int = 10_000,
+            workers: int = 1,
+            block_on_full: bool = True,
+            name: str = 'inSPy-Logger-Pipeline'
+            ):
+        """
+        Initializes the pipeline. The worker threads are started on the first enqueued record.
+
+        Parameters:
+            max_queue_size (int, optional):
+                The maximum number of records waiting in the queue. Defaults to 10,000.
+
+            workers (int, optional):
+                The number of worker threads. Defaults to 1.
+
+            block_on_full (bool, optional):
+                Whether callers should wait for room when the queue is full. If False, the record is dropped (and
+                counted in `dropped`). Defaults to True.
+
+            name (str, optional):
+                The name used for the worker threads. Defaults to 'inSPy-Logger-Pipeline'.
+
+        Raises:
+            ValueError:
+                If `max_queue_size` or `workers` is less than 1.
+        """
+        if max_queue_size < 1:
+            raise ValueError(f'Invalid queue size: {max_queue_size}. The queue size must be at least 1.')
+
+        if workers < 1:
+            raise ValueError(f'Invalid number of workers: {workers}. At least one worker is required.')
+
+        self.__queue = queue.Queue(maxsize=max_queue_size)
+        self.__worker_count = workers
+        self.__workers = []
+        self.__block_on_full = block_on_full
+        self.__name = name
+        self.__lock = threading.Lock()
+        self.__closed = False
+        self.__dropped = 0
+
+        _PIPELINES.add(self)
+
+    @property
+    def block_on_full(self) -> bool:
+        """
+        Whether callers wait for room when the queue is full.
+        """
+        return self.__block_on_full
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether the pipeline has been closed.
+        """
+        return self.__closed
+
+    @property
+    def dropped(self) -> int:
+        """
+        The number of records dropped because the queue was full.
+        """
+        return self.__dropped
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the pipeline.
+        """
+        return self.__name
+
+    @property
+    def pending(self) -> int:
+        """
+        The approximate number of records waiting in the queue.
+        """
+        return self.__queue.qsize()
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether the worker threads are running.
+        """
+        return any(worker.is_alive() for worker in self.__workers)
+
+    def start(self) -> None:
+        """
+        Starts the worker threads, if they aren't running already.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            if self.__workers or self.__closed:
+                return
+
+            for index in range(self.__worker_count):
+                worker = threading.Thread(target=self.__work, name=f'{self.__name}-{index}', daemon=True)
+                worker.start()
+                self.__workers.append(worker)
+
+    def enqueue(self, record: logging.LogRecord, handlers: Iterable[logging.Handler]) -> bool:
+        """
+        Places a record on the queue, to be emitted to the given handlers by a worker thread.
+
+        If the pipeline is closed, the record is emitted on the calling thread instead so that nothing is lost
+        during interpreter shutdown.
+
+        Parameters:
+            record (logging.LogRecord):
+                The record to emit.
+
+            handlers (Iterable[logging.Handler]):
+                The handlers to emit the record to.
+
+        Returns:
+            bool:
+                True if the record was queued (or emitted directly), False if it was dropped.
+        """
+        if self.__closed:
+            self.__emit(record, handlers)
+            return True
+
+        if not self.__workers:
+            self.start()
+
+        try:
+            self.__queue.put((record, handlers), block=self.__block_on_full)
+        except queue.Full:
+            self.__dropped += 1
+            return False
+
+        return True
+
+    def close_handlers(self, handlers: Iterable[logging.Handler]) -> None:
+        """
+        Closes handlers once the records queued for them before this call have been emitted.
+
+        Parameters:
+            handlers (Iterable[logging.Handler]):
+                The handlers to close.
+
+        Returns:
+            None
+        """
+        handlers = list(handlers)
+
+        if self.__closed or not self.running:
+            self.__close(handlers)
+            return
+
+        self.__queue.put((_CLOSE_HANDLERS, handlers))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every queued record has been emitted.
+
+        Parameters:
+            timeout (float, optional):
+                The maximum number of seconds to wait. Waits indefinitely if None. Defaults to None.
+
+        Returns:
+            bool:
+                True if the queue was drained, False if the timeout expired first.
+        """
+        pending = self.__queue
+
+        with pending.all_tasks_done:
+            deadline = None if timeout is None else monotonic() + timeout
+
+            while pending.unfinished_tasks:
+                if deadline is None:
+                    pending.all_tasks_done.wait()
+                    continue
+
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return False
+
+                pending.all_tasks_done.wait(remaining)
+
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Drains the queue and stops the worker threads.
+
+        Records enqueued after the pipeline is closed are emitted on the calling thread.
+
+        Parameters:
+            timeout (float, optional):
+                The maximum number of seconds to wait for each worker to finish. Defaults to None.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            if self.__closed:
+                return
+
+            self.__closed = True
+            workers = list(self.__workers)
+
+        for _ in workers:
+            self.__queue.put(_STOP)
+
+        for worker in workers:
+            worker.join(timeout)
+
+    @staticmethod
+    def __close(handlers):
+        for handler in handlers:
+            handler.close()
+
+    @staticmethod
+    def __emit(record, handlers):
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                try:
+                    handler.handle(record)
+                except Exception:
+                    handler.handleError(record)
+
+    def __work(self):
+        pending = self.__queue
+
+        while True:
+            item = pending.get()
+
+            try:
+                if item is _STOP:
+                    return
+
+                record, handlers = item
+
+                if record is _CLOSE_HANDLERS:
+                    self.__close(handlers)
+                else:
+                    self.__emit(record, handlers)
+            finally:
+                pending.task_done()
+
+    def __repr__(self):
+        return f'<AsyncPipeline: {self.name} w/ {self.__worker_count} worker(s), {self.pending} pending>'
+
+
+def get_default_pipeline() -> AsyncPipeline:
+    """
+    Gets the process-wide pipeline shared by every logger that enables asynchronous emission without providing its
+    own pipeline.
+
+    Returns:
+        AsyncPipeline:
+            The default pipeline.
+
+    Since:
+        v3.3.0
+    """
+    global _DEFAULT_PIPELINE
+
+    with _DEFAULT_PIPELINE_LOCK:
+        if _DEFAULT_PIPELINE is None or _DEFAULT_PIPELINE.closed:
+            _DEFAULT_PIPELINE = AsyncPipeline()
+
+        return _DEFAULT_PIPELINE
+
+
+@atexit.register
+def _drain_pipelines():
+    """
+    Drains and closes every pipeline at interpreter exit, before :func:`logging.shutdown` closes the handlers.
+    """
+    for pipeline in list(_PIPELINES):
+        pipeline.close()
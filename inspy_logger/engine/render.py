@@ -0,0 +1,338 @@
+"""
+
+
+Author:
+    Inspyre Softworks
+
+Project:
+    inSPy-Logger
+
+File:
+    inspy_logger/engine/render.py
+
+
+Description:
+    A dedicated console render thread.
+
+    Without it, every thread that logs renders its own records with Rich and writes them to the terminal while
+    holding the console handler's lock, so busy threads queue up behind the terminal. With it, logging threads only
+    append their records to a queue; one thread per process wakes up once per frame interval, renders everything
+    queued since the last frame, and writes the whole frame to each console in one pass (inside the console's own
+    buffer context, so a frame is a single terminal write).
+
+    The queue is bounded; when it's full, records are dropped (and counted) rather than making the caller wait.
+    Whatever is queued is rendered when the interpreter exits.
+
+"""
+import atexit
+import contextlib
+import logging
+import os
+import threading
+from collections import deque
+from time import sleep
+from typing import Optional
+
+
+__all__ = [
+    'ConsoleRenderer',
+    'get_console_renderer',
+]
+
+
+_RENDERER = None
+
+_RENDERER_LOCK = threading.Lock()
+
+
+class ConsoleRenderer:
+    """
+    Renders console records on a single background thread, one batch per frame interval.
+
+    Since:
+        v3.3.0
+    """
+
+    def __init__(self, frame_interval: float = 1 / 30, max_queue_size: int = 100_000,
+                 name: str = 'inSPy-Logger-ConsoleRenderer'):
+        """
+        Initializes the renderer. The thread is started on the first submitted record.
+
+        Parameters:
+            frame_interval (float, optional):
+                The number of seconds between two frames. Defaults to 1/30.
+
+            max_queue_size (int, optional):
+                The maximum number of records waiting to be rendered; past it, records are dropped. Defaults to
+                100,000.
+
+            name (str, optional):
+                The name of the render thread. Defaults to 'inSPy-Logger-ConsoleRenderer'.
+
+        Raises:
+            ValueError:
+                If `frame_interval` is negative or `max_queue_size` is less than 1.
+        """
+        if frame_interval < 0:
+            raise ValueError(f'Invalid frame interval: {frame_interval}. The interval can not be negative.')
+
+        if max_queue_size < 1:
+            raise ValueError(f'Invalid queue size: {max_queue_size}. The queue size must be at least 1.')
+
+        self.frame_interval = frame_interval
+        self.max_queue_size = max_queue_size
+        self.name = name
+
+        self.__pending = deque()
+        self.__wake = threading.Event()
+        self.__idle = threading.Condition()
+        self.__lock = threading.Lock()
+        self.__thread = None
+        self.__closed = False
+        self.__rendering = False
+        self.__pid = os.getpid()
+        self.__dropped = 0
+        self.__frames = 0
+        self.__rendered = 0
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether the renderer has been closed.
+        """
+        return self.__closed
+
+    @property
+    def dropped(self) -> int:
+        """
+        The number of records dropped because the queue was full.
+        """
+        return self.__dropped
+
+    @property
+    def frames(self) -> int:
+        """
+        The number of frames rendered so far.
+        """
+        return self.__frames
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of records waiting to be rendered.
+        """
+        return len(self.__pending)
+
+    @property
+    def rendered(self) -> int:
+        """
+        The number of records rendered so far.
+        """
+        return self.__rendered
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether the render thread is running.
+        """
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def submit(self, record: logging.LogRecord, handler: logging.Handler) -> bool:
+        """
+        Queues a record to be rendered by a handler on the render thread.
+
+        If the renderer is closed, the record is rendered on the calling thread instead.
+
+        Parameters:
+            record (logging.LogRecord):
+                The record, already prepared for hand-off to another thread.
+
+            handler (logging.Handler):
+                The handler that renders it (e.g. a `RichHandler`).
+
+        Returns:
+            bool:
+                True if the record was queued (or rendered directly), False if it was dropped.
+        """
+        if self.__closed:
+            self.__render([(record, handler)])
+            return True
+
+        if len(self.__pending) >= self.max_queue_size:
+            self.__dropped += 1
+            return False
+
+        self.__pending.append((record, handler))
+
+        if not self.running:
+            self.start()
+
+        self.__wake.set()
+
+        return True
+
+    def start(self) -> None:
+        """
+        Starts the render thread, if it isn't running already.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            if self.running or self.__closed:
+                return
+
+            self.__thread = threading.Thread(target=self.__work, name=self.name, daemon=True)
+            self.__thread.start()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every queued record has been rendered.
+
+        Parameters:
+            timeout (float, optional):
+                The maximum number of seconds to wait. Waits indefinitely if None. Defaults to None.
+
+        Returns:
+            bool:
+                True if the queue was drained, False if the timeout expired first.
+        """
+        if not self.running:
+            self.__render_pending()
+            return True
+
+        self.__wake.set()
+
+        with self.__idle:
+            return self.__idle.wait_for(lambda: not self.__pending and not self.__rendering, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Renders whatever is queued and stops the render thread. Records submitted afterwards are rendered on the
+        calling thread.
+
+        Parameters:
+            timeout (float, optional):
+                The maximum number of seconds to wait for the queue to drain. Defaults to None.
+
+        Returns:
+            None
+        """
+        self.flush(timeout)
+
+        with self.__lock:
+            self.__closed = True
+
+        self.__wake.set()
+
+        # Anything submitted while closing is rendered here.
+        self.__render_pending()
+
+    def __work(self):
+        while not self.__closed:
+            self.__wake.wait()
+
+            if self.__closed:
+                break
+
+            # Let the frame fill up, so it's rendered (and written) in one pass.
+            sleep(self.frame_interval)
+            self.__wake.clear()
+
+            self.__render_pending()
+
+    def __render_pending(self):
+        pending = self.__pending
+
+        with self.__idle:
+            self.__rendering = True
+
+        try:
+            batch = []
+
+            while pending:
+                batch.append(pending.popleft())
+
+            if batch:
+                self.__render(batch)
+        finally:
+            with self.__idle:
+                self.__rendering = False
+                self.__idle.notify_all()
+
+    def __render(self, batch):
+        with contextlib.ExitStack() as frame:
+            consoles = {}
+
+            for _, handler in batch:
+                if (console := getattr(handler, 'console', None)) is not None:
+                    consoles.setdefault(id(console), console)
+
+            # Inside a console's buffer context, everything printed is written out at once when the context exits.
+            for console in consoles.values():
+                frame.enter_context(console)
+
+            for record, handler in batch:
+                if record.levelno >= handler.level:
+                    try:
+                        handler.handle(record)
+                    except Exception:
+                        handler.handleError(record)
+
+        self.__frames += 1
+        self.__rendered += len(batch)
+
+    def to_dict(self) -> dict:
+        """
+        Converts the renderer's statistics into a dictionary format.
+
+        Returns:
+            dict:
+                A dictionary containing the renderer's statistics.
+        """
+        return {
+                'Frame Interval': self.frame_interval,
+                'Pending':        self.pending,
+                'Frames':         self.frames,
+                'Rendered':       self.rendered,
+                'Dropped':        self.dropped,
+                }
+
+    @property
+    def forked(self) -> bool:
+        """
+        Whether this renderer was created in another process (before a fork); its thread doesn't exist here.
+        """
+        return self.__pid != os.getpid()
+
+    def __repr__(self):
+        return f'<ConsoleRenderer: {self.name}, {self.pending} pending, {self.frames} frame(s)>'
+
+
+def get_console_renderer() -> ConsoleRenderer:
+    """
+    Gets the process-wide console renderer, creating it on first use (and again in a forked child process).
+
+    Returns:
+        ConsoleRenderer:
+            The renderer.
+
+    Since:
+        v3.3.0
+    """
+    global _RENDERER
+
+    with _RENDERER_LOCK:
+        if _RENDERER is None or _RENDERER.closed or _RENDERER.forked:
+            _RENDERER = ConsoleRenderer()
+
+        return _RENDERER
+
+
+@atexit.register
+def _close_renderer():
+    """
+    Renders the queued console records at interpreter exit, before :func:`logging.shutdown` closes the handlers.
+    """
+    if _RENDERER is not None and not _RENDERER.forked:
+        _RENDERER.close(timeout=5)
@@ -0,0 +1,245 @@
+"""
+
+
+Author:
+    Inspyre Softworks
+
+Project:
+    inSPy-Logger
+
+File:
+    inspy_logger/engine/spill.py
+
+
+Description:
+    Spill storage for buffered log records.
+
+    While a logger is blocked from starting, its :class:`~inspy_logger.engine.handlers.BufferingHandler` can receive
+    far more records than it should hold in memory. Past its capacity, records are encoded compactly (the pickled
+    attribute dictionary of the record, length-prefixed) and appended to a temporary file, one memory-mapped segment
+    at a time. Only the segment being written (or read) is mapped, and reading streams the segments back in order, so
+    neither spilling nor replaying holds every spilled record in memory at once.
+
+"""
+import logging
+import mmap
+import pickle
+import struct
+import tempfile
+from typing import Iterator, List, Optional
+
+
+__all__ = [
+    'SpillFile',
+]
+
+
+_LENGTH = struct.Struct('<I')
+"""The length prefix written before each encoded record."""
+
+
+class _Segment:
+    """
+    A region of the spill file holding length-prefixed records back to back; mapped into memory while in use.
+    """
+
+    __slots__ = ('base', 'file', 'map', 'offset', 'size')
+
+    def __init__(self, file, base: int, size: int):
+        file.truncate(base + size)
+
+        self.file = file
+        self.base = base
+        self.map = mmap.mmap(file.fileno(), size, offset=base)
+        self.offset = 0
+        self.size = size
+
+    def fits(self, length: int) -> bool:
+        return self.offset + _LENGTH.size + length <= self.size
+
+    def write(self, data: bytes) -> None:
+        end = self.offset + _LENGTH.size + len(data)
+
+        _LENGTH.pack_into(self.map, self.offset, len(data))
+        self.map[self.offset + _LENGTH.size:end] = data
+        self.offset = end
+
+    def read(self) -> Iterator[bytes]:
+        if self.map is None:
+            self.map = mmap.mmap(self.file.fileno(), self.size, offset=self.base, access=mmap.ACCESS_READ)
+
+        position = 0
+
+        while position < self.offset:
+            (length,) = _LENGTH.unpack_from(self.map, position)
+            position += _LENGTH.size
+
+            yield self.map[position:position + length]
+            position += length
+
+    def release(self) -> None:
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+
+class SpillFile:
+    """
+    An append-only store of log records, kept in a temporary file written and read through memory-mapped segments.
+
+    Since:
+        v3.3.0
+    """
+
+    def __init__(self, segment_size: int = 4 * 1024 * 1024, directory: Optional[str] = None):
+        """
+        Initializes the store. No file is created until the first record is written.
+
+        Parameters:
+            segment_size (int, optional):
+                The size of each segment, in bytes; rounded up to a multiple of `mmap.ALLOCATIONGRANULARITY`. A record
+                larger than this gets a segment of its own. Defaults to 4 MiB.
+
+            directory (str, optional):
+                The directory to create the spill file in. Defaults to the system's temporary directory.
+        """
+        self.segment_size = self.__round_up(segment_size)
+        self.directory = directory
+
+        self.__file = None
+        self.__segments: List[_Segment] = []
+        self.__count = 0
+
+    @property
+    def bytes_used(self) -> int:
+        """
+        The number of bytes written to the segments so far.
+        """
+        return sum(segment.offset for segment in self.__segments)
+
+    @property
+    def segments(self) -> int:
+        """
+        The number of segments in use.
+        """
+        return len(self.__segments)
+
+    @staticmethod
+    def encode(record: logging.LogRecord) -> bytes:
+        """
+        Encodes a record. Its message must already be merged with its arguments and its exception rendered.
+
+        Parameters:
+            record (logging.LogRecord):
+                The record to encode.
+
+        Returns:
+            bytes:
+                The encoded record.
+
+        Raises:
+            pickle.PicklingError, TypeError, AttributeError:
+                If one of the record's attributes can't be pickled.
+        """
+        return pickle.dumps(record.__dict__, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def decode(data) -> logging.LogRecord:
+        """
+        Decodes a record encoded by :meth:`encode`.
+
+        Parameters:
+            data (bytes-like):
+                The encoded record.
+
+        Returns:
+            logging.LogRecord:
+                The record.
+        """
+        return logging.makeLogRecord(pickle.loads(data))
+
+    def append(self, record: logging.LogRecord) -> None:
+        """
+        Appends a record to the store.
+
+        Parameters:
+            record (logging.LogRecord):
+                The record to append.
+
+        Returns:
+            None
+        """
+        data = self.encode(record)
+        segments = self.__segments
+
+        if not segments or not segments[-1].fits(len(data)):
+            if self.__file is None:
+                self.__file = tempfile.TemporaryFile(prefix='inspy-logger-spill-', dir=self.directory)
+
+            base = 0
+
+            if segments:
+                # Only the segment being written stays mapped.
+                segments[-1].release()
+                base = segments[-1].base + segments[-1].size
+
+            size = max(self.segment_size, self.__round_up(_LENGTH.size + len(data)))
+            segments.append(_Segment(self.__file, base, size))
+
+        segments[-1].write(data)
+        self.__count += 1
+
+    def drain(self) -> Iterator[logging.LogRecord]:
+        """
+        Yields the stored records in the order they were appended, emptying the store. Segments are mapped one at a
+        time, and the spill file is removed once every record has been read.
+
+        Yields:
+            logging.LogRecord:
+                The next record.
+        """
+        file, self.__file = self.__file, None
+        segments, self.__segments = self.__segments, []
+        self.__count = 0
+
+        try:
+            for segment in segments:
+                try:
+                    for data in segment.read():
+                        yield self.decode(data)
+                finally:
+                    segment.release()
+        finally:
+            self.__close(file, segments)
+
+    def close(self) -> None:
+        """
+        Discards every stored record and removes the spill file.
+
+        Returns:
+            None
+        """
+        file, self.__file = self.__file, None
+        segments, self.__segments = self.__segments, []
+        self.__count = 0
+
+        self.__close(file, segments)
+
+    @staticmethod
+    def __close(file, segments):
+        for segment in segments:
+            segment.release()
+
+        if file is not None:
+            file.close()
+
+    @staticmethod
+    def __round_up(size: int) -> int:
+        granularity = mmap.ALLOCATIONGRANULARITY
+        return max(granularity, -(-size // granularity) * granularity)
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __repr__(self):
+        return f'<SpillFile: {len(self)} record(s) in {self.segments} segment(s) of {self.segment_size} bytes>'
@@ -0,0 +1,577 @@
+"""
+
+
+Author:
+    Inspyre Softworks
+
+Project:
+    inSPy-Logger
+
+File:
+    inspy_logger/engine/tracebacks.py
+
+
+Description:
+    Tiered traceback rendering for the console handlers.
+
+    Rendering a traceback with every frame's locals (as the console handler does with Rich) costs milliseconds per
+    record, which adds up when the same error repeats. So the first time a traceback signature (the exception type
+    and the code locations along the traceback) is seen, it's rendered in full; repeats are rendered compactly (a few
+    frames, without locals or source context) or as a single line.
+
+    Logging calls only capture the raw `exc_info` tuple; the tier is picked, and the traceback rendered, by the
+    handler that writes the record (on the console render thread or a pipeline worker, when those are used).
+
+    Loggers also keep an `ExceptionTable`: every logged exception is fingerprinted by its signature and counted, with
+    the times it was first and last seen, and its traceback is only passed on to the handlers once per fingerprint
+    per window; repeats within the window carry a one-line summary instead.
+
+"""
+import hashlib
+import threading
+from functools import lru_cache
+from time import localtime, monotonic, strftime, time
+from typing import Dict, List, Optional, Tuple
+
+from inspy_logger.engine.cache import OnceCache
+
+
+__all__ = [
+    'COMPACT_MAX_FRAMES',
+    'ExceptionTable',
+    'TRACEBACK_TIERS',
+    'TracebackTiers',
+    'format_compact',
+    'format_line',
+    'format_record',
+    'format_repeat',
+    'tiered_rich_handler_class',
+    'traceback_signature',
+]
+
+
+TRACEBACK_TIERS = ('full', 'compact', 'line')
+"""
+The ways a traceback is rendered:
+
+    - 'full': Every frame, with source context (and locals, with Rich, when the handler shows them).
+    - 'compact': At most `COMPACT_MAX_FRAMES` frames, without locals or source context.
+    - 'line': Only the exception type and message, and where it was raised.
+"""
+
+COMPACT_MAX_FRAMES = 4
+"""The number of frames shown by compact tracebacks (Rich shows at least 4)."""
+
+
+def _innermost(tb):
+    """
+    Returns the innermost traceback entry, and the number of entries.
+    """
+    count = 1
+
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+        count += 1
+
+    return tb, count
+
+
+def traceback_signature(exc_info) -> Tuple:
+    """
+    Computes the signature of an exception: its type and the code locations (file and line) along its traceback.
+
+    Only the code objects and line numbers are read, so it's cheap to compute, and equal for the same error raised
+    along the same path, whatever the exception's message or the values involved.
+
+    Parameters:
+        exc_info (tuple):
+            The `(type, value, traceback)` tuple of the exception.
+
+    Returns:
+        tuple:
+            The signature.
+    """
+    exc_type, _, tb = exc_info
+    locations = []
+
+    while tb is not None:
+        locations.append((tb.tb_frame.f_code.co_filename, tb.tb_lineno))
+        tb = tb.tb_next
+
+    return exc_type.__module__, exc_type.__qualname__, tuple(locations)
+
+
+def format_line(exc_info) -> str:
+    """
+    Renders an exception as a single line: ``<type>: <message> (<file>:<line>)``.
+
+    Parameters:
+        exc_info (tuple):
+            The `(type, value, traceback)` tuple of the exception.
+
+    Returns:
+        str:
+            The line.
+    """
+    exc_type, exc_value, tb = exc_info
+    text = f'{exc_type.__qualname__}: {exc_value}' if str(exc_value) else exc_type.__qualname__
+
+    if tb is None:
+        return text
+
+    tb, _ = _innermost(tb)
+    code = tb.tb_frame.f_code
+
+    return f'{text} ({code.co_filename}:{tb.tb_lineno})'
+
+
+def format_compact(exc_info) -> str:
+    """
+    Renders an exception as a short traceback: the innermost frames (up to `COMPACT_MAX_FRAMES`) without source
+    lines, then the exception.
+
+    Parameters:
+        exc_info (tuple):
+            The `(type, value, traceback)` tuple of the exception.
+
+    Returns:
+        str:
+            The traceback, without a trailing newline.
+    """
+    exc_type, exc_value, tb = exc_info
+    frames = []
+
+    while tb is not None:
+        frames.append(tb)
+        tb = tb.tb_next
+
+    lines = [f'Traceback (most recent call last, {len(frames)} frame(s), repeated):']
+
+    if len(frames) > COMPACT_MAX_FRAMES:
+        lines.append(f'  ... {len(frames) - COMPACT_MAX_FRAMES} frame(s) hidden ...')
+
+    for tb in frames[-COMPACT_MAX_FRAMES:]:
+        code = tb.tb_frame.f_code
+        lines.append(f'  File "{code.co_filename}", line {tb.tb_lineno}, in {code.co_name}')
+
+    lines.append(f'{exc_type.__qualname__}: {exc_value}' if str(exc_value) else exc_type.__qualname__)
+
+    return '\n'.join(lines)
+
+
+class TracebackTiers:
+    """
+    Picks how a handler renders each traceback: in full the first time its signature is seen (or again once `ttl`
+    seconds have passed), and with the `repeat_tier` afterwards.
+
+    Not thread-safe on its own; handlers call it while holding their lock.
+
+    Since:
+        v3.3.0
+    """
+
+    def __init__(self, repeat_tier: str = 'compact', max_signatures: Optional[int] = 1024,
+                 ttl: Optional[float] = None):
+        """
+        Initializes the tiers.
+
+        Parameters:
+            repeat_tier (str, optional):
+                How repeated tracebacks are rendered; one of `TRACEBACK_TIERS`. 'full' renders every traceback in
+                full. Defaults to 'compact'.
+
+            max_signatures (int, optional):
+                The maximum number of remembered signatures; past it, the least recently seen one is forgotten (and
+                rendered in full again if it repeats). Defaults to 1024.
+
+            ttl (float, optional):
+                The number of seconds after which a signature is rendered in full again. None means never. Defaults
+                to None.
+
+        Raises:
+            ValueError:
+                If `repeat_tier` is not one of `TRACEBACK_TIERS`.
+        """
+        if repeat_tier not in TRACEBACK_TIERS:
+            raise ValueError(f'Invalid traceback tier: {repeat_tier}. Please provide one of {TRACEBACK_TIERS}.')
+
+        self.repeat_tier = repeat_tier
+        self.seen = OnceCache(max_signatures, ttl)
+
+    def tier(self, exc_info, full: bool = False) -> str:
+        """
+        Picks the tier of a traceback, remembering its signature.
+
+        Parameters:
+            exc_info (tuple):
+                The `(type, value, traceback)` tuple of the exception.
+
+            full (bool, optional):
+                Whether the traceback must be rendered in full anyway, e.g. because the logger's exception table
+                passes it on in full once per window (see `record.full_traceback`). Defaults to False.
+
+        Returns:
+            str:
+                One of `TRACEBACK_TIERS`.
+        """
+        if full:
+            self.seen.issue(traceback_signature(exc_info))
+            return 'full'
+
+        if self.repeat_tier == 'full' or self.seen.issue(traceback_signature(exc_info)):
+            return 'full'
+
+        return self.repeat_tier
+
+    def to_dict(self) -> dict:
+        """
+        Converts the tiers' settings and statistics into a dictionary format.
+
+        Returns:
+            dict:
+                A dictionary containing the settings and statistics.
+        """
+        return {
+                'Repeat Tier': self.repeat_tier,
+                'Full':        self.seen.misses,
+                'Repeated':    self.seen.hits,
+                'Signatures':  len(self.seen),
+                }
+
+    def __repr__(self):
+        return f'<TracebackTiers: repeats {self.repeat_tier}, {len(self.seen)} signature(s)>'
+
+
+def format_repeat(exc_info, fingerprint: str, count: int) -> str:
+    """
+    Renders the one-line summary standing in for the traceback of a repeated exception.
+
+    Parameters:
+        exc_info (tuple):
+            The `(type, value, traceback)` tuple of the exception.
+
+        fingerprint (str):
+            The exception's fingerprint (see :class:`ExceptionTable`).
+
+        count (int):
+            The number of times the exception has been seen.
+
+    Returns:
+        str:
+            The summary.
+    """
+    return f'{format_line(exc_info)} [exception {fingerprint} seen {count} time(s); traceback logged in full earlier]'
+
+
+class _Fingerprint:
+    """
+    The aggregated occurrences of one exception fingerprint.
+    """
+
+    __slots__ = ('count', 'fingerprint', 'first_seen', 'last_full', 'last_seen', 'location', 'message', 'type_name')
+
+    def __init__(self, exc_info, signature, wall_now: float):
+        exc_type, exc_value, _ = exc_info
+        locations = signature[2]
+
+        self.fingerprint = hashlib.blake2b(repr(signature).encode(), digest_size=6).hexdigest()
+        self.type_name = exc_type.__qualname__
+        self.message = str(exc_value)
+        self.location = f'{locations[-1][0]}:{locations[-1][1]}' if locations else ''
+        self.count = 0
+        self.first_seen = wall_now
+        self.last_seen = wall_now
+        self.last_full = None
+
+    def to_dict(self) -> dict:
+        return {
+                'Fingerprint': self.fingerprint,
+                'Type':        self.type_name,
+                'Message':     self.message,
+                'Location':    self.location,
+                'Count':       self.count,
+                'First Seen':  strftime('%Y-%m-%d %H:%M:%S', localtime(self.first_seen)),
+                'Last Seen':   strftime('%Y-%m-%d %H:%M:%S', localtime(self.last_seen)),
+                }
+
+
+class ExceptionTable:
+    """
+    Fingerprints logged exceptions by type and by the code locations along their traceback (see
+    :func:`traceback_signature`), and keeps an aggregated table of their occurrences.
+
+    It also decides which occurrences carry their full traceback: the first one of each fingerprint in every `window`
+    seconds.
+
+    Since:
+        v3.3.0
+    """
+
+    def __init__(self, window: Optional[float] = 60.0, max_fingerprints: int = 1024):
+        """
+        Initializes the table.
+
+        Parameters:
+            window (float, optional):
+                The number of seconds during which a fingerprint's traceback is logged in full only once. 0 logs every
+                traceback in full; None logs each one in full only the first time. Defaults to 60.
+
+            max_fingerprints (int, optional):
+                The maximum number of tracked fingerprints; the oldest one is forgotten past it. Defaults to 1024.
+
+        Raises:
+            ValueError:
+                If `max_fingerprints` is less than 1.
+        """
+        if max_fingerprints < 1:
+            raise ValueError(
+                    f'Invalid number of fingerprints: {max_fingerprints}. At least one fingerprint must be tracked.'
+                    )
+
+        self.window = window
+        self.max_fingerprints = max_fingerprints
+
+        self.__fingerprints: Dict[Tuple, _Fingerprint] = {}
+        self.__lock = threading.Lock()
+        self.__forgotten = 0
+        self.__full = 0
+
+    @property
+    def fingerprints(self) -> int:
+        """
+        The number of tracked fingerprints.
+        """
+        return len(self.__fingerprints)
+
+    @property
+    def full(self) -> int:
+        """
+        The number of occurrences logged with their full traceback.
+        """
+        return self.__full
+
+    @property
+    def occurrences(self) -> int:
+        """
+        The number of occurrences so far, across every tracked fingerprint.
+        """
+        return sum(entry.count for entry in self.__fingerprints.values())
+
+    def observe(self, exc_info) -> Tuple[str, int, bool]:
+        """
+        Counts an occurrence of an exception.
+
+        Parameters:
+            exc_info (tuple):
+                The `(type, value, traceback)` tuple of the exception.
+
+        Returns:
+            Tuple[str, int, bool]:
+                The exception's fingerprint, the number of times it has been seen (this time included), and whether
+                this occurrence should be logged with its full traceback.
+        """
+        signature = traceback_signature(exc_info)
+        now = monotonic()
+        wall_now = time()
+
+        with self.__lock:
+            if (entry := self.__fingerprints.get(signature)) is None:
+                entry = self.__add(exc_info, signature, wall_now)
+
+            entry.count += 1
+            entry.last_seen = wall_now
+
+            window = self.window
+            full = entry.last_full is None or (window is not None and now - entry.last_full >= window)
+
+            if full:
+                entry.last_full = now
+                self.__full += 1
+
+            return entry.fingerprint, entry.count, full
+
+    def table(self) -> List[dict]:
+        """
+        Gets the aggregated table, most frequent fingerprint first.
+
+        Returns:
+            List[dict]:
+                One row per fingerprint, with its type, message (of the first occurrence), innermost location,
+                count, and the times it was first and last seen.
+        """
+        with self.__lock:
+            entries = sorted(self.__fingerprints.values(), key=lambda entry: entry.count, reverse=True)
+
+        return [entry.to_dict() for entry in entries]
+
+    def clear(self) -> None:
+        """
+        Forgets every fingerprint.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            self.__fingerprints.clear()
+
+    def to_dict(self) -> dict:
+        """
+        Converts the table and its statistics into a dictionary format.
+
+        Returns:
+            dict:
+                A dictionary containing the statistics and the aggregated table.
+        """
+        return {
+                'Fingerprints':     self.fingerprints,
+                'Max Fingerprints': self.max_fingerprints,
+                'Window':           self.window,
+                'Occurrences':      self.occurrences,
+                'Full Tracebacks':  self.full,
+                'Forgotten':        self.__forgotten,
+                'Table':            self.table(),
+                }
+
+    def __add(self, exc_info, signature, wall_now) -> _Fingerprint:
+        fingerprints = self.__fingerprints
+
+        if len(fingerprints) >= self.max_fingerprints:
+            # Dictionaries keep insertion order, so the first fingerprint is the oldest one.
+            del fingerprints[next(iter(fingerprints))]
+            self.__forgotten += 1
+
+        entry = fingerprints[signature] = _Fingerprint(exc_info, signature, wall_now)
+
+        return entry
+
+    def __rich__(self):
+        from rich.table import Table
+        from rich import box
+
+        columns = ('Fingerprint', 'Type', 'Location', 'Count', 'First Seen', 'Last Seen')
+        table = Table(box=box.ASCII, padding=(0, 1, 0, 1))
+
+        for column in columns:
+            table.add_column(column, justify='right' if column == 'Count' else 'left', no_wrap=True)
+
+        for row in self.table():
+            table.add_row(*(str(row[column]) for column in columns))
+
+        return table
+
+    def __repr__(self):
+        return f'<ExceptionTable: {self.fingerprints} fingerprint(s), {self.occurrences} occurrence(s)>'
+
+
+def format_record(formatter, record, tier: str) -> str:
+    """
+    Formats a record with its traceback rendered in the given tier.
+
+    Compact and single-line tracebacks are appended to the formatted message without touching `record.exc_text`,
+    which other handlers (e.g. the file handler) may still render in full.
+
+    Parameters:
+        formatter (logging.Formatter):
+            The handler's formatter.
+
+        record (logging.LogRecord):
+            The record, with `exc_info` set.
+
+        tier (str):
+            One of `TRACEBACK_TIERS`.
+
+    Returns:
+        str:
+            The formatted record.
+    """
+    if tier == 'full':
+        return formatter.format(record)
+
+    record.message = record.getMessage()
+
+    if formatter.usesTime():
+        record.asctime = formatter.formatTime(record, formatter.datefmt)
+
+    text = formatter.formatMessage(record)
+    rendered = format_compact(record.exc_info) if tier == 'compact' else format_line(record.exc_info)
+
+    return f'{text}\n{rendered}'
+
+
+@lru_cache(maxsize=None)
+def tiered_rich_handler_class():
+    """
+    Builds the `RichHandler` subclass rendering tracebacks in tiers. Rich is only imported on the first call.
+
+    Returns:
+        type:
+            The class, taking a `traceback_tiers` (:class:`TracebackTiers`) keyword argument.
+    """
+    from rich.logging import RichHandler
+    from rich.markup import escape
+    from rich.traceback import Traceback
+
+    class TieredRichHandler(RichHandler):
+        """
+        A `RichHandler` rendering a traceback with locals only the first time its signature is seen.
+
+        It also skips the plain-text rendering of the traceback that `RichHandler` does (and then discards) for each
+        record with an exception, and escapes text-only tracebacks (`record.exc_text` without `exc_info`, e.g. the
+        summary of a repeated exception) so markup doesn't swallow their square brackets.
+        """
+
+        def __init__(self, *args, traceback_tiers: Optional[TracebackTiers] = None, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.traceback_tiers = traceback_tiers or TracebackTiers()
+
+        def emit(self, record):
+            exc_info = record.exc_info
+            has_exception = self.rich_tracebacks and exc_info and exc_info[0] is not None
+
+            if not has_exception and not (self.markup and record.exc_text and not exc_info):
+                return super().emit(record)
+
+            record.message = record.getMessage()
+            message = record.message
+
+            if self.formatter:
+                if self.formatter.usesTime():
+                    record.asctime = self.formatter.formatTime(record, self.formatter.datefmt)
+
+                message = self.formatter.formatMessage(record)
+
+            traceback = None
+            tier = self.traceback_tiers.tier(exc_info, getattr(record, 'full_traceback', False)) if has_exception \
+                else None
+
+            if tier is None:
+                message = f'{message}\n{escape(record.exc_text)}'
+            elif tier == 'line':
+                line = format_line(exc_info)
+                message = f'{message}\n{escape(line) if self.markup else line}'
+            else:
+                full = tier == 'full'
+                traceback = Traceback.from_exception(
+                        *exc_info,
+                        width=self.tracebacks_width,
+                        code_width=self.tracebacks_code_width,
+                        extra_lines=self.tracebacks_extra_lines if full else 0,
+                        theme=self.tracebacks_theme,
+                        word_wrap=self.tracebacks_word_wrap,
+                        show_locals=self.tracebacks_show_locals and full,
+                        locals_max_length=self.locals_max_length,
+                        locals_max_string=self.locals_max_string,
+                        suppress=self.tracebacks_suppress,
+                        max_frames=self.tracebacks_max_frames if full else COMPACT_MAX_FRAMES,
+                        )
+
+            renderable = self.render(
+                    record=record, traceback=traceback, message_renderable=self.render_message(record, message)
+                    )
+
+            try:
+                self.console.print(renderable)
+            except Exception:
+                self.handleError(record)
+
+    return TieredRichHandler
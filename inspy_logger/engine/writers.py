@@ -0,0 +1,408 @@
+"""
+
+
+Author:
+    Inspyre Softworks
+
+Project:
+    inSPy-Logger
+
+File:
+    inspy_logger/engine/writers.py
+
+
+Description:
+    A pool of shared, reference-counted file and stream writers.
+
+    Every logger in a tree usually writes to the same log file. Instead of each logger's file handler opening its own
+    file descriptor, handlers acquire a :class:`SharedWriter` for the resolved path from the :data:`WRITER_POOL`. All
+    handlers writing to the same file share one stream and one lock, so their lines never interleave, and the file is
+    closed when the last handler using it is closed.
+
+    Console handlers writing to an already open stream (e.g. `sys.stdout`) acquire a :class:`SharedStreamWriter` for
+    it from the same pool. All of them share its lock and its byte buffer, so the lines of every logger reach the
+    stream in the order they were logged, however they're buffered.
+
+    The module also remembers, per directory, which log files are known to exist, so a process creating many loggers
+    for the same file only checks the filesystem once (see :func:`ensure_file`).
+
+"""
+import os
+import threading
+from time import monotonic
+from typing import Dict, Set, Union
+
+
+__all__ = [
+    'SharedStreamWriter',
+    'SharedWriter',
+    'WriterPool',
+    'WRITER_POOL',
+    'clear_ensured_files',
+    'ensure_file',
+]
+
+
+_ENSURED_FILES: Dict[str, Set[str]] = {}
+"""The names of the files known to exist, keyed by their directory."""
+
+_ENSURED_FILES_LOCK = threading.Lock()
+
+
+class SharedWriter:
+    """
+    A file stream (opened on first use) and the lock that serializes every write to it.
+
+    Since:
+        v3.3.0
+    """
+
+    def __init__(self, path: str, mode: str = 'a', encoding=None, errors=None):
+        """
+        Initializes the writer.
+
+        Parameters:
+            path (str):
+                The resolved path of the file.
+
+            mode (str, optional):
+                The mode the file is opened in. Defaults to 'a'.
+
+            encoding (str, optional):
+                The encoding of the file. Defaults to None.
+
+            errors (str, optional):
+                How encoding errors are handled. Defaults to None.
+        """
+        self.path = path
+        self.mode = mode
+        self.encoding = encoding
+        self.errors = errors
+        self.lock = threading.RLock()
+        self.references = 0
+
+        self.__stream = None
+
+    @property
+    def key(self) -> str:
+        """
+        The key of the writer in its pool: the resolved path.
+        """
+        return self.path
+
+    @property
+    def is_open(self) -> bool:
+        """
+        Whether the file has been opened.
+        """
+        return self.__stream is not None
+
+    @property
+    def stream(self):
+        """
+        The shared stream, opening the file if it isn't open yet.
+        """
+        if self.__stream is None:
+            with self.lock:
+                if self.__stream is None:
+                    self.__stream = open(self.path, self.mode, encoding=self.encoding, errors=self.errors)
+
+        return self.__stream
+
+    def close(self) -> None:
+        """
+        Flushes and closes the stream, if it's open.
+        """
+        with self.lock:
+            stream, self.__stream = self.__stream, None
+
+            if stream is not None:
+                stream.flush()
+                stream.close()
+
+    def __repr__(self):
+        return f'<SharedWriter: {self.path} w/ {self.references} reference(s)>'
+
+
+class SharedStreamWriter:
+    """
+    An already open stream (e.g. `sys.stdout`), the lock that serializes every write to it, and a byte buffer shared
+    by every handler writing to it.
+
+    The stream itself is never closed by the writer.
+
+    Since:
+        v3.3.0
+    """
+
+    def __init__(self, stream):
+        """
+        Initializes the writer.
+
+        Parameters:
+            stream (IO):
+                The stream.
+        """
+        self.stream = stream
+        self.encoding = getattr(stream, 'encoding', None) or 'utf-8'
+        self.lock = threading.RLock()
+        self.references = 0
+        self.last_write = monotonic()
+
+        self.__buffer = bytearray()
+
+    @property
+    def key(self) -> int:
+        """
+        The key of the writer in its pool: the identity of the stream (which the writer keeps alive).
+        """
+        return id(self.stream)
+
+    @property
+    def buffered(self) -> int:
+        """
+        The number of bytes currently buffered.
+        """
+        return len(self.__buffer)
+
+    def append(self, data: bytes) -> None:
+        """
+        Adds data to the shared buffer, to be written by the next :meth:`flush` or :meth:`write`.
+
+        Parameters:
+            data (bytes):
+                The encoded data.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.__buffer += data
+
+    def write(self, data: bytes) -> None:
+        """
+        Writes data right away, after anything already buffered, with a single call to the stream.
+
+        Parameters:
+            data (bytes):
+                The encoded data.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.__buffer += data
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered data to the stream with a single call, decoded with the stream's encoding.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.last_write = monotonic()
+
+            if not self.__buffer:
+                return
+
+            data = bytes(self.__buffer)
+            self.__buffer.clear()
+
+            # Written through the text layer, never straight to `stream.buffer`, so the stream still translates
+            # newlines and applies its own error handler (and anything `print`ed to it stays in order).
+            self.stream.write(data.decode(self.encoding, 'replace'))
+            self.stream.flush()
+
+    def close(self) -> None:
+        """
+        Writes out the buffered data. The stream is left open.
+        """
+        self.flush()
+
+    def __repr__(self):
+        name = getattr(self.stream, 'name', None) or repr(self.stream)
+        return f'<SharedStreamWriter: {name} w/ {self.references} reference(s), {self.buffered} byte(s) buffered>'
+
+
+class WriterPool:
+    """
+    A registry of shared writers, keyed by resolved file path (or, for already open streams, by stream) and
+    reference-counted.
+
+    Note:
+        The first handler to acquire a path decides its mode and encoding; later handlers share that stream.
+
+    Since:
+        v3.3.0
+    """
+
+    def __init__(self):
+        self.__writers: Dict[Union[str, int], Union[SharedWriter, SharedStreamWriter]] = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def writers(self) -> Dict[Union[str, int], Union[SharedWriter, SharedStreamWriter]]:
+        """
+        A snapshot of the pooled writers, keyed by resolved path (or stream identity).
+        """
+        with self.__lock:
+            return dict(self.__writers)
+
+    @staticmethod
+    def resolve(path) -> str:
+        """
+        Resolves a path into the key used by the pool.
+
+        Parameters:
+            path (Union[str, os.PathLike]):
+                The path to resolve.
+
+        Returns:
+            str:
+                The resolved, case-normalized path.
+        """
+        return os.path.normcase(os.path.realpath(os.fspath(path)))
+
+    def acquire(self, path, mode: str = 'a', encoding=None, errors=None) -> SharedWriter:
+        """
+        Gets the shared writer for a path, creating it if needed, and adds a reference to it.
+
+        Parameters:
+            path (Union[str, os.PathLike]):
+                The path of the file.
+
+            mode (str, optional):
+                The mode to open the file in, if it isn't pooled yet. Defaults to 'a'.
+
+            encoding (str, optional):
+                The encoding to open the file with, if it isn't pooled yet. Defaults to None.
+
+            errors (str, optional):
+                How encoding errors are handled, if the file isn't pooled yet. Defaults to None.
+
+        Returns:
+            SharedWriter:
+                The shared writer.
+        """
+        key = self.resolve(path)
+
+        with self.__lock:
+            writer = self.__writers.get(key)
+
+            if writer is None:
+                writer = self.__writers[key] = SharedWriter(key, mode, encoding, errors)
+
+            writer.references += 1
+
+        return writer
+
+    def acquire_stream(self, stream) -> SharedStreamWriter:
+        """
+        Gets the shared writer for an already open stream, creating it if needed, and adds a reference to it.
+
+        Parameters:
+            stream (IO):
+                The stream, e.g. `sys.stdout`.
+
+        Returns:
+            SharedStreamWriter:
+                The shared writer.
+        """
+        with self.__lock:
+            writer = self.__writers.get(id(stream))
+
+            if writer is None:
+                writer = self.__writers[id(stream)] = SharedStreamWriter(stream)
+
+            writer.references += 1
+
+        return writer
+
+    def release(self, writer: Union[SharedWriter, SharedStreamWriter]) -> None:
+        """
+        Drops a reference to a shared writer, closing it (or, for a stream, writing out its buffer) once nobody
+        references it anymore.
+
+        Parameters:
+            writer (Union[SharedWriter, SharedStreamWriter]):
+                The writer to release.
+
+        Returns:
+            None
+        """
+        with self.__lock:
+            writer.references -= 1
+
+            if writer.references > 0:
+                return
+
+            if self.__writers.get(writer.key) is writer:
+                del self.__writers[writer.key]
+
+        writer.close()
+
+    def __contains__(self, path) -> bool:
+        key = self.resolve(path) if isinstance(path, (str, os.PathLike)) else id(path)
+
+        with self.__lock:
+            return key in self.__writers
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__writers)
+
+    def __repr__(self):
+        return f'<WriterPool w/ {len(self)} open writer(s)>'
+
+
+WRITER_POOL = WriterPool()
+"""The process-wide writer pool used by the file and plain console handlers of every logger."""
+
+
+def ensure_file(path) -> None:
+    """
+    Creates a file, and its parent directories, if it doesn't exist yet.
+
+    Files already ensured by this process are remembered per directory, so later calls for them don't touch the
+    filesystem.
+
+    Parameters:
+        path (Union[str, os.PathLike]):
+            The path of the file.
+
+    Returns:
+        None
+
+    Since:
+        v3.3.0
+    """
+    directory, name = os.path.split(os.path.abspath(os.fspath(path)))
+
+    with _ENSURED_FILES_LOCK:
+        if name in _ENSURED_FILES.get(directory, ()):
+            return
+
+    os.makedirs(directory, exist_ok=True)
+
+    if not os.path.exists(os.path.join(directory, name)):
+        open(os.path.join(directory, name), 'a').close()
+
+    with _ENSURED_FILES_LOCK:
+        _ENSURED_FILES.setdefault(directory, set()).add(name)
+
+
+def clear_ensured_files() -> None:
+    """
+    Forgets which files are known to exist, e.g. after log files were removed, so they're checked (and re-created)
+    again.
+
+    Returns:
+        None
+
+    Since:
+        v3.3.0
+    """
+    with _ENSURED_FILES_LOCK:
+        _ENSURED_FILES.clear()
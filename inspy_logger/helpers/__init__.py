@@ -1,13 +1,14 @@
-import inspect
 import logging
 import re
-from logging import Formatter
+import sys
 from pathlib import Path
 
 from inspy_logger.__about__ import __PROG__
-from inspy_logger.constants import LEVEL_MAP, DEFAULT_LOGGING_LEVEL, HANDLER_TYPES
+from inspy_logger.constants import LEVEL_MAP, DEFAULT_LOGGING_LEVEL
 from inspy_logger.helpers.decorators import validate_type
 from inspy_logger.helpers.descriptors import RestrictedSetter
+from inspy_logger.helpers.discovery import StackDiscovery, get_discovery, is_inspy_logger_frame
+from inspy_logger.helpers.formatting import CustomFormatter
 from typing import Any, Optional, Union
 
 """
@@ -22,6 +23,8 @@ __all__ = [
     "CustomFormatter",
     "determine_client_prog_name",
     "determine_start_block",
+    "discover_config_vars",
+    "DISCOVERABLE_VARS",
     "find_argument_parser",
     "find_key_by_value",
     "find_valid_vars_in_call_stack",
@@ -215,28 +218,17 @@ VALID_DEV_NAME_VARS = ValidVars(
     mode='strict'
 )
 
-class CustomFormatter(Formatter):
-    """
-    CustomFormatter extends the logging.Formatter class to provide a custom
-    formatting behavior. Specifically, it replaces '<ipython-input-...>'
-    patterns in record.pathname with 'iPython'.
-    """
-
-    def format(self, record):
-        """
-        Replaces <ipython-input-...> pattern in record.pathname with 'iPython'.
-
-        Parameters:
-            record (logging.LogRecord): The record to format.
-
-        Returns:
-            str: The formatted record.
-        """
-        # Replace <ipython-input-...> pattern in record.pathname
-        record.pathname = re.sub(
-            r"<ipython-input-\d+-\w+>|<module>", "iPython", record.pathname
-        )
-        return super().format(record)
+DISCOVERABLE_VARS = (
+    *VALID_LOG_FILE_VARS,
+    *VALID_LOG_LEVEL_VARS,
+    *VALID_ARGS_VARS,
+    *VALID_PROG_NAME_VARS,
+    *VALID_DEV_NAME_VARS.general_vars,
+    *VALID_DEV_NAME_VARS.strict_vars,
+    'BLOCK_LOGGER_START',
+    'INSPY_INTERACTIVE_SESSION',
+)
+"""Every variable a client program can set to configure inSPy-Logger, collected in one call stack walk."""
 
 
 def clean_module_name(module_name):
@@ -252,22 +244,31 @@ def clean_module_name(module_name):
     return re.sub(r"<ipython-input-\d+-\w+>", "iPython", module_name)
 
 
-def determine_level(client_prog_name):
+def determine_level(client_prog_name, discovery: Optional[StackDiscovery] = None):
     """
     Determines the level at which to output logs to the console.
 
+    Parameters:
+        client_prog_name (str):
+            The name of the client program, if any.
+
+        discovery (StackDiscovery, optional):
+            The configuration variables to read. Defaults to walking the caller's current call stack.
+
     Returns:
         int:
             The level at which to output logs to the console.
     """
+    if discovery is None:
+        discovery = StackDiscovery(DISCOVERABLE_VARS, frame=sys._getframe(1))
 
     level = DEFAULT_LOGGING_LEVEL
 
-    if _preemptive_set := check_preemptive_level_set():
+    if _preemptive_set := check_preemptive_level_set(discovery):
         level = translate_to_logging_level(_preemptive_set)
 
     if client_prog_name:
-        if arg_parser := find_argument_parser():
+        if arg_parser := find_argument_parser(discovery):
             from inspy_logger.helpers.command_line import add_argument
             add_argument(arg_parser, level)
             args = arg_parser.parse_args()
@@ -461,24 +462,17 @@ def find_variable_in_call_stack(var_name, ignore_inspy_logger: bool = False, def
     Returns:
         The first occurrence of the variable found in the call stack or the default value.
     """
-    frame = inspect.currentframe()
+    frame = sys._getframe()
 
     try:
         while frame:
-            caller_locals = frame.f_locals
-            caller_globals = frame.f_globals
-            caller_name = frame.f_back.f_code.co_name if frame.f_back else None
+            if ignore_inspy_logger and is_inspy_logger_frame(frame):
+                frame = frame.f_back
+                continue
 
-            for var_source in [caller_locals, caller_globals]:
+            for var_source in [frame.f_locals, frame.f_globals]:
                 if var_name in var_source:
-                    var_value = var_source[var_name]
-
-                    # Get the module where the variable was defined
-                    var_module = inspect.getmodule(frame)
-
-                    if ignore_inspy_logger and (var_module and 'inspy_logger' in var_module.__name__):
-                        continue
-                    return var_value
+                    return var_source[var_name]
 
             frame = frame.f_back  # Move to the previous frame after checking both namespaces
         return default  # Variable not found in the call stack
@@ -486,6 +480,28 @@ def find_variable_in_call_stack(var_name, ignore_inspy_logger: bool = False, def
         del frame
 
 
+def discover_config_vars(refresh: bool = False) -> StackDiscovery:
+    """
+    Gets the configuration variables (see `DISCOVERABLE_VARS`) found in the environment and the call stack.
+
+    The call stack is walked once, on first use, and the result is cached. inSPy-Logger reads its import-time
+    configuration from this cache; the public helpers (`find_argument_parser`, `check_preemptive_level_set`,
+    `determine_level`) walk the caller's current call stack instead, unless they're given a discovery.
+
+    Parameters:
+        refresh (bool, optional):
+            Whether to walk the call stack again instead of using the cached result. Defaults to False.
+
+    Returns:
+        StackDiscovery:
+            The discovered variables.
+
+    Since:
+        v3.3.0
+    """
+    return get_discovery(DISCOVERABLE_VARS, refresh)
+
+
 def iterate_valid_vars(valid_vars, mode='strict'):
     """
     Iterates through the valid variables based on the mode.
@@ -519,24 +535,36 @@ def find_valid_vars_in_call_stack(valid_vars, mode='strict'):
     Returns:
         str: The first valid variable found in the call stack.
     """
-    for var in iterate_valid_vars(valid_vars, mode):
+    valid_vars = list(iterate_valid_vars(valid_vars, mode))
+    discovery = discover_config_vars()
+
+    if all(var in discovery for var in valid_vars):
+        return discovery.first(valid_vars, ignore_inspy_logger=True)
+
+    for var in valid_vars:
         if var_value := find_variable_in_call_stack(var, ignore_inspy_logger=True):
             return var_value
 
 
-def check_preemptive_level_set() -> (str, None):
+def check_preemptive_level_set(discovery: Optional[StackDiscovery] = None) -> (str, None):
     """
     Checks if the preemptive level has been set in the call stack. If not, it checks to see if an argument parser exists
     in the stack
 
+    Parameters:
+        discovery (StackDiscovery, optional):
+            The configuration variables to read. Defaults to walking the caller's current call stack.
+
     Returns:
         bool: True if the preemptive level has been set, False otherwise.
     """
-    for var in VALID_LOG_LEVEL_VARS:
-        if level := find_variable_in_call_stack(var):
-            return level
+    if discovery is None:
+        discovery = StackDiscovery(DISCOVERABLE_VARS, frame=sys._getframe(1))
 
-    if arg_parser := find_argument_parser():
+    if level := discovery.first(VALID_LOG_LEVEL_VARS):
+        return level
+
+    if arg_parser := find_argument_parser(discovery):
         if hasattr(arg_parser, 'parsed') and hasattr(arg_parser.parsed, 'log_level'):
             return arg_parser.parsed.log_level
 
@@ -554,16 +582,10 @@ def determine_client_prog_name() -> (str, None):
         None:
             If the name of the program that is calling the logger cannot be determined.
     """
-    valid_vars = [
-        'PROG',
-        'PROG_NAME',
-        'PROGRAM_NAME',
-        'PROGRAM',
-        'PROGNAME',
-        '__PROG__'
-    ]
-    for var in valid_vars:
-        if prog_name := find_variable_in_call_stack(var, ignore_inspy_logger=True):
+    discovery = discover_config_vars()
+
+    for var in VALID_PROG_NAME_VARS:
+        if prog_name := discovery.get(var, ignore_inspy_logger=True):
             if prog_name != __PROG__:
                 return prog_name
 
@@ -572,10 +594,10 @@ def determine_log_file_path() -> (Path, None):
     """
     Determines the path to the log file.
 
-    This function first checks for the presence of environment variables that specify the path to the log file. If
-    none are found, it then searches the call stack for variables that specify the path to the log file. If none are
-    found, it then searches the call stack for an argument parser and uses the default log file path specified in the
-    argument parser.
+    This function first checks for the presence of environment variables that specify the path to the log file (only
+    the `INSPY_`-prefixed names are read from the environment). If none are found, it then searches the call stack for
+    variables that specify the path to the log file. If none are found, it then searches the call stack for an argument
+    parser and uses the default log file path specified in the argument parser.
 
     Returns:
         str:
@@ -584,12 +606,12 @@ def determine_log_file_path() -> (Path, None):
         None:
             If the path to the log file cannot be determined.
     """
+    discovery = discover_config_vars()
 
-    for var in VALID_LOG_FILE_VARS:
-        if log_file_path := find_variable_in_call_stack(var):
-            return log_file_path
+    if log_file_path := discovery.first(VALID_LOG_FILE_VARS):
+        return log_file_path
 
-    if arg_parser := find_argument_parser():
+    if arg_parser := find_argument_parser(discovery):
         if hasattr(arg_parser, 'parsed') and hasattr(arg_parser.parsed, 'log_file'):
             return arg_parser.parsed.log_file
 
@@ -621,13 +643,18 @@ def determine_start_block() -> bool:
             True if the logger should be blocked from starting, False otherwise.
 
     """
-    return find_variable_in_call_stack("BLOCK_LOGGER_START", False)
+    return discover_config_vars().get("BLOCK_LOGGER_START", default=False)
 
 
-def find_argument_parser():
+def find_argument_parser(discovery: Optional[StackDiscovery] = None):
     """
     Finds the argument parser in the call stack.
 
+    Parameters:
+        discovery (StackDiscovery, optional):
+            The configuration variables to read. Defaults to walking the caller's current call stack, so a parser
+            created after inSPy-Logger was imported is found.
+
     Returns:
         ArgumentParser:
             The argument parser in the call stack.
@@ -635,14 +662,24 @@ def find_argument_parser():
         None:
             If the argument parser cannot be found in the call stack.
     """
-    for var in VALID_ARGS_VARS:
-        if arg_parser := find_variable_in_call_stack(var):
-            return arg_parser
+    if discovery is None:
+        discovery = StackDiscovery(DISCOVERABLE_VARS, frame=sys._getframe(1))
+
+    return discovery.first(VALID_ARGS_VARS)
 
 
 def get_existing_logger(logger_name):
-    from inspy_logger.engine import get_loggers
-    loggers = get_loggers()
+    """
+    Gets an existing logger by name.
+
+    Parameters:
+        logger_name (str):
+            The name of the logger.
+
+    Returns:
+        Logger:
+            The logger, or None if no live logger has that name.
+    """
+    from inspy_logger.engine import Logger
 
-    if logger_name in loggers:
-        return loggers[logger_name]
+    return Logger.get_instance(logger_name)
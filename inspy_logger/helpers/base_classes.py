@@ -1,7 +1,51 @@
 import inspect
+import sys
+import weakref
+
 from inspy_logger import LOG_DEVICE, Logger
 
 
+_METHOD_LOGGERS = weakref.WeakKeyDictionary()
+"""
+Caches the method loggers per logging device, keyed by the code object of the method. A method's code is only looked
+up once its frame has been checked to be running on the instance being asked about.
+"""
+
+
+def _get_calling_method_code(instance, depth=2):
+    """
+    Determines the code of the innermost method running on `instance`.
+
+    Parameters:
+        instance:
+            The instance whose method is being looked for.
+
+        depth (int, optional):
+            The number of frames to skip, counting this function's own. Defaults to 2 (this function and its caller).
+
+    Returns:
+        code:
+            The code object of the calling method.
+
+    Raises:
+        Exception:
+            If no method running on `instance` is found in the call stack.
+    """
+    frame = sys._getframe(depth)
+
+    while frame is not None:
+        code = frame.f_code
+
+        # Frames of code that can't be running on an instance (no `self` local) are skipped without materializing
+        # their locals; a method of the class still has to be running on *this* instance, not another one.
+        if 'self' in code.co_varnames and frame.f_locals.get('self') is instance:
+            return code
+
+        frame = frame.f_back
+
+    raise Exception("Could not determine the calling method's name.")
+
+
 class LoggableDescriptor:
     """
     Descriptor for accessing a logger specific to a class method.
@@ -12,19 +56,21 @@ class LoggableDescriptor:
             # Accessing through the class, not an instance
             return owner.class_logger
 
-        # Determine the calling method's name
-        stack = inspect.stack()
-        # Start from 1 to skip the current __get__ frame
-        for frame_record in stack[1:]:
-            if 'self' in frame_record.frame.f_locals and frame_record.frame.f_locals['self'] is instance:
-                method_name = frame_record.function
+        # Determine the calling method, skipping the current __get__ frame
+        code = _get_calling_method_code(instance)
+        log_device = instance.log_device
 
-                break
-        else:
-            raise Exception("Could not determine the calling method's name.")
+        if (loggers := _METHOD_LOGGERS.get(log_device)) is None:
+            loggers = _METHOD_LOGGERS.setdefault(log_device, {})
+
+        method_logger = loggers.get(code)
+
+        # A closed method logger has left the registry; a new one is created in its place.
+        if method_logger is None or Logger.get_instance(method_logger.name) is not method_logger:
+            # Get a child logger named after the class and method
+            method_logger = loggers[code] = log_device.get_child(code.co_name, evictable=True)
 
-        # Get a child logger named after the class and method
-        return instance.log_device.get_child(method_name)
+        return method_logger
 
 
 def _get_parent_logging_device():
@@ -107,20 +153,20 @@ class Loggable:
             Logger: An instance of the Logger class that represents the child logger.
         """
         if name is None:
-            name = inspect.stack()[1][3]
+            name = sys._getframe(1).f_code.co_name
 
-        full_name = f'{self.class_logger.name}:{name}'
+        full_name = f'{self.class_logger.name}.{name}'
 
         if self.class_logger.has_child(full_name):
-            return self.class_logger.find_child_by_name(full_name, exact_match=True)
+            return self.class_logger.get_child(name, evictable=True)
         if not override:
             self.__is_member__()
 
-        return self.class_logger.get_child(name, **kwargs)
+        return self.class_logger.get_child(name, evictable=True, **kwargs)
 
     def create_logger(self, **kwargs):
         if 'name' not in kwargs:
-            kwargs['name'] = inspect.stack()[1][3]
+            kwargs['name'] = sys._getframe(1).f_code.co_name
         return self.create_child_logger(**kwargs)
 
     def __is_member__(self):
@@ -37,12 +37,12 @@ def property_logging(func):
             log = found
         else:
             self.creating_logger = True
-            log = self.class_logger.add_child(func.__name__)
+            log = self.class_logger.add_child(func.__name__, evictable=True)
             self.creating_logger = False
 
-        log.debug(f'Getting {func.__name__} from instance of {self.__class__.__name__}...', stack_level=4)
+        log.debug(f'Getting {func.__name__} from instance of {self.__class__.__name__}...')
         res = func(self, *args, **kwargs)
-        log.debug(f'Got {func.__name__} from instance of {self.__class__.__name__}: {res}', stack_level=4)
+        log.debug(f'Got {func.__name__} from instance of {self.__class__.__name__}: {res}')
 
         return res
     return wrapper
@@ -83,7 +83,7 @@ def method_logger(func):
     def wrapper(self, *args, **kwargs):
         # Set up the logger with method-specific config.
         name = f'{self.__class__.__name__}.{func.__name__}'
-        logger = self.class_logger.get_child()
+        logger = self.class_logger.get_child(evictable=True)
 
         # Add the logger to the instance for use in the method
         self._current_logger = logger
@@ -0,0 +1,210 @@
+"""
+
+Author:
+    Inspyre Softworks
+
+Project:
+    inSPy-Logger
+
+File:
+    inspy_logger/helpers/discovery.py
+
+
+Description:
+    Single-pass discovery of the configuration variables a client program can set before importing inSPy-Logger
+    (e.g. `PROG_NAME`, `INSPY_LOG_LEVEL`, `BLOCK_LOGGER_START`).
+
+    Instead of walking the whole call stack once per candidate variable, :class:`StackDiscovery` walks it once and
+    records the first occurrence of every candidate in that pass. Namespaced (``INSPY_``-prefixed) variables are
+    looked up in the environment first, which skips the stack entirely for them. The process-wide result is built on
+    first use and cached (see :func:`get_discovery`).
+
+"""
+import os
+import sys
+from typing import Any, Dict, Iterable, Tuple
+
+
+__all__ = [
+    'ENVIRONMENT_PREFIX',
+    'StackDiscovery',
+    'clear_discovery',
+    'get_discovery',
+    'is_inspy_logger_frame',
+]
+
+
+ENVIRONMENT_PREFIX = 'INSPY_'
+"""Only candidates with this prefix are looked up in the environment; generic names like `ARGS` are not."""
+
+_MISSING = object()
+
+_DISCOVERY = None
+
+
+def is_inspy_logger_frame(frame) -> bool:
+    """
+    Checks whether a frame runs code from inSPy-Logger itself.
+
+    Parameters:
+        frame (frame):
+            The frame to check.
+
+    Returns:
+        bool:
+            True if the frame's module belongs to the `inspy_logger` package.
+    """
+    return 'inspy_logger' in (frame.f_globals.get('__name__') or '')
+
+
+class StackDiscovery:
+    """
+    The candidate variables found in the environment and the call stack, collected in one walk.
+
+    For each name, two occurrences are kept: the first one in any frame, and the first one outside inSPy-Logger's
+    own frames (for lookups that ignore inSPy-Logger). Frames are checked from the innermost outward, locals before
+    globals.
+
+    Since:
+        v3.3.0
+    """
+
+    def __init__(self, names: Iterable[str], frame=None, environ=None):
+        """
+        Walks the call stack and collects the candidate variables.
+
+        Parameters:
+            names (Iterable[str]):
+                The names of the candidate variables.
+
+            frame (frame, optional):
+                The innermost frame to start from. Defaults to the caller's frame.
+
+            environ (Mapping, optional):
+                The environment to check first. Defaults to `os.environ`.
+        """
+        self.names = frozenset(names)
+
+        environ = os.environ if environ is None else environ
+
+        self.__found: Dict[str, Tuple[Any, Any]] = {}
+
+        for name in self.names:
+            if name.startswith(ENVIRONMENT_PREFIX) and name in environ:
+                self.__found[name] = (environ[name], environ[name])
+
+        self.__walk(sys._getframe(1) if frame is None else frame)
+
+    def __walk(self, frame):
+        pending = self.names.difference(self.__found)
+        any_frame = {}
+        external = {}
+
+        while frame is not None and pending:
+            internal = is_inspy_logger_frame(frame)
+
+            for namespace in (frame.f_locals, frame.f_globals):
+                for name in [name for name in pending if name in namespace]:
+                    any_frame.setdefault(name, namespace[name])
+
+                    if not internal:
+                        external.setdefault(name, namespace[name])
+
+            pending = pending.difference(external)
+            frame = frame.f_back
+
+        for name in self.names.difference(self.__found):
+            self.__found[name] = (any_frame.get(name, _MISSING), external.get(name, _MISSING))
+
+    def get(self, name: str, ignore_inspy_logger: bool = False, default=None) -> Any:
+        """
+        Gets the first occurrence of a candidate variable.
+
+        Parameters:
+            name (str):
+                The name of the variable.
+
+            ignore_inspy_logger (bool, optional):
+                Whether to skip occurrences in inSPy-Logger's own frames. Defaults to False.
+
+            default (Any, optional):
+                The value to return if the variable wasn't found. Defaults to None.
+
+        Returns:
+            Any:
+                The value of the variable, or `default`.
+
+        Raises:
+            KeyError:
+                If `name` isn't one of the candidates this discovery collected.
+        """
+        value = self.__found[name][1 if ignore_inspy_logger else 0]
+
+        return default if value is _MISSING else value
+
+    def first(self, names: Iterable[str], ignore_inspy_logger: bool = False, default=None) -> Any:
+        """
+        Gets the value of the first candidate, in the given order, that was found with a truthy value.
+
+        Parameters:
+            names (Iterable[str]):
+                The names of the variables, in order of preference.
+
+            ignore_inspy_logger (bool, optional):
+                Whether to skip occurrences in inSPy-Logger's own frames. Defaults to False.
+
+            default (Any, optional):
+                The value to return if none of them was found. Defaults to None.
+
+        Returns:
+            Any:
+                The value of the first variable found, or `default`.
+        """
+        for name in names:
+            if value := self.get(name, ignore_inspy_logger):
+                return value
+
+        return default
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__found
+
+    def __repr__(self):
+        found = sum(any(value is not _MISSING for value in values) for values in self.__found.values())
+        return f'<StackDiscovery: {found}/{len(self.names)} candidate(s) found>'
+
+
+def get_discovery(names: Iterable[str], refresh: bool = False) -> StackDiscovery:
+    """
+    Gets the process-wide discovery, walking the call stack on first use.
+
+    Parameters:
+        names (Iterable[str]):
+            The names of the candidate variables, used when the discovery is (re)built.
+
+        refresh (bool, optional):
+            Whether to walk the call stack again, e.g. after the client program changed its variables. Defaults to
+            False.
+
+    Returns:
+        StackDiscovery:
+            The cached discovery.
+    """
+    global _DISCOVERY
+
+    if _DISCOVERY is None or refresh or not _DISCOVERY.names.issuperset(names):
+        _DISCOVERY = StackDiscovery(names, frame=sys._getframe(1))
+
+    return _DISCOVERY
+
+
+def clear_discovery() -> None:
+    """
+    Drops the cached discovery, so the next lookup walks the call stack again.
+
+    Returns:
+        None
+    """
+    global _DISCOVERY
+
+    _DISCOVERY = None
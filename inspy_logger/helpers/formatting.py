@@ -0,0 +1,349 @@
+"""
+
+Author:
+    Inspyre Softworks
+
+Project:
+    inSPy-Logger
+
+File:
+    inspy_logger/helpers/formatting.py
+
+
+Description:
+    The record formatter used by inSPy-Logger's handlers.
+
+    A %-style format string like ``"%(asctime)s - [%(name)s] - %(message)s"`` is compiled once, when the formatter is
+    created, into a function that reads just the fields it needs from the record, instead of re-interpreting the
+    format string for every record. The ``<ipython-input-...>`` path rewrite only runs in interactive sessions (with a
+    precompiled pattern), and the text formatted for the latest record is shared between identical formatters, so
+    handlers with identical formatters (e.g. several loggers writing the same file) format a record only once.
+
+    Timestamps (``%(asctime)s``) are rendered with ``time.strftime`` once per second and reused for every record in
+    that second, with only the fraction appended. Optionally, they are derived from the monotonic clock, anchored to
+    the wall clock once per process, which keeps them ordered even if the system clock is adjusted, and shown with
+    microsecond resolution.
+
+    Fields bound to the context of a record (``record.context``, see :mod:`inspy_logger.engine.context`) are
+    appended to the formatted message as ``key=value`` pairs.
+
+"""
+import re
+import sys
+import time
+import weakref
+from logging import Formatter
+from typing import Callable, Dict, Optional, Tuple
+
+
+__all__ = [
+    'CustomFormatter',
+    'IPYTHON_PATH_PATTERN',
+    'TIMESTAMP_PRECISIONS',
+    'compile_format',
+    'is_interactive_session',
+]
+
+
+IPYTHON_PATH_PATTERN = re.compile(r"<ipython-input-\d+-\w+>|<module>")
+"""The pattern of the `pathname` parts rewritten to 'iPython' in interactive sessions."""
+
+_LAST_FORMATTED: Dict[tuple, Tuple[weakref.ref, str]] = {}
+"""
+The latest record formatted by each kind of formatter (see `CustomFormatter.cache_key`), by weak reference, and its
+text.
+
+A record reaches a logger's handlers one after the other, so the handlers after the first one find it here. The text
+isn't stored on the record itself, as adding an attribute to every record costs more than the lookup saves. The
+record is only weakly referenced, so it (and its traceback) is released as soon as logging is done with it.
+"""
+
+TIMESTAMP_PRECISIONS = {'ms': ('%s,%03d', 1_000), 'us': ('%s,%06d', 1_000_000)}
+"""The supported timestamp precisions, with the format appending the fraction and the number of units per second."""
+
+_CLOCK_ANCHOR = (time.time_ns(), time.monotonic_ns())
+"""The wall-clock and monotonic times, in nanoseconds, taken together once per process."""
+
+_FIELD_PATTERN = re.compile(r'%\((?P<name>\w+)\)(?P<flags>[#0+ -]*)(?P<width>\d*)(?P<precision>\.\d+)?'
+                            r'(?P<type>[diouxXeEfFgGcrsa])|%%')
+
+_CONVERSIONS = {'s': '!s', 'r': '!r', 'a': '!a'}
+"""The %-style types that map to a conversion, rather than a format type, in a replacement field."""
+
+
+def is_interactive_session() -> bool:
+    """
+    Checks whether the process runs an interactive session (the Python REPL, `python -i`, or IPython/Jupyter).
+
+    Returns:
+        bool:
+            True if the session is interactive.
+    """
+    return hasattr(sys, 'ps1') or bool(sys.flags.interactive) or 'IPython' in sys.modules
+
+
+def _translate_field(match, value: str) -> Optional[str]:
+    """
+    Translates a %-style field into the equivalent f-string replacement field, reading the field's value with the
+    expression `value`, or returns None if it has no exact equivalent.
+    """
+    flags, width, precision, kind = match.group('flags', 'width', 'precision', 'type')
+
+    if kind in 'uc' or (precision and kind in 'dioxX'):
+        return None
+
+    if kind in 'di':
+        value = f'int({value})'
+        kind = 'd'
+
+    zero_padded = '0' in flags and '-' not in flags and kind not in _CONVERSIONS
+    spec = ''
+
+    if width and not zero_padded:
+        # %-style right-aligns everything (strings included) unless the '-' flag is given.
+        spec += '<' if '-' in flags else '>'
+
+    if kind not in _CONVERSIONS:
+        # Sign, alternate-form and zero-padding flags only apply to numbers; %-style ignores them for strings.
+        spec += '+' if '+' in flags else ' ' if ' ' in flags else ''
+        spec += '#' if '#' in flags else ''
+        spec += '0' if zero_padded else ''
+
+    spec += width + (precision or '')
+
+    if kind in _CONVERSIONS:
+        return '{' + value + _CONVERSIONS[kind] + (':' + spec if spec else '') + '}'
+
+    return '{' + value + ':' + spec + kind + '}'
+
+
+def compile_format(fmt: str) -> Optional[Callable[[dict], str]]:
+    """
+    Compiles a %-style format string into a function rendering it from a record's attribute dictionary.
+
+    Parameters:
+        fmt (str):
+            The format string, e.g. ``"%(levelname)s - %(message)s"``.
+
+    Returns:
+        Optional[Callable[[dict], str]]:
+            The function, or None if the format string uses a field the compiler doesn't support (the caller should
+            then fall back to plain %-formatting).
+    """
+    parts = []
+    names = []
+    position = 0
+
+    for match in _FIELD_PATTERN.finditer(fmt):
+        literal = fmt[position:match.start()]
+        position = match.end()
+
+        if '%' in literal:
+            # A stray '%' the pattern didn't understand; let %-formatting report it as usual.
+            return None
+
+        parts.append(literal.replace('{', '{{').replace('}', '}}'))
+
+        if match.group(0) == '%%':
+            parts.append('%')
+            continue
+
+        # Field names are bound as default arguments, so the replacement fields hold no quotes or backslashes
+        # (neither may appear in an f-string expression before Python 3.12), whatever the literal text contains.
+        if (field := _translate_field(match, f'_d[_f{len(names)}]')) is None:
+            return None
+
+        names.append(match.group('name'))
+        parts.append(field)
+
+    literal = fmt[position:]
+
+    if '%' in literal:
+        return None
+
+    parts.append(literal.replace('{', '{{').replace('}', '}}'))
+
+    arguments = ''.join(f', _f{index}={name!r}' for index, name in enumerate(names))
+    source = f'def render(_d{arguments}):\n    return f' + repr(''.join(parts)) + '\n'
+    namespace = {}
+
+    try:
+        exec(compile(source, f'<inspy-logger format {fmt!r}>', 'exec'), namespace)
+    except SyntaxError:
+        return None
+
+    return namespace['render']
+
+
+class CustomFormatter(Formatter):
+    """
+    CustomFormatter extends the logging.Formatter class to provide a custom
+    formatting behavior. Specifically, it replaces '<ipython-input-...>'
+    patterns in record.pathname with 'iPython' (in interactive sessions).
+
+    %-style format strings are compiled once into a specialized function, and the formatted text is shared with the
+    other handlers using an identical formatter.
+    """
+
+    def __init__(
+            self,
+            fmt=None,
+            datefmt=None,
+            style='%',
+            validate=True,
+            *,
+            rewrite_ipython_paths=None,
+            timestamp_precision='ms',
+            monotonic_timestamps=False,
+            **kwargs
+            ):
+        """
+        Initializes the formatter.
+
+        Parameters:
+            fmt, datefmt, style, validate:
+                See :class:`logging.Formatter`.
+
+            rewrite_ipython_paths (bool, optional):
+                Whether to rewrite '<ipython-input-...>' in `record.pathname` to 'iPython'. Defaults to whether the
+                session is interactive (see :func:`is_interactive_session`).
+
+            timestamp_precision (str, optional):
+                The fraction of a second appended to `asctime` when no `datefmt` is given; one of
+                `TIMESTAMP_PRECISIONS` ('ms' for milliseconds, as with :mod:`logging`, or 'us' for microseconds).
+                Defaults to 'ms'.
+
+            monotonic_timestamps (bool, optional):
+                Whether to derive `asctime` from the monotonic clock reading taken when the record was created
+                (`record.monotonic_ns`, set by the inSPy-Logger record factory), anchored to the wall clock once per
+                process, rather than from `record.created`. Timestamps then never go backwards when the system
+                clock is adjusted. Defaults to False.
+
+        Raises:
+            ValueError:
+                If `timestamp_precision` is not one of `TIMESTAMP_PRECISIONS`.
+        """
+        if timestamp_precision not in TIMESTAMP_PRECISIONS:
+            raise ValueError(
+                    f'Invalid timestamp precision: {timestamp_precision}. '
+                    f'Please provide one of {tuple(TIMESTAMP_PRECISIONS)}.'
+                    )
+
+        super().__init__(fmt, datefmt, style, validate, **kwargs)
+
+        self.timestamp_precision = timestamp_precision
+        self.monotonic_timestamps = monotonic_timestamps
+        self.__fraction_format, self.__fraction_units = TIMESTAMP_PRECISIONS[timestamp_precision]
+        self.__rendered_second = (None, None, None)
+
+        if rewrite_ipython_paths is None:
+            rewrite_ipython_paths = is_interactive_session()
+
+        self.rewrite_ipython_paths = rewrite_ipython_paths
+        self.uses_time = self.usesTime()
+        self.render = compile_format(self._fmt) if style == '%' else None
+
+        self.cache_key = (type(self), self._fmt, self.datefmt, self.rewrite_ipython_paths, self.timestamp_precision,
+                          self.monotonic_timestamps)
+        """Identifies the output of this formatter; formatters with equal keys produce identical text for a record."""
+
+    def formatTime(self, record, datefmt=None):
+        """
+        Renders the record's timestamp, running `time.strftime` only once per second.
+
+        Parameters:
+            record (logging.LogRecord):
+                The record.
+
+            datefmt (str, optional):
+                The `time.strftime` format. Defaults to the ISO 8601-like format used by :mod:`logging`, followed by
+                the fraction of a second.
+
+        Returns:
+            str:
+                The rendered timestamp.
+        """
+        units = self.__fraction_units
+
+        if self.monotonic_timestamps and (monotonic_ns := getattr(record, 'monotonic_ns', None)) is not None:
+            wall_ns, anchor_ns = _CLOCK_ANCHOR
+            second, fraction_ns = divmod(wall_ns + monotonic_ns - anchor_ns, 1_000_000_000)
+            fraction = fraction_ns * units // 1_000_000_000
+        else:
+            second = int(record.created)
+            fraction = int(record.msecs) if units == 1_000 else int((record.created - second) * units)
+
+        cached_second, cached_datefmt, prefix = self.__rendered_second
+
+        if second != cached_second or datefmt != cached_datefmt:
+            prefix = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self.__rendered_second = (second, datefmt, prefix)
+
+        if datefmt:
+            return prefix
+
+        # `default_msec_format` may be overridden (or set to None) as with `logging.Formatter`.
+        fraction_format = self.default_msec_format if units == 1_000 else self.__fraction_format
+
+        return fraction_format % (prefix, fraction) if fraction_format else prefix
+
+    def formatMessage(self, record):
+        fields = record.__dict__
+
+        text = super().formatMessage(record) if self.render is None else self.render(fields)
+
+        if (context := fields.get('context')) is not None:
+            # Imported here, as the engine package imports this module.
+            from inspy_logger.engine.context import render_context
+
+            text += render_context(context)
+
+        return text
+
+    def format(self, record):
+        """
+        Formats the record, or returns the text an identical formatter already produced for it.
+
+        Replaces <ipython-input-...> pattern in record.pathname with 'iPython' in interactive sessions.
+
+        Parameters:
+            record (logging.LogRecord): The record to format.
+
+        Returns:
+            str: The formatted record.
+        """
+        key = self.cache_key
+
+        if (last := _LAST_FORMATTED.get(key)) is not None and last[0]() is record:
+            return last[1]
+
+        if self.rewrite_ipython_paths:
+            # Replace <ipython-input-...> pattern in record.pathname
+            record.pathname = IPYTHON_PATH_PATTERN.sub("iPython", record.pathname)
+
+        record.message = record.getMessage()
+
+        if self.uses_time:
+            record.asctime = self.formatTime(record, self.datefmt)
+
+        text = self.formatMessage(record)
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+
+        if record.exc_text:
+            if text[-1:] != '\n':
+                text += '\n'
+
+            text += record.exc_text
+
+        if record.stack_info:
+            if text[-1:] != '\n':
+                text += '\n'
+
+            text += self.formatStack(record.stack_info)
+
+        _LAST_FORMATTED[key] = (weakref.ref(record), text)
+
+        return text
+
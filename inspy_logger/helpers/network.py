@@ -26,9 +26,6 @@ from __future__ import annotations
 # Do our import
 from urllib.parse import quote as url_safe
 
-import requests
-from public_suffix_list import PublicSuffixList
-
 DEFAULT_TEST_HOSTS = [
         ['https', 'inspyre', 'tech'],
         ['https', 'google', 'com']
@@ -43,11 +40,41 @@ hosts = []
 :obj:`list`[:obj:`Host`]:
     A list of host objects that will be used to connect to.
 """
-psl = PublicSuffixList()
 
-URL_SUFFIXES = psl._suffixes
+_LAZY_ATTRIBUTES = ('psl', 'URL_SUFFIXES', 'VALID_TLDS')
+"""
+The module attributes built on first access (see `__getattr__`), since loading the public suffix list is costly:
+
+    - psl (:obj:`PublicSuffixList`): The public suffix list.
+    - URL_SUFFIXES: The known public suffixes.
+    - VALID_TLDS: The valid top-level domains (the same as `URL_SUFFIXES`).
+"""
+
+
+def _get_public_suffixes():
+    """
+    Loads the public suffix list on first use and caches it (and its suffixes) as module attributes.
+
+    Returns:
+        The known public suffixes.
+    """
+    namespace = globals()
+
+    if 'URL_SUFFIXES' not in namespace:
+        from public_suffix_list import PublicSuffixList
+
+        namespace['psl'] = PublicSuffixList()
+        namespace['URL_SUFFIXES'] = namespace['VALID_TLDS'] = namespace['psl']._suffixes
 
-VALID_TLDS = URL_SUFFIXES
+    return namespace['URL_SUFFIXES']
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        _get_public_suffixes()
+        return globals()[name]
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 class Host():
@@ -152,7 +179,7 @@ class Host():
             """
             :obj:`list` of :obj:`str`:  A list of valid top-level domain strings.
             """
-            return VALID_TLDS
+            return _get_public_suffixes()
 
         @property
         def tld(self) -> str:
@@ -169,7 +196,7 @@ class Host():
         def tld(self, new):
             if not isinstance(new, str):
                 raise TypeError(f"New value must be a string not {type(new)}")
-            if new not in URL_SUFFIXES:
+            if new not in _get_public_suffixes():
                 raise ValueError("TLD must be valid!")
 
             self.__tld = new
@@ -321,6 +348,8 @@ class Host():
                 - "DOWN":
                     The host is unreachable.
         """
+        import requests
+
         try:
             requests.head(
                 self.URL.formatted,
@@ -1,13 +1,34 @@
+from __future__ import annotations
+
 import contextlib
-import requests
-from packaging import version as pkg_version
 import sys
-from rich.table import Table
-from rich import print
-from typing import Optional, Literal
+from typing import Optional, Literal, TYPE_CHECKING
 import re
 from pathlib import Path
 
+# `requests`, `packaging` and Rich are only imported by the code that uses them, so parsing the installed version
+# (which happens on every `import inspy_logger`) doesn't load them.
+if TYPE_CHECKING:
+    from packaging import version as pkg_version
+
+
+def print(*objects, **kwargs):
+    """
+    Prints with Rich, importing it on first use.
+    """
+    from rich import print as rich_print
+
+    rich_print(*objects, **kwargs)
+
+
+def _parse_package_version(version_str: str) -> pkg_version.Version:
+    """
+    Parses a version string with `packaging`, importing it on first use.
+    """
+    from packaging import version as pkg_version
+
+    return pkg_version.parse(version_str)
+
 
 # Constants
 RELEASE_MAP = {
@@ -258,7 +279,7 @@ class PyPiVersionInfo:
     def all_versions(self):
         if self.__all_versions is None:
             self.__query_versions()
-        return sorted([pkg_version.parse(v) for v in self.__all_versions])
+        return sorted([_parse_package_version(v) for v in self.__all_versions])
 
     @property
     def checked_for_update(self):
@@ -269,7 +290,7 @@ class PyPiVersionInfo:
         """
         Gets the installed version of the package.
         """
-        return pkg_version.parse(self.__installed)
+        return _parse_package_version(self.__installed)
 
     @property
     def installed_newer_than_latest(self):
@@ -290,7 +311,7 @@ class PyPiVersionInfo:
         """
         if self.__latest_stable is None:
             self.__query_versions()
-        return pkg_version.parse(self.__latest_stable)
+        return _parse_package_version(self.__latest_stable)
 
     @property
     def latest_pre_release(self):
@@ -314,6 +335,8 @@ class PyPiVersionInfo:
         """
         Queries the versions from PyPi.
         """
+        import requests
+
         try:
             response = requests.get(self.__url)
             response.raise_for_status()
@@ -402,6 +425,8 @@ class PyPiVersionInfo:
             Table:
                 A table of versions.
         """
+        from rich.table import Table
+
         table = Table(show_header=False, show_lines=True, expand=True, border_style='bright_blue',
                       row_styles=['none', 'dim'])
 
@@ -464,6 +489,8 @@ class PyPiVersionInfo:
             None
         """
 
+        from rich.table import Table
+
         # Create a table
 
         table = Table(show_header=False, show_lines=True, expand=True, border_style='bright_blue',
@@ -0,0 +1,43 @@
+"""
+Shared fixtures for the inSPy-Logger test suite.
+"""
+import gc
+import itertools
+
+import pytest
+
+from inspy_logger import Logger
+
+
+_NAMES = itertools.count()
+
+
+@pytest.fixture
+def logger_name(request):
+    """
+    A logger name no other test uses, so each test gets fresh `Logger` and `logging.Logger` instances.
+    """
+    return f'tests.{request.node.name}.{next(_NAMES)}'.replace('[', '_').replace(']', '_')
+
+
+@pytest.fixture
+def make_logger(logger_name, tmp_path):
+    """
+    Creates loggers writing their log file under the test's temporary directory, and closes them afterwards.
+    """
+    created = []
+
+    def make(name=None, **kwargs):
+        kwargs.setdefault('file_path', tmp_path)
+        kwargs.setdefault('console_level', 'info')
+        logger = Logger(name or logger_name, **kwargs)
+        created.append(logger)
+
+        return logger
+
+    yield make
+
+    for logger in created:
+        logger.close()
+
+    gc.collect()
@@ -0,0 +1,117 @@
+"""
+Tests for the buffered file handler (`BufferedFileHandler`).
+"""
+import logging
+import time
+
+import pytest
+
+from inspy_logger.engine.handlers import BufferedFileHandler
+from inspy_logger.engine.writers import WriterPool
+
+
+def make_record(message, level=logging.INFO):
+    return logging.LogRecord('tests.buffered', level, __file__, 1, message, None, None)
+
+
+@pytest.fixture
+def make_handler(tmp_path):
+    created = []
+
+    def make(**kwargs):
+        kwargs.setdefault('flush_interval', 0)
+        handler = BufferedFileHandler(tmp_path / 'app.log', pool=WriterPool(), **kwargs)
+        created.append(handler)
+
+        return handler
+
+    yield make
+
+    for handler in created:
+        handler.close()
+
+
+def read_log(tmp_path):
+    path = tmp_path / 'app.log'
+
+    return path.read_text() if path.exists() else ''
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    return condition()
+
+
+def test_lines_are_held_until_the_buffer_fills(make_handler, tmp_path):
+    handler = make_handler(buffer_size=30)
+
+    handler.handle(make_record('first line'))
+    handler.handle(make_record('second line'))
+
+    assert read_log(tmp_path) == ''
+    assert handler.buffered == len('first line\nsecond line\n')
+
+    handler.handle(make_record('third line'))
+
+    assert read_log(tmp_path) == 'first line\nsecond line\nthird line\n'
+    assert handler.buffered == 0
+
+
+def test_records_at_the_flush_level_write_everything_out(make_handler, tmp_path):
+    handler = make_handler(flush_level=logging.ERROR)
+
+    handler.handle(make_record('context', logging.INFO))
+    handler.handle(make_record('warning', logging.WARNING))
+    assert read_log(tmp_path) == ''
+
+    handler.handle(make_record('failure', logging.ERROR))
+
+    assert read_log(tmp_path) == 'context\nwarning\nfailure\n'
+
+
+def test_emit_writes_out_once_the_interval_has_passed(make_handler, tmp_path):
+    handler = make_handler()
+    handler.handle(make_record('early'))
+    assert read_log(tmp_path) == ''
+
+    handler.flush_interval = 0.01
+    time.sleep(0.02)
+    handler.handle(make_record('late'))
+
+    assert read_log(tmp_path) == 'early\nlate\n'
+
+
+def test_quiet_periods_are_flushed_in_the_background(make_handler, tmp_path):
+    handler = make_handler(flush_interval=0.05)
+
+    handler.handle(make_record('idle'))
+    assert read_log(tmp_path) == ''
+
+    assert wait_for(lambda: read_log(tmp_path) == 'idle\n')
+
+
+def test_flush_and_close_write_out_the_buffer(make_handler, tmp_path):
+    handler = make_handler()
+
+    handler.handle(make_record('flushed'))
+    handler.flush()
+    assert read_log(tmp_path) == 'flushed\n'
+
+    handler.handle(make_record('closed'))
+    handler.close()
+    assert read_log(tmp_path) == 'flushed\nclosed\n'
+
+
+def test_logger_can_buffer_its_log_file(make_logger):
+    logger = make_logger(buffered_file={'flush_interval': 0}, file_level='info')
+    handler, = [handler for handler in logger.iter_handlers() if isinstance(handler, BufferedFileHandler)]
+
+    logger.info('buffered')
+    assert handler.buffered
+
+    logger.flush()
+    assert 'buffered' in logger.file_path.read_text()
@@ -0,0 +1,136 @@
+"""
+Tests for the bounded ring buffer of `inspy_logger.engine.handlers.BufferingHandler`.
+"""
+import logging
+
+import pytest
+
+from inspy_logger.engine.handlers import BufferingHandler
+from inspy_logger.engine.messages import BraceMessage, LazyMessage
+
+
+class ListHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def make_record(message, level=logging.INFO, args=None):
+    return logging.LogRecord('tests.buffering', level, __file__, 1, message, args, None)
+
+
+def fill(handler, count, level=logging.INFO):
+    for index in range(count):
+        handler.handle(make_record(f'record {index}', level))
+
+
+def replayed(handler, level=logging.NOTSET):
+    target = ListHandler(level)
+    handler.replay_logs(logging.getLogger('tests.buffering'), handlers=[target])
+
+    return target.messages
+
+
+def test_invalid_configuration_is_rejected():
+    with pytest.raises(ValueError):
+        BufferingHandler(capacity=0)
+
+    with pytest.raises(ValueError):
+        BufferingHandler(policy='drop_newest')
+
+
+def test_drop_oldest_keeps_the_latest_records():
+    handler = BufferingHandler(capacity=3)
+
+    fill(handler, 5)
+
+    assert handler.size == 3
+    assert handler.dropped == 2
+    assert handler.dropped_by_level == {'INFO': 2}
+    assert replayed(handler) == ['record 2', 'record 3', 'record 4']
+    assert handler.size == 0
+
+
+def test_max_bytes_caps_the_buffer():
+    handler = BufferingHandler(capacity=100, max_bytes=3 * BufferingHandler.RECORD_OVERHEAD + 100)
+
+    fill(handler, 10)
+
+    assert len(handler.buffer) == 3
+    assert handler.buffered_bytes <= handler.max_bytes
+
+
+def test_deferred_messages_are_sized_without_rendering():
+    handler = BufferingHandler(capacity=100, max_bytes=2 * BufferingHandler.RECORD_OVERHEAD + 100)
+    rendered = []
+
+    class Value:
+        def __format__(self, format_spec):
+            rendered.append('brace')
+            return 'value'
+
+    for index in range(5):
+        handler.handle(make_record(LazyMessage(lambda: rendered.append('lazy') or 'lazy')))
+        handler.handle(make_record(BraceMessage('brace {}', (Value(),))))
+
+    assert rendered == []
+    assert len(handler.buffer) == 2
+    assert handler.buffered_bytes == 2 * BufferingHandler.RECORD_OVERHEAD + len('brace {}')
+
+    assert replayed(handler) == ['lazy', 'brace value']
+    assert rendered == ['lazy', 'brace']
+    assert handler.buffered_bytes == 0
+
+
+def test_buffered_bytes_stay_consistent_when_dropping_by_level():
+    handler = BufferingHandler(capacity=3, policy='drop_below_level', drop_level=logging.WARNING)
+
+    handler.handle(make_record('warning', logging.WARNING))
+    handler.handle(make_record('debug %s', logging.DEBUG, ('message',)))
+    handler.handle(make_record('error', logging.ERROR))
+    handler.handle(make_record('critical', logging.CRITICAL))
+
+    assert handler.buffered_bytes == 3 * BufferingHandler.RECORD_OVERHEAD + len('warningerrorcritical')
+
+    replayed(handler)
+    assert handler.buffered_bytes == 0
+
+
+def test_drop_below_level_drops_low_records_first():
+    handler = BufferingHandler(capacity=3, policy=BufferingHandler.DROP_BELOW_LEVEL, drop_level=logging.WARNING)
+
+    handler.handle(make_record('info', logging.INFO))
+    handler.handle(make_record('warning 1', logging.WARNING))
+    handler.handle(make_record('warning 2', logging.WARNING))
+    handler.handle(make_record('warning 3', logging.WARNING))
+    handler.handle(make_record('debug', logging.DEBUG))
+
+    assert handler.dropped_by_level == {'DEBUG': 1, 'INFO': 1}
+    assert replayed(handler) == ['warning 1', 'warning 2', 'warning 3']
+
+
+def test_spill_keeps_every_record_in_order(tmp_path):
+    handler = BufferingHandler(capacity=10, policy=BufferingHandler.SPILL, spill_segment_size=4096,
+                               spill_dir=str(tmp_path))
+    handler.handle(make_record('merged %s', args=('argument',)))
+    fill(handler, 500)
+
+    assert handler.spilled == 491
+    assert handler.dropped == 0
+
+    messages = replayed(handler)
+    handler.close()
+
+    assert messages == ['merged argument', *(f'record {index}' for index in range(500))]
+
+
+def test_replay_skips_records_below_the_handlers_levels():
+    handler = BufferingHandler()
+    fill(handler, 2, logging.DEBUG)
+    fill(handler, 1, logging.ERROR)
+
+    assert replayed(handler, logging.WARNING) == ['record 0']
+    assert handler.to_dict()['Buffered'] == 0
@@ -0,0 +1,142 @@
+"""
+Tests for resolving the caller of a logging call (`find_caller` and `Logger.capture_caller`).
+"""
+import logging
+
+from inspy_logger.engine.caller import UNKNOWN_CALLER, find_caller
+from inspy_logger.engine.handlers import DeferredSetupHandler
+from inspy_logger.models.announcement import Announcement
+
+
+class RecordHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.NOTSET)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def attach(logger):
+    handler = RecordHandler()
+    logger.logger.addHandler(handler)
+
+    return handler
+
+
+def log_through(logger, message, **kwargs):
+    logger.info(message, **kwargs)
+
+
+def log_through_two_wrappers(logger, message, **kwargs):
+    log_through(logger, message, **kwargs)
+
+
+def caller_of_this_function():
+    return find_caller()
+
+
+def caller_of_the_caller():
+    return find_caller(stacklevel=2)
+
+
+def test_find_caller_reports_the_calling_function():
+    file_name, line_no, func_name, stack_info = caller_of_this_function()
+
+    assert file_name == __file__
+    assert func_name == 'caller_of_this_function'
+    assert line_no > 0
+    assert stack_info is None
+
+
+def test_find_caller_walks_back_by_stacklevel():
+    assert find_caller(stacklevel=1)[2] == 'test_find_caller_walks_back_by_stacklevel'
+    assert caller_of_the_caller()[2] == 'test_find_caller_walks_back_by_stacklevel'
+
+
+def test_find_caller_formats_the_stack_on_request():
+    stack_info = find_caller(stack_info=True)[3]
+
+    assert stack_info.startswith('Stack (most recent call last):')
+    assert 'test_find_caller_formats_the_stack_on_request' in stack_info
+
+
+def test_records_report_the_caller_not_the_engine(make_logger):
+    logger = make_logger(no_file_logging=True)
+    handler = attach(logger)
+
+    logger.info('direct')
+
+    record = handler.records[-1]
+    assert record.funcName == 'test_records_report_the_caller_not_the_engine'
+    assert record.pathname == record.file_name == __file__
+
+
+def test_nested_wrappers_report_the_innermost_caller_by_default(make_logger):
+    logger = make_logger(no_file_logging=True)
+    handler = attach(logger)
+
+    log_through_two_wrappers(logger, 'wrapped')
+
+    assert handler.records[-1].funcName == 'log_through'
+
+
+def test_stack_level_skips_wrapper_frames(make_logger):
+    logger = make_logger(no_file_logging=True)
+    handler = attach(logger)
+
+    log_through(logger, 'one wrapper', stack_level=3)
+    log_through_two_wrappers(logger, 'two wrappers', stack_level=4)
+
+    assert [record.funcName for record in handler.records[-2:]] == [
+            'test_stack_level_skips_wrapper_frames',
+            'test_stack_level_skips_wrapper_frames'
+            ]
+
+
+def test_announcements_report_the_code_announcing(make_logger):
+    logger = make_logger(no_file_logging=True, announce_on_init=False)
+    handler = attach(logger)
+
+    Announcement(logger, 'Announcing {name}.', 'info').announce()
+
+    assert handler.records[-1].funcName == 'test_announcements_report_the_code_announcing'
+
+
+def test_disabled_capture_records_an_unknown_caller(make_logger):
+    logger = make_logger(no_file_logging=True, capture_caller=False)
+    handler = attach(logger)
+
+    logger.info('anonymous')
+
+    record = handler.records[-1]
+    assert (record.pathname, record.lineno, record.funcName) == UNKNOWN_CALLER[:3]
+    assert record.file_name == UNKNOWN_CALLER[0]
+
+
+def test_capture_is_kept_while_any_handler_wants_it(make_logger):
+    logger = make_logger(no_file_logging=True)
+    handler = attach(logger)
+
+    logger.set_caller_capture(False, 'console')
+    logger.info('still resolved')
+
+    assert handler.records[-1].funcName == 'test_capture_is_kept_while_any_handler_wants_it'
+
+
+def test_handler_opt_outs_apply_before_lazy_handlers_are_built(make_logger):
+    logger = make_logger(lazy_handlers=True)
+    deferred, = logger.logger.handlers
+    assert isinstance(deferred, DeferredSetupHandler)
+
+    logger.set_caller_capture(False, 'console')
+    assert deferred.capture_caller
+
+    logger.set_caller_capture(False, 'file')
+    assert not logger._wants_caller()
+
+    logger.info('built now')
+
+    assert not deferred.pending
+    assert not logger._wants_caller()
+    assert all(not handler.capture_caller for handler in logger.iter_handlers())
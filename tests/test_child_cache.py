@@ -0,0 +1,98 @@
+"""
+Tests for the eviction of dynamically created child loggers (`ChildCache` and `Logger.get_child(evictable=True)`).
+"""
+import gc
+import logging
+import time
+
+from inspy_logger import Logger
+from inspy_logger.engine.cache import ChildCache
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.NOTSET)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def test_cache_evicts_least_recently_used_past_max_size():
+    cache = ChildCache(max_size=2)
+
+    assert cache.add('a') == []
+    assert cache.add('b') == []
+    assert cache.touch('a')
+    assert cache.add('c') == ['b']
+
+
+def test_cache_expires_children_after_ttl():
+    cache = ChildCache(max_size=None, ttl=0.01)
+    cache.add('a')
+
+    time.sleep(0.02)
+
+    assert not cache.touch('a')
+
+
+def test_evicted_child_still_referenced_keeps_working(make_logger):
+    root = make_logger(max_dynamic_children=2)
+    held = root.get_child('held', evictable=True)
+    collected = ListHandler()
+    held.logger.addHandler(collected)
+
+    for index in range(5):
+        root.get_child(f'other{index}', evictable=True)
+
+    assert held not in root.children
+
+    held.info('after eviction')
+    held.warning('still handled')
+
+    assert collected.messages[-2:] == ['after eviction', 'still handled']
+    assert any(not isinstance(handler, ListHandler) for handler in held.logger.handlers)
+
+
+def test_looking_up_an_evicted_child_reattaches_it(make_logger):
+    root = make_logger(max_dynamic_children=1)
+    held = root.get_child('held', evictable=True)
+    root.get_child('other', evictable=True)
+
+    assert root.get_child('held', evictable=True) is held
+    assert held in root.children
+
+
+def test_evicted_children_release_their_logging_loggers(make_logger):
+    root = make_logger(max_dynamic_children=10)
+    before = len(logging.Logger.manager.loggerDict)
+
+    for index in range(500):
+        root.get_child(f'dynamic{index}', evictable=True)
+
+    gc.collect()
+
+    assert len(root.children) == 10
+    assert len([name for name in Logger.dynamic_instances if name.startswith(f'{root.name}.')]) == 10
+    assert len(logging.Logger.manager.loggerDict) <= before + 10
+
+
+def test_closing_a_logger_removes_it_from_the_logging_manager(make_logger):
+    root = make_logger()
+    child = root.get_child('child')
+
+    child.close()
+
+    assert child.name not in logging.Logger.manager.loggerDict
+    assert logging.getLogger(child.name).parent is root.logger
+
+
+def test_closing_a_child_detaches_it_from_its_parent(make_logger):
+    root = make_logger()
+    child = root.get_child('child')
+
+    child.close()
+
+    assert child not in root.children
+    assert not root.has_child(child.name)
+    assert root.get_child('child') is not child
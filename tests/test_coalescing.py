@@ -0,0 +1,106 @@
+"""
+Tests for collapsing runs of identical consecutive records (`inspy_logger.engine.handlers.CoalescingHandler`).
+"""
+import logging
+import time
+
+import pytest
+
+from inspy_logger.engine.handlers import CoalescingHandler
+from inspy_logger.engine.messages import wrap_message
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.NOTSET)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def make_record(message, args=None, level=logging.ERROR):
+    return logging.LogRecord('tests.coalescing', level, __file__, 1, message, args, None)
+
+
+def test_window_must_be_positive():
+    with pytest.raises(ValueError):
+        CoalescingHandler([], window=0)
+
+
+def test_repeats_are_summarized_when_a_different_record_arrives():
+    target = ListHandler()
+    handler = CoalescingHandler([target], window=60)
+
+    for _ in range(4):
+        handler.handle(make_record('failed %s', ('db',)))
+
+    handler.handle(make_record('recovered'))
+
+    assert target.messages[0] == 'failed db'
+    assert target.messages[1].startswith('Last message repeated 3 more time(s)')
+    assert target.messages[2] == 'recovered'
+    assert handler.coalesced == 3
+    handler.close()
+
+
+def test_different_arguments_are_not_collapsed():
+    target = ListHandler()
+    handler = CoalescingHandler([target], window=60)
+
+    handler.handle(make_record('failed %s', ('db',)))
+    handler.handle(make_record('failed %s', ('cache',)))
+    handler.flush()
+
+    assert target.messages == ['failed db', 'failed cache']
+    handler.close()
+
+
+def test_pending_summary_is_emitted_once_the_window_runs_out():
+    target = ListHandler()
+    handler = CoalescingHandler([target], window=0.05)
+
+    for _ in range(3):
+        handler.handle(make_record('storm'))
+
+    deadline = time.monotonic() + 2
+
+    while len(target.messages) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert target.messages[0] == 'storm'
+    assert target.messages[1].startswith('Last message repeated 2 more time(s)')
+    assert len(target.messages) == 2
+    handler.close()
+
+
+def test_summary_waits_for_the_window():
+    target = ListHandler()
+    handler = CoalescingHandler([target], window=60)
+
+    handler.handle(make_record('storm'))
+    handler.handle(make_record('storm'))
+    handler.flush_if_due()
+
+    assert target.messages == ['storm']
+
+    handler.close()
+
+    assert target.messages[1].startswith('Last message repeated 1 more time(s)')
+
+
+def test_repeated_lazy_messages_are_collapsed():
+    target = ListHandler()
+    handler = CoalescingHandler([target], window=60)
+
+    for _ in range(3):
+        for host in ('db', 'db', 'db', 'cache'):
+            handler.handle(make_record(wrap_message(lambda: f'failed {host}', ())[0]))
+
+    handler.flush()
+
+    assert [message.split(' over ')[0] for message in target.messages] == [
+            'failed db', 'Last message repeated 2 more time(s)', 'failed cache'
+            ] * 3
+    assert handler.coalesced == 6
+    handler.close()
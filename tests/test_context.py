@@ -0,0 +1,133 @@
+"""
+Tests for the structured context bound to logged records (`inspy_logger.engine.context`).
+"""
+import asyncio
+import logging
+import threading
+
+import pytest
+
+from inspy_logger.engine import context
+from inspy_logger.helpers.formatting import CustomFormatter
+
+
+class RecordHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.NOTSET)
+        self.records = []
+        self.setFormatter(CustomFormatter('%(message)s'))
+
+    def emit(self, record):
+        self.records.append(record)
+
+    @property
+    def lines(self):
+        return [self.format(record) for record in self.records]
+
+
+@pytest.fixture(autouse=True)
+def empty_context():
+    context.clear_context()
+    yield
+    context.clear_context()
+
+
+@pytest.fixture
+def log(make_logger):
+    log = make_logger(no_file_logging=True)
+    log.logger.handlers[:] = [RecordHandler()]
+
+    return log
+
+
+def handler_of(log):
+    return log.logger.handlers[0]
+
+
+def test_records_have_no_context_when_nothing_is_bound(log):
+    log.info('plain')
+
+    record = handler_of(log).records[0]
+
+    assert not hasattr(record, 'context')
+    assert handler_of(log).lines == ['plain']
+
+
+def test_bound_fields_are_set_on_records_and_rendered(log):
+    token = log.bind(request_id=42, user='jane doe')
+    log.info('handling')
+    log.reset_context(token)
+    log.info('done')
+
+    first, second = handler_of(log).records
+
+    assert first.context == {'request_id': 42, 'user': 'jane doe'}
+    assert not hasattr(second, 'context')
+    assert handler_of(log).lines == ["handling request_id=42 user='jane doe'", 'done']
+
+
+def test_contextualize_and_unbind(log):
+    log.bind(service='api')
+
+    with log.contextualize(request_id=1) as bound:
+        assert bound == {'service': 'api', 'request_id': 1}
+        log.unbind('service')
+        log.info('inside')
+
+    log.info('outside')
+
+    assert handler_of(log).lines == ['inside request_id=1', 'outside service=api']
+    assert log.context == {'service': 'api'}
+
+
+def test_records_of_the_same_context_share_it(log):
+    log.bind(request_id=7)
+    log.info('one')
+    log.info('two')
+
+    first, second = handler_of(log).records
+
+    assert first.context is second.context
+
+
+def test_threads_have_their_own_context(log):
+    log.bind(thread='main')
+    seen = {}
+
+    def worker():
+        seen['initial'] = dict(log.context)
+        log.bind(thread='worker')
+        log.info('from worker')
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    log.info('from main')
+
+    assert seen['initial'] == {}
+    assert handler_of(log).lines == ['from worker thread=worker', 'from main thread=main']
+
+
+def test_asyncio_tasks_inherit_a_copy_of_the_context(log):
+    async def handle(request_id):
+        log.bind(request_id=request_id)
+        await asyncio.sleep(0)
+        log.info('handled')
+
+    async def main():
+        log.bind(service='api')
+        await asyncio.gather(handle(1), handle(2))
+        log.info('finished')
+
+    asyncio.run(main())
+
+    assert handler_of(log).lines == [
+            'handled service=api request_id=1',
+            'handled service=api request_id=2',
+            'finished service=api',
+            ]
+
+
+def test_render_context_quotes_strings_with_spaces():
+    assert context.render_context({'empty': '', 'name': 'a b', 'count': 3}) == " empty='' name='a b' count=3"
+    assert context.render_context({}) == ''
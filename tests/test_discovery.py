@@ -0,0 +1,54 @@
+"""
+Tests for the discovery of client configuration variables (`inspy_logger.helpers.discovery`) and the public helpers
+that read them.
+"""
+import logging
+from types import SimpleNamespace
+
+from inspy_logger.helpers import (
+    DISCOVERABLE_VARS,
+    check_preemptive_level_set,
+    determine_level,
+    discover_config_vars,
+    find_argument_parser,
+)
+from inspy_logger.helpers.discovery import StackDiscovery
+
+
+def test_discovery_prefers_the_innermost_frame_and_external_frames():
+    def inner():
+        LOG_LEVEL = 'debug'  # noqa: F841
+
+        return StackDiscovery(['LOG_LEVEL', 'ARGS'])
+
+    LOG_LEVEL = 'error'  # noqa: F841
+    discovery = inner()
+
+    assert discovery.get('LOG_LEVEL') == 'debug'
+    assert discovery.get('ARGS', default='missing') == 'missing'
+
+
+def test_only_namespaced_variables_are_read_from_the_environment():
+    discovery = StackDiscovery(['INSPY_LOG_LEVEL', 'LOG_LEVEL'],
+                               environ={'INSPY_LOG_LEVEL': 'warning', 'LOG_LEVEL': 'debug'})
+
+    assert discovery.get('INSPY_LOG_LEVEL') == 'warning'
+    assert discovery.get('LOG_LEVEL') is None
+
+
+def test_public_helpers_see_variables_set_after_import():
+    discover_config_vars()
+    ARGS = SimpleNamespace(parsed=SimpleNamespace(log_level='error'))
+
+    assert find_argument_parser() is ARGS
+    assert check_preemptive_level_set() == 'error'
+    assert determine_level(None) == logging.ERROR
+
+
+def test_public_helpers_read_a_given_discovery():
+    LOG_LEVEL = 'warning'  # noqa: F841
+    discovery = StackDiscovery(DISCOVERABLE_VARS)
+    LOG_LEVEL = 'critical'  # noqa: F841
+
+    assert check_preemptive_level_set(discovery) == 'warning'
+    assert check_preemptive_level_set() == 'critical'
@@ -0,0 +1,135 @@
+"""
+Tests for exception fingerprinting (`inspy_logger.engine.tracebacks.ExceptionTable`) and its use by `Logger`.
+"""
+import time
+
+import pytest
+
+from inspy_logger.engine.tracebacks import ExceptionTable
+
+
+def fail(message='boom'):
+    raise ValueError(message)
+
+
+def capture(message='boom'):
+    try:
+        fail(message)
+    except ValueError as error:
+        return type(error), error, error.__traceback__
+
+
+def capture_key_error():
+    try:
+        {}['missing']
+    except KeyError as error:
+        return type(error), error, error.__traceback__
+
+
+def test_full_traceback_once_per_window():
+    table = ExceptionTable(window=0.05)
+
+    first, second = table.observe(capture('one')), table.observe(capture('two'))
+
+    assert first[0] == second[0]
+    assert (first[1:], second[1:]) == ((1, True), (2, False))
+
+    time.sleep(0.06)
+
+    assert table.observe(capture())[1:] == (3, True)
+    assert table.full == 2
+    assert table.occurrences == 3
+
+
+@pytest.mark.parametrize('window, expected', [(0, [True, True, True]), (None, [True, False, False])])
+def test_window_edge_values(window, expected):
+    table = ExceptionTable(window=window)
+
+    assert [table.observe(capture())[2] for _ in range(3)] == expected
+
+
+def test_table_aggregates_by_fingerprint_and_forgets_the_oldest():
+    table = ExceptionTable(max_fingerprints=1)
+
+    table.observe(capture())
+    table.observe(capture())
+    table.observe(capture_key_error())
+
+    rows = table.table()
+
+    assert table.fingerprints == 1
+    assert table.to_dict()['Forgotten'] == 1
+    assert len(rows) == 1
+    assert rows[0]['Type'] == 'KeyError'
+    assert rows[0]['Count'] == 1
+
+
+def test_invalid_table_size_is_rejected():
+    with pytest.raises(ValueError):
+        ExceptionTable(max_fingerprints=0)
+
+
+def log_failure(log):
+    try:
+        fail()
+    except ValueError:
+        log.error('request failed', exc_info=True)
+
+
+def test_logger_summarizes_repeats_within_the_window(make_logger, capsys):
+    log = make_logger(console_mode='plain', no_file_logging=True, exception_window=60)
+
+    for _ in range(3):
+        log_failure(log)
+
+    output = capsys.readouterr().out
+
+    assert output.count('Traceback (most recent call last)') == 1
+    assert output.count('traceback logged in full earlier') == 2
+    assert 'seen 3 time(s)' in output
+    assert log.exceptions.occurrences == 3
+
+
+def test_console_renders_in_full_again_once_the_window_expires(make_logger, capsys):
+    log = make_logger(console_mode='plain', no_file_logging=True, exception_window=0.05,
+                      repeated_tracebacks='compact')
+
+    log_failure(log)
+    log_failure(log)
+    time.sleep(0.06)
+    log_failure(log)
+
+    output = capsys.readouterr().out
+
+    assert output.count('Traceback (most recent call last):') == 2
+    assert 'repeated):' not in output
+    assert log.exceptions.full == 2
+
+
+def test_console_tiers_still_apply_when_every_traceback_is_passed_on(make_logger, capsys):
+    log = make_logger(console_mode='plain', no_file_logging=True, exception_window=0, repeated_tracebacks='compact')
+
+    log_failure(log)
+    log_failure(log)
+
+    output = capsys.readouterr().out
+
+    assert output.count('Traceback (most recent call last):') == 1
+    assert output.count('repeated):') == 1
+
+
+def test_rich_console_keeps_the_summary_and_bracketed_messages(make_logger, capsys, monkeypatch):
+    monkeypatch.setenv('COLUMNS', '400')
+    log = make_logger(console_mode='rich', no_file_logging=True, exception_window=60)
+
+    for _ in range(2):
+        try:
+            fail('bad [value]')
+        except ValueError:
+            log.error('request failed', exc_info=True)
+
+    summary = [line for line in capsys.readouterr().out.splitlines() if 'seen 2 time(s)' in line]
+
+    assert len(summary) == 1
+    assert 'ValueError: bad [value] (' in summary[0]
+    assert 'traceback logged in full earlier]' in summary[0]
@@ -0,0 +1,103 @@
+"""
+Tests for the fast path of disabled levels (`Logger.refresh_level_methods`).
+"""
+import logging
+
+import pytest
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.NOTSET)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def fast_logger(make_logger, **kwargs):
+    kwargs.setdefault('console_level', 'warning')
+    kwargs.setdefault('file_level', 'warning')
+    logger = make_logger(no_file_logging=True, fast_path=True, **kwargs)
+    handler = ListHandler()
+    logger.logger.addHandler(handler)
+
+    return logger, handler
+
+
+def disabled_methods(logger):
+    return [name for name in logger.LEVEL_METHODS if name in vars(logger)]
+
+
+def log_every_level(logger):
+    for name in ('debug', 'info', 'warning', 'error'):
+        getattr(logger, name)(name)
+
+
+def test_disabled_levels_are_swapped_for_no_ops(make_logger):
+    logger, handler = fast_logger(make_logger)
+
+    assert disabled_methods(logger) == ['internal', 'debug', 'info']
+
+    log_every_level(logger)
+
+    assert handler.messages == ['warning', 'error']
+
+
+def test_lowering_the_level_re_enables_methods(make_logger):
+    logger, handler = fast_logger(make_logger)
+
+    logger.set_level(console_level='debug')
+    log_every_level(logger)
+
+    assert disabled_methods(logger) == ['internal']
+    assert handler.messages == ['debug', 'info', 'warning', 'error']
+
+
+def test_raising_the_level_disables_methods(make_logger):
+    logger, handler = fast_logger(make_logger)
+
+    logger.set_level(console_level='error', file_level='error')
+    log_every_level(logger)
+
+    assert disabled_methods(logger) == ['internal', 'debug', 'info', 'warning']
+    assert handler.messages == ['error']
+
+
+def test_level_setters_refresh_the_methods(make_logger):
+    logger, handler = fast_logger(make_logger)
+
+    logger.console_level = 'info'
+    log_every_level(logger)
+
+    assert handler.messages == ['info', 'warning', 'error']
+
+
+def test_direct_level_changes_apply_after_a_refresh(make_logger):
+    logger, handler = fast_logger(make_logger)
+
+    logger.logger.setLevel(logging.DEBUG)
+    logger.debug('still swapped')
+    logger.refresh_level_methods()
+    logger.debug('re-enabled')
+
+    assert handler.messages == ['re-enabled']
+
+
+@pytest.mark.parametrize('fast_path', [False, True])
+def test_same_records_are_emitted_with_and_without_fast_path(make_logger, fast_path):
+    logger = make_logger(no_file_logging=True, console_level='info', fast_path=fast_path)
+    handler = ListHandler()
+    logger.logger.addHandler(handler)
+
+    log_every_level(logger)
+    logger.set_level(console_level='debug')
+    log_every_level(logger)
+
+    assert handler.messages == ['info', 'warning', 'error', 'debug', 'info', 'warning', 'error']
+
+
+def test_methods_are_regular_without_fast_path(make_logger):
+    logger = make_logger(no_file_logging=True, console_level='critical')
+
+    assert disabled_methods(logger) == []
@@ -0,0 +1,101 @@
+"""
+Tests for the compiled %-style formats and the shared output of `inspy_logger.helpers.formatting.CustomFormatter`.
+"""
+import gc
+import logging
+import weakref
+
+import pytest
+
+from inspy_logger.helpers.formatting import CustomFormatter, compile_format
+
+
+FIELDS = {
+        'name':      'app.worker',
+        'levelname': 'INFO',
+        'levelno':   20,
+        'lineno':    7,
+        'message':   'hello',
+        'created':   1234.5678,
+        'negative':  -42,
+        'ratio':     0.125,
+        }
+
+
+@pytest.mark.parametrize('fmt', [
+    '%(levelname)s - [%(name)s] - %(message)s',
+    '%(levelname)-8s|%(levelname)8s|%(message).3s|%(message)r|%(message)a',
+    '%(lineno)d %(lineno)5d %(lineno)-5d| %(lineno)05d %(negative)+d %(negative) d %(levelno)i',
+    '%(lineno)x %(lineno)#x %(lineno)X %(lineno)o %(lineno)#o',
+    '%(created)f %(created).2f %(created)10.1f %(ratio)e %(ratio).3E %(ratio)g %(ratio)+G %(created)08.2f',
+    '100%% done: %(message)s %%',
+    '''it's "%(message)s"''',
+    'braces {literal} {{ }} and a backslash \\ %(message)s \\n',
+    'no fields at all',
+])
+def test_compiled_output_matches_percent_formatting(fmt):
+    render = compile_format(fmt)
+
+    assert render is not None
+    assert render(FIELDS) == fmt % FIELDS
+
+
+@pytest.mark.parametrize('fmt', ['%(lineno)c', '%(lineno).2d', '%(lineno)u', 'stray % sign %(message)s'])
+def test_formats_without_an_exact_equivalent_are_not_compiled(fmt):
+    assert compile_format(fmt) is None
+
+
+def test_formatter_accepts_both_quote_types():
+    formatter = CustomFormatter('''it's "%(message)s"''')
+    record = logging.LogRecord('tests.formatting', logging.INFO, __file__, 1, 'hi', None, None)
+
+    assert formatter.render is not None
+    assert formatter.format(record) == '''it's "hi"'''
+
+
+class CountingMessage:
+    renders = 0
+
+    def __str__(self):
+        CountingMessage.renders += 1
+        return 'counted'
+
+
+def make_record():
+    return logging.LogRecord('tests.formatting', logging.INFO, __file__, 1, CountingMessage(), None, None)
+
+
+def test_identical_formatters_share_the_text_of_a_record():
+    first, second = CustomFormatter('%(levelname)s %(message)s'), CustomFormatter('%(levelname)s %(message)s')
+    other = CustomFormatter('%(message)s')
+    record = make_record()
+    CountingMessage.renders = 0
+
+    assert first.format(record) == second.format(record) == 'INFO counted'
+    assert CountingMessage.renders == 1
+
+    assert other.format(record) == 'counted'
+    assert CountingMessage.renders == 2
+
+
+def test_shared_text_is_not_reused_for_another_record():
+    formatter = CustomFormatter('%(message)s')
+
+    first = make_record()
+    formatter.format(first)
+    second = make_record()
+    second.msg = 'different'
+
+    assert formatter.format(second) == 'different'
+
+
+def test_shared_text_does_not_keep_the_record_alive():
+    formatter = CustomFormatter('%(message)s')
+    record = make_record()
+    reference = weakref.ref(record)
+
+    formatter.format(record)
+    del record
+    gc.collect()
+
+    assert reference() is None
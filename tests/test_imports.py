@@ -0,0 +1,52 @@
+"""
+Tests that a plain `import inspy_logger` defers its heavy dependencies until they're used.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+DEFERRED_MODULES = ('rich', 'requests', 'public_suffix_list', 'packaging', 'pypattyrn')
+
+
+def loaded_after(code):
+    """Runs `code` in a fresh interpreter and returns the deferred modules loaded by then."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(PROJECT_ROOT), os.environ.get('PYTHONPATH')])))
+    script = f'{code}\nimport sys\nprint(" ".join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))'
+
+    stdout = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, env=env, check=True).stdout
+
+    return set(stdout.splitlines()[-1].split()) if stdout.strip() else set()
+
+
+def test_plain_import_loads_no_deferred_module():
+    assert loaded_after('import inspy_logger') == set()
+
+
+@pytest.mark.parametrize('code', [
+    'import inspy_logger; inspy_logger.Logger("deferred").debug("below the console level")',
+    'from inspy_logger.constants import LEVEL_MAP',
+    ])
+def test_unused_features_stay_deferred(code):
+    assert 'rich' not in loaded_after(code)
+
+
+def test_rich_loads_on_the_first_rich_console_emit():
+    code = 'import inspy_logger; inspy_logger.Logger("deferred", console_mode="rich").warning("shown")'
+
+    assert 'rich' in loaded_after(code)
+
+
+def test_lazy_attributes_resolve_on_first_access():
+    import inspy_logger
+    from inspy_logger import constants
+    from inspy_logger.engine.handlers import ConsoleHandler
+    from inspy_logger.helpers.base_classes import Loggable
+
+    assert inspy_logger.Loggable is Loggable
+    assert constants.HANDLER_TYPES['console'] is ConsoleHandler
@@ -0,0 +1,54 @@
+"""
+Tests for the child index and the logger-name trie (`inspy_logger.engine.index`).
+"""
+from inspy_logger import Logger
+from inspy_logger.engine.index import NameTrie
+
+
+def test_trie_prefix_search_matches_partial_last_segment():
+    trie = NameTrie(['App', 'App.child', 'App.child.method', 'App.other', 'Application'])
+
+    assert sorted(trie.iter_prefix('App.chi')) == ['App.child', 'App.child.method']
+    assert sorted(trie.iter_prefix('App')) == ['App', 'App.child', 'App.child.method', 'App.other', 'Application']
+    assert list(trie.iter_prefix('Missing.child')) == []
+
+
+def test_trie_discard_prunes_empty_branches():
+    trie = NameTrie(['App', 'App.child.method'])
+
+    trie.discard('App.child.method')
+
+    assert 'App.child.method' not in trie
+    assert 'App' in trie
+    assert len(trie) == 1
+    assert list(trie.iter_prefix('App.')) == []
+
+
+def test_get_child_resolves_dotted_names_through_the_index(make_logger):
+    root = make_logger()
+
+    method = root.get_child('child.method')
+
+    assert method.name == f'{root.name}.child.method'
+    assert root.get_child('child.method') is method
+    assert root.find_child_by_name(f'{root.name}.child', exact_match=True) is root.get_child('child')
+    assert root.find_child_by_name(f'{root.name}.missing', exact_match=True) == []
+
+
+def test_substring_search_still_scans_children(make_logger):
+    root = make_logger()
+    root.get_child('Alpha')
+    root.get_child('beta')
+
+    assert [child.name for child in root.find_child_by_name('alpha', case_sensitive=False)] == [f'{root.name}.Alpha']
+
+
+def test_find_loggers_by_prefix_searches_every_depth(make_logger):
+    root = make_logger()
+    deep = root.get_child('service.worker')
+
+    found = Logger.find_loggers_by_prefix(f'{root.name}.serv')
+
+    assert deep in found
+    assert root.get_child('service') in found
+    assert root not in found
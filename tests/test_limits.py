@@ -0,0 +1,184 @@
+"""
+Tests for per-call-site rate limiting and sampling (`SiteLimiter`, `SitePolicy` and `rate_limited`).
+"""
+import logging
+import threading
+
+import pytest
+
+from inspy_logger.engine import limits
+from inspy_logger.engine.limits import SiteLimiter, SitePolicy, rate_limited
+
+
+class RecordHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.NOTSET)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(limits, 'monotonic', clock)
+
+    return clock
+
+
+SITE_CODE = compile('', '<site>', 'exec')
+
+SITE = (SITE_CODE, 1)
+
+
+def test_invalid_policies_are_rejected():
+    with pytest.raises(ValueError):
+        SitePolicy(rate=0)
+
+    with pytest.raises(ValueError):
+        SitePolicy(rate=1, burst=0)
+
+    with pytest.raises(ValueError):
+        SitePolicy(sample=1.5)
+
+
+def test_token_bucket_allows_a_burst_then_the_rate(clock):
+    limiter = SiteLimiter(report_interval=60)
+    policy = SitePolicy(rate=2, burst=3)
+
+    assert [limiter.check(SITE, policy) is not None for _ in range(5)] == [True, True, True, False, False]
+
+    clock.now += 0.5
+    assert limiter.check(SITE, policy) is not None
+    assert limiter.check(SITE, policy) is None
+
+    assert (limiter.passed, limiter.suppressed) == (4, 3)
+
+
+def test_suppressions_are_reported_after_the_interval(clock):
+    limiter = SiteLimiter(report_interval=10)
+    policy = SitePolicy(rate=1)
+
+    limiter.check(SITE, policy)
+    limiter.check(SITE, policy)
+    limiter.check(SITE, policy)
+
+    clock.now += 1
+    assert limiter.check(SITE, policy) == (0, 0.0)
+
+    clock.now += 10
+    assert limiter.check(SITE, policy) == (2, 11.0)
+
+
+def test_pending_reports_each_suppression_once(clock):
+    limiter = SiteLimiter()
+    policy = SitePolicy(rate=1)
+
+    for _ in range(4):
+        limiter.check(SITE, policy)
+
+    assert [(key, count) for key, count, _ in limiter.pending()] == [(SITE, 3)]
+    assert list(limiter.pending()) == []
+
+
+def test_deterministic_sampling_keeps_every_nth_record():
+    limiter = SiteLimiter()
+    policy = SitePolicy(sample=0.25, deterministic=True)
+
+    kept = [limiter.check(SITE, policy) is not None for _ in range(8)]
+
+    assert kept == [True, False, False, False, True, False, False, False]
+
+
+def test_random_sampling_keeps_about_the_fraction(monkeypatch):
+    values = iter([0.05, 0.5, 0.09, 0.95])
+    monkeypatch.setattr(limits.random, 'random', lambda: next(values))
+    limiter = SiteLimiter()
+    policy = SitePolicy(sample=0.1)
+
+    assert [limiter.check(SITE, policy) is not None for _ in range(4)] == [True, False, True, False]
+
+
+def test_oldest_sites_are_forgotten_past_max_sites():
+    limiter = SiteLimiter(max_sites=2)
+    policy = SitePolicy(rate=1)
+
+    for line in range(3):
+        limiter.check((SITE_CODE, line), policy)
+
+    assert limiter.sites == 2
+    assert limiter.to_dict()['Forgotten'] == 1
+
+
+def test_totals_can_be_read_while_sites_are_added():
+    limiter = SiteLimiter(max_sites=100_000)
+    policy = SitePolicy(rate=1_000_000)
+    done = threading.Event()
+    errors = []
+
+    def read_totals():
+        while not done.is_set():
+            try:
+                limiter.passed, limiter.suppressed
+            except RuntimeError as error:
+                errors.append(error)
+
+    reader = threading.Thread(target=read_totals)
+    reader.start()
+
+    try:
+        for line in range(50_000):
+            limiter.check((SITE_CODE, line), policy)
+    finally:
+        done.set()
+        reader.join()
+
+    assert errors == []
+    assert limiter.passed == 50_000
+
+
+def test_logging_calls_are_rate_limited_per_call_site(make_logger, clock):
+    logger = make_logger(no_file_logging=True)
+    handler = RecordHandler()
+    logger.logger.addHandler(handler)
+
+    policy = SitePolicy(rate=1, burst=2)
+
+    for index in range(5):
+        logger.info('first site %d', index, rate_limit=policy)
+        logger.info('second site %d', index, rate_limit=policy)
+
+    assert [record.getMessage() for record in handler.records] == [
+            'first site 0', 'second site 0', 'first site 1', 'second site 1'
+            ]
+    assert logger.site_limiter.suppressed == 6
+
+    assert logger.report_suppressed() == 6
+    assert [record.suppressed for record in handler.records[-2:]] == [3, 3]
+
+
+def test_rate_limited_applies_to_the_calls_in_the_decorated_function(make_logger, clock):
+    logger = make_logger(no_file_logging=True)
+    handler = RecordHandler()
+    logger.logger.addHandler(handler)
+
+    @rate_limited(sample=0.5, deterministic=True)
+    def poll(index):
+        logger.info('poll %d', index)
+
+    for index in range(6):
+        poll(index)
+
+    logger.info('undecorated')
+
+    assert poll.site_policy.sample == 0.5
+    assert [record.getMessage() for record in handler.records] == ['poll 0', 'poll 2', 'poll 4', 'undecorated']
@@ -0,0 +1,159 @@
+"""
+Tests for deferred log messages (`inspy_logger.engine.messages`) through the `Logger` level methods.
+"""
+import logging
+
+import pytest
+
+from inspy_logger.engine.messages import BraceMessage, Lazy, LazyMessage, lazy, wrap_message
+
+
+LEVEL_METHODS = ('internal', 'debug', 'info', 'warning', 'error')
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.NOTSET)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class Expensive:
+    """Counts how many times it's rendered."""
+
+    renders = 0
+
+    def __repr__(self):
+        Expensive.renders += 1
+        return '<Expensive>'
+
+    __str__ = __repr__
+
+
+def compute(value):
+    Expensive.renders += 1
+    return value
+
+
+def call_every_form(log, method_name):
+    method = getattr(log, method_name)
+
+    method('%s and %r', Expensive(), Expensive())
+    method('{} and {!r}', Expensive(), Expensive(), style='{')
+    method(lambda: f'{Expensive()}')
+    method('Computed: %s', lazy(compute, 42))
+
+
+def collecting_logger(make_logger, **kwargs):
+    log = make_logger(no_file_logging=True, **kwargs)
+    handler = ListHandler()
+    log.logger.handlers[:] = [handler]
+
+    return log, handler
+
+
+@pytest.mark.parametrize('fast_path', [False, True])
+def test_nothing_is_rendered_at_disabled_levels(make_logger, fast_path):
+    log, handler = collecting_logger(make_logger, console_level='critical', fast_path=fast_path)
+    Expensive.renders = 0
+
+    for method_name in LEVEL_METHODS:
+        call_every_form(log, method_name)
+
+    assert Expensive.renders == 0
+    assert handler.messages == []
+
+
+def test_every_form_renders_at_enabled_levels(make_logger):
+    log, handler = collecting_logger(make_logger, console_level='internal')
+
+    for method_name in LEVEL_METHODS:
+        call_every_form(log, method_name)
+
+    expected = ['<Expensive> and <Expensive>', '<Expensive> and <Expensive>', '<Expensive>', 'Computed: 42']
+
+    assert handler.messages == expected * len(LEVEL_METHODS)
+
+
+def test_only_lambdas_are_called():
+    def named():
+        raise AssertionError('called')
+
+    class Message:
+        def __str__(self):
+            return 'instance'
+
+    assert wrap_message(named, ())[0] is named
+    assert wrap_message(Message, ())[0] is Message
+    assert wrap_message(print, ())[0] is print
+    assert isinstance(wrap_message(lambda: 'deferred', ())[0], LazyMessage)
+
+
+def test_callables_other_than_lambdas_are_logged_as_objects(make_logger):
+    log, handler = collecting_logger(make_logger)
+
+    def named():
+        raise AssertionError('called')
+
+    log.info(named)
+    log.info(LazyMessage(lambda: 'explicitly deferred'))
+
+    assert handler.messages == [str(named), 'explicitly deferred']
+
+
+def test_lazy_values_support_numeric_formatting():
+    assert '%x' % lazy(int, '255') == 'ff'
+    assert '%d and %.1f' % (lazy(int, '3'), lazy(float, '2.5')) == '3 and 2.5'
+    assert '{:>4}'.format(lazy(str, 'ab')) == '  ab'
+
+
+def test_lazy_value_is_computed_once():
+    calls = []
+    value = Lazy(calls.append, 'called')
+
+    str(value)
+    str(value)
+
+    assert value.evaluated
+    assert calls == ['called']
+
+
+def test_deferrals_of_the_same_code_over_the_same_values_are_equal():
+    def defer(value):
+        return LazyMessage(lambda: f'value: {value}')
+
+    assert defer(1) == defer(1)
+    assert hash(defer(1)) == hash(defer(1))
+    assert defer(1) != defer(2)
+    assert LazyMessage(lambda: 'a') != LazyMessage(lambda: 'a')
+    assert lazy(int, '3') == lazy(int, '3')
+    assert lazy(int, '3') != lazy(int, '4')
+    assert lazy(int, '3') != LazyMessage(int, '3')
+
+
+def test_comparing_deferrals_renders_nothing():
+    calls = []
+    first, second = (LazyMessage(lambda: calls.append('rendered') or 'message') for _ in range(2))
+
+    assert first == second
+    assert calls == []
+
+
+def test_brace_style_is_set_per_logger_and_inherited(make_logger):
+    log, handler = collecting_logger(make_logger, message_style='{')
+
+    log.info('{} took {:.1f}s', 'job', 1.25)
+
+    assert handler.messages == ['job took 1.2s']
+    assert log.get_child('child').message_style == '{'
+    assert BraceMessage('{}', ('a',)) == BraceMessage('{}', ('a',))
+
+
+def test_error_forwards_its_arguments(make_logger):
+    log, handler = collecting_logger(make_logger)
+
+    log.error('failed: %s', 'disk full')
+
+    assert handler.messages == ['failed: disk full']
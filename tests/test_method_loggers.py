@@ -0,0 +1,72 @@
+"""
+Tests for the per-method loggers of `inspy_logger.helpers.base_classes.LoggableDescriptor`.
+"""
+from inspy_logger.helpers.base_classes import LoggableDescriptor
+
+
+def make_worker_class(log_device):
+    class Worker:
+        method_logger = LoggableDescriptor()
+
+        def __init__(self):
+            self.log_device = log_device
+
+        def run(self):
+            return self.method_logger
+
+        def inspect(self, other):
+            return other.method_logger
+
+        def delegate(self, other):
+            return other.inspect(self)
+
+    return Worker
+
+
+def test_method_logger_is_named_after_the_calling_method(make_logger):
+    Worker = make_worker_class(make_logger())
+
+    assert Worker().run().name.endswith('.run')
+
+
+def test_cached_method_is_not_reused_for_another_instance(make_logger):
+    Worker = make_worker_class(make_logger())
+    first, second = Worker(), Worker()
+
+    # Caches `inspect` as a method of `Worker`, running on `first`.
+    assert first.inspect(first).name.endswith('.inspect')
+
+    # `inspect` now runs on `first` while asking about `second`, whose innermost running method is `delegate`.
+    assert second.delegate(first).name.endswith('.delegate')
+
+
+def test_method_logger_is_cached_per_method(make_logger, monkeypatch):
+    log_device = make_logger()
+    Worker = make_worker_class(log_device)
+    worker = Worker()
+    first = worker.run()
+
+    calls = []
+    get_child = log_device.get_child
+
+    def counting_get_child(*args, **kwargs):
+        calls.append(args)
+        return get_child(*args, **kwargs)
+
+    monkeypatch.setattr(log_device, 'get_child', counting_get_child)
+
+    assert Worker().run() is first
+    assert worker.inspect(worker) is not first
+    assert calls == [('inspect',)]
+
+
+def test_closed_method_logger_is_replaced(make_logger):
+    Worker = make_worker_class(make_logger())
+    worker = Worker()
+    first = worker.run()
+
+    first.close()
+    second = worker.run()
+
+    assert second is not first
+    assert second.name == first.name
@@ -0,0 +1,179 @@
+"""
+Tests for the asynchronous emission pipeline (`AsyncPipeline` and `QueueingHandler`).
+"""
+import logging
+import threading
+
+import pytest
+
+from inspy_logger.engine.handlers import QueueingHandler
+from inspy_logger.engine.pipeline import AsyncPipeline
+
+
+class RecordHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.NOTSET)
+        self.records = []
+        self.threads = []
+        self.closed = False
+
+    def emit(self, record):
+        self.records.append(record)
+        self.threads.append(threading.current_thread())
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+
+class BlockingHandler(RecordHandler):
+    """
+    Holds the worker thread on its first record until released, so records pile up in the queue.
+    """
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def emit(self, record):
+        self.entered.set()
+        self.release.wait(5)
+        super().emit(record)
+
+
+def make_record(message, level=logging.INFO):
+    return logging.LogRecord('tests.pipeline', level, __file__, 1, message, None, None)
+
+
+@pytest.fixture
+def pipeline():
+    pipeline = AsyncPipeline(name='tests-pipeline')
+
+    yield pipeline
+
+    pipeline.close(timeout=5)
+
+
+def test_invalid_sizes_are_rejected():
+    with pytest.raises(ValueError):
+        AsyncPipeline(max_queue_size=0)
+
+    with pytest.raises(ValueError):
+        AsyncPipeline(workers=0)
+
+
+def test_records_are_emitted_by_a_worker_thread(pipeline):
+    handler = RecordHandler()
+
+    for index in range(100):
+        pipeline.enqueue(make_record(f'record {index}'), [handler])
+
+    assert pipeline.flush(timeout=5)
+    assert pipeline.pending == 0
+    assert [record.msg for record in handler.records] == [f'record {index}' for index in range(100)]
+    assert threading.current_thread() not in handler.threads
+
+
+def test_flush_times_out_while_a_worker_is_busy(pipeline):
+    handler = BlockingHandler()
+    pipeline.enqueue(make_record('held'), [handler])
+    handler.entered.wait(5)
+
+    assert not pipeline.flush(timeout=0.05)
+
+    handler.release.set()
+    assert pipeline.flush(timeout=5)
+
+
+def test_records_below_a_handler_level_are_skipped(pipeline):
+    handler = RecordHandler()
+    handler.setLevel(logging.WARNING)
+
+    pipeline.enqueue(make_record('quiet', logging.INFO), [handler])
+    pipeline.enqueue(make_record('loud', logging.ERROR), [handler])
+    pipeline.flush(timeout=5)
+
+    assert [record.msg for record in handler.records] == ['loud']
+
+
+def test_full_queue_drops_records_when_not_blocking():
+    pipeline = AsyncPipeline(max_queue_size=2, block_on_full=False)
+    handler = BlockingHandler()
+
+    try:
+        pipeline.enqueue(make_record('held'), [handler])
+        handler.entered.wait(5)
+
+        results = [pipeline.enqueue(make_record(f'queued {index}'), [handler]) for index in range(5)]
+
+        assert results == [True, True, False, False, False]
+        assert pipeline.dropped == 3
+    finally:
+        handler.release.set()
+        pipeline.close(timeout=5)
+
+    assert [record.msg for record in handler.records] == ['held', 'queued 0', 'queued 1']
+
+
+def test_close_drains_the_queue_and_stops_the_workers():
+    pipeline = AsyncPipeline()
+    handler = RecordHandler()
+
+    for index in range(50):
+        pipeline.enqueue(make_record(f'record {index}'), [handler])
+
+    pipeline.close(timeout=5)
+
+    assert pipeline.closed
+    assert not pipeline.running
+    assert len(handler.records) == 50
+
+
+def test_records_after_close_are_emitted_on_the_calling_thread():
+    pipeline = AsyncPipeline()
+    pipeline.close()
+    handler = RecordHandler()
+
+    assert pipeline.enqueue(make_record('late'), [handler])
+    assert handler.threads == [threading.current_thread()]
+
+
+def test_handlers_are_closed_after_their_queued_records(pipeline):
+    handler = BlockingHandler()
+    pipeline.enqueue(make_record('held'), [handler])
+    handler.entered.wait(5)
+    pipeline.enqueue(make_record('queued'), [handler])
+
+    pipeline.close_handlers([handler])
+    assert not handler.closed
+
+    handler.release.set()
+    pipeline.flush(timeout=5)
+
+    assert handler.closed
+    assert [record.msg for record in handler.records] == ['held', 'queued']
+
+
+def test_queueing_handler_merges_arguments_on_the_calling_thread(pipeline):
+    target = RecordHandler()
+    queueing = QueueingHandler(pipeline, [target])
+    values = ['before']
+    record = logging.LogRecord('tests.pipeline', logging.INFO, __file__, 1, 'value: %s', (values,), None)
+
+    queueing.handle(record)
+    values[0] = 'after'
+    queueing.flush()
+
+    assert target.records[0].msg == "value: ['before']"
+    assert target.records[0].args is None
+
+
+def test_logger_flush_waits_for_the_pipeline(make_logger, pipeline, tmp_path):
+    logger = make_logger(async_emit=pipeline, file_level='info')
+
+    for index in range(20):
+        logger.info('record %d', index)
+
+    assert logger.flush(timeout=5)
+    assert any(isinstance(handler, QueueingHandler) for handler in logger.logger.handlers)
+    assert logger.file_path.read_text().count('record ') == 20
@@ -0,0 +1,91 @@
+"""
+Tests for the plain console engine (`inspy_logger.engine.handlers.PlainConsoleHandler`).
+"""
+import io
+import logging
+import sys
+
+from inspy_logger.engine.handlers import PlainConsoleHandler
+from inspy_logger.engine.writers import WRITER_POOL
+
+
+def make_record(message, level=logging.INFO):
+    return logging.LogRecord('tests.plain', level, __file__, 1, message, None, None)
+
+
+def make_handler(stream, **options):
+    options.setdefault('show_time', False)
+    options.setdefault('show_path', False)
+
+    return PlainConsoleHandler(stream, **options)
+
+
+def test_lines_are_written_right_away_by_default():
+    stream = io.StringIO()
+    handler = make_handler(stream)
+
+    handler.handle(make_record('first'))
+
+    assert stream.getvalue() == 'INFO     first\n'
+    handler.close()
+
+
+def test_handlers_on_the_same_stream_share_a_writer_and_lock():
+    stream = io.StringIO()
+    first, second = make_handler(stream), make_handler(stream)
+
+    assert first.writer is second.writer is WRITER_POOL.acquire_stream(stream)
+    assert first.lock is second.lock
+
+    WRITER_POOL.release(first.writer)
+    first.close()
+    second.close()
+
+    assert stream not in WRITER_POOL
+    assert not stream.closed
+
+
+def test_buffered_lines_keep_their_order_across_handlers():
+    stream = io.StringIO()
+    first = make_handler(stream, buffer_size=1024, flush_interval=0)
+    second = make_handler(stream, buffer_size=1024, flush_interval=0)
+
+    first.handle(make_record('1'))
+    second.handle(make_record('2'))
+    first.handle(make_record('3'))
+
+    assert stream.getvalue() == ''
+    assert first.buffered == second.buffered > 0
+
+    second.handle(make_record('4', logging.WARNING))
+
+    assert stream.getvalue().split() == ['INFO', '1', 'INFO', '2', 'INFO', '3', 'WARNING', '4']
+
+    first.close()
+    second.close()
+
+
+def test_buffered_lines_are_written_on_close():
+    stream = io.StringIO()
+    handler = make_handler(stream, buffer_size=1024, flush_interval=0)
+
+    handler.handle(make_record('pending'))
+    handler.close()
+
+    assert stream.getvalue() == 'INFO     pending\n'
+
+
+def test_loggers_writing_to_stdout_keep_the_logging_order(make_logger, monkeypatch):
+    raw = io.BytesIO()
+    stdout = io.TextIOWrapper(raw, encoding='utf-8', write_through=True)
+    monkeypatch.setattr(sys, 'stdout', stdout)
+
+    first = make_logger(console_mode='plain', no_file_logging=True)
+    second = make_logger(f'{first.name}.other', console_mode='plain', no_file_logging=True)
+
+    for index in range(6):
+        (first if index % 2 == 0 else second).info('line %d', index)
+
+    messages = [line.split('] ')[1].split(' (')[0] for line in raw.getvalue().decode().splitlines()]
+
+    assert messages == [f'line {index}' for index in range(6)]
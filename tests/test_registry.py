@@ -0,0 +1,60 @@
+"""
+Tests for the `Logger` registry: the singleton-per-name idiom and lookups by name.
+"""
+import gc
+import logging
+
+from inspy_logger import Logger
+from inspy_logger.engine import get_loggers
+from inspy_logger.engine.handlers import ConsoleHandler
+from inspy_logger.helpers import get_existing_logger
+
+
+def test_configured_logger_survives_dropping_every_reference(make_logger, logger_name):
+    make_logger().set_level(console_level='error')
+
+    gc.collect()
+
+    existing = get_existing_logger(logger_name)
+
+    assert existing is not None
+    assert existing.console_level == logging.ERROR
+
+    again = Logger(logger_name)
+
+    assert again is existing
+    assert again.console_level == logging.ERROR
+    assert [handler.level for handler in again.iter_handlers() if isinstance(handler, ConsoleHandler)] == \
+           [logging.ERROR]
+
+
+def test_closed_logger_leaves_the_registry(make_logger, logger_name):
+    logger = make_logger()
+
+    logger.close()
+
+    assert get_existing_logger(logger_name) is None
+    assert logger_name not in get_loggers()
+    assert logger_name not in Logger.names
+
+
+def test_named_children_are_held_strongly(make_logger):
+    root = make_logger()
+    name = root.get_child('named').name
+
+    gc.collect()
+
+    assert name in Logger.instances
+    assert name not in Logger.dynamic_instances
+
+
+def test_dynamic_children_are_held_weakly(make_logger):
+    root = make_logger()
+    dynamic = root.get_child('dynamic', evictable=True)
+    grandchild = dynamic.get_child('nested')
+
+    assert dynamic.name in Logger.dynamic_instances
+    assert grandchild.name in Logger.dynamic_instances
+    assert dynamic.name not in Logger.instances
+    assert get_existing_logger(dynamic.name) is dynamic
+    assert get_loggers(root.name)[dynamic.name] is dynamic
@@ -0,0 +1,98 @@
+"""
+Tests for the console render thread (`inspy_logger.engine.render`) and the threaded console handler.
+"""
+import io
+import logging
+import threading
+
+import pytest
+
+from inspy_logger.engine.handlers import ConsoleHandler
+from inspy_logger.engine.render import ConsoleRenderer
+
+
+class ThreadRecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.NOTSET)
+        self.rendered = []
+
+    def emit(self, record):
+        self.rendered.append((record.getMessage(), threading.current_thread().name))
+
+
+def make_record(message, args=None, level=logging.INFO):
+    return logging.LogRecord('tests.render', level, __file__, 1, message, args, None)
+
+
+def test_invalid_configuration_is_rejected():
+    with pytest.raises(ValueError):
+        ConsoleRenderer(frame_interval=-1)
+
+    with pytest.raises(ValueError):
+        ConsoleRenderer(max_queue_size=0)
+
+
+def test_records_are_rendered_in_order_on_the_render_thread():
+    renderer = ConsoleRenderer(frame_interval=0.01, name='tests-renderer')
+    handler = ThreadRecordingHandler()
+
+    for index in range(50):
+        assert renderer.submit(make_record(f'record {index}'), handler)
+
+    assert renderer.flush(timeout=5)
+
+    assert [message for message, _ in handler.rendered] == [f'record {index}' for index in range(50)]
+    assert {thread for _, thread in handler.rendered} == {'tests-renderer'}
+    assert renderer.rendered == 50
+    assert renderer.frames < 50
+    renderer.close()
+
+
+def test_records_past_the_queue_size_are_dropped():
+    renderer = ConsoleRenderer(frame_interval=0.5, max_queue_size=2)
+    handler = ThreadRecordingHandler()
+
+    results = [renderer.submit(make_record(f'record {index}'), handler) for index in range(5)]
+    renderer.close(timeout=5)
+
+    assert results == [True, True, False, False, False]
+    assert renderer.dropped == 3
+    assert [message for message, _ in handler.rendered] == ['record 0', 'record 1']
+
+
+def test_closed_renderer_renders_on_the_calling_thread():
+    renderer = ConsoleRenderer()
+    renderer.close()
+    handler = ThreadRecordingHandler()
+
+    renderer.submit(make_record('late'), handler)
+
+    assert handler.rendered == [('late', threading.current_thread().name)]
+    assert not renderer.running
+
+
+def test_records_below_the_handler_level_are_skipped():
+    renderer = ConsoleRenderer(frame_interval=0)
+    handler = ThreadRecordingHandler()
+    handler.setLevel(logging.WARNING)
+
+    renderer.submit(make_record('hidden', level=logging.INFO), handler)
+    renderer.submit(make_record('shown', level=logging.ERROR), handler)
+    renderer.close(timeout=5)
+
+    assert [message for message, _ in handler.rendered] == ['shown']
+    assert renderer.to_dict()['Rendered'] == 2
+
+
+def test_threaded_console_handler_renders_the_message_as_logged():
+    stream = io.StringIO()
+    handler = ConsoleHandler(mode='plain', threaded=True, stream=stream, show_time=False, show_path=False)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    items = ['first']
+
+    handler.handle(make_record('items: %s', (items,)))
+    items.append('second')
+    handler.flush()
+
+    assert stream.getvalue() == "INFO     items: ['first']\n"
+    handler.close()
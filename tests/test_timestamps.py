@@ -0,0 +1,115 @@
+"""
+Tests for the timestamps rendered by `CustomFormatter` (the per-second `asctime` cache and monotonic timestamps).
+"""
+import logging
+import time
+
+import pytest
+
+from inspy_logger.helpers import formatting
+from inspy_logger.helpers.formatting import CustomFormatter
+
+
+def make_record(created):
+    record = logging.LogRecord('tests.timestamps', logging.INFO, __file__, 1, 'message', None, None)
+    record.created = created
+    record.msecs = (created - int(created)) * 1000
+
+    return record
+
+
+@pytest.fixture
+def strftime_calls(monkeypatch):
+    calls = []
+    strftime = time.strftime
+
+    def counting_strftime(*args):
+        calls.append(args)
+        return strftime(*args)
+
+    monkeypatch.setattr(formatting.time, 'strftime', counting_strftime)
+
+    return calls
+
+
+@pytest.mark.parametrize('datefmt', [None, '%H:%M:%S', '%Y-%m-%dT%H:%M:%S'])
+def test_asctime_matches_the_standard_formatter(datefmt):
+    formatter = CustomFormatter('%(asctime)s %(message)s', datefmt=datefmt)
+    standard = logging.Formatter('%(asctime)s %(message)s', datefmt=datefmt)
+
+    for created in (1_700_000_000.0, 1_700_000_000.123, 1_700_000_000.999, 1_700_000_001.5, 1_700_000_000.25):
+        record = make_record(created)
+
+        assert formatter.formatTime(record, datefmt) == standard.formatTime(record, datefmt)
+
+
+def test_strftime_runs_once_per_second(strftime_calls):
+    formatter = CustomFormatter('%(asctime)s %(message)s')
+
+    records = [make_record(1_700_000_000 + offset / 10) for offset in range(25)]
+    stamps = [formatter.formatTime(record) for record in records]
+
+    assert len(strftime_calls) == 3
+    assert stamps == [logging.Formatter().formatTime(record) for record in records]
+
+
+def test_a_new_datefmt_is_not_served_from_the_cache(strftime_calls):
+    formatter = CustomFormatter('%(asctime)s %(message)s')
+    record = make_record(1_700_000_000.5)
+
+    formatter.formatTime(record)
+    clock = formatter.formatTime(record, '%H:%M:%S')
+
+    assert len(strftime_calls) == 2
+    assert clock == time.strftime('%H:%M:%S', time.localtime(1_700_000_000))
+
+
+def test_microsecond_precision_appends_six_digits():
+    formatter = CustomFormatter('%(asctime)s %(message)s', timestamp_precision='us')
+
+    stamp = formatter.formatTime(make_record(1_700_000_000.123456))
+
+    assert stamp.endswith(',123456')
+
+
+def test_invalid_precision_is_rejected():
+    with pytest.raises(ValueError):
+        CustomFormatter('%(asctime)s', timestamp_precision='ns')
+
+
+def test_monotonic_timestamps_ignore_wall_clock_adjustments(monkeypatch):
+    monkeypatch.setattr(formatting, '_CLOCK_ANCHOR', (1_700_000_000_000_000_000, 5_000_000_000))
+    formatter = CustomFormatter('%(asctime)s %(message)s', monotonic_timestamps=True)
+
+    before = make_record(1_700_000_000.5)
+    before.monotonic_ns = 5_500_000_000
+
+    # The system clock was set back by an hour between the two records.
+    after = make_record(1_699_996_400.75)
+    after.monotonic_ns = 5_750_000_000
+
+    standard = logging.Formatter()
+
+    assert formatter.formatTime(before) == standard.formatTime(before)
+    assert formatter.formatTime(after) == standard.formatTime(make_record(1_700_000_000.75))
+
+
+def test_monotonic_timestamps_fall_back_to_created():
+    formatter = CustomFormatter('%(asctime)s %(message)s', monotonic_timestamps=True)
+    record = make_record(1_700_000_000.5)
+
+    assert formatter.formatTime(record) == logging.Formatter().formatTime(record)
+
+
+def test_logger_records_carry_a_monotonic_reading(make_logger):
+    logger = make_logger(no_file_logging=True)
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger.logger.addHandler(handler)
+
+    before = time.monotonic_ns()
+    logger.info('first')
+    logger.info('second')
+
+    assert before <= records[0].monotonic_ns <= records[1].monotonic_ns <= time.monotonic_ns()
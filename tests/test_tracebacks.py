@@ -0,0 +1,132 @@
+"""
+Tests for tiered traceback rendering (`inspy_logger.engine.tracebacks`).
+"""
+import io
+import logging
+import time
+
+import pytest
+
+from inspy_logger.engine.handlers import PlainConsoleHandler
+from inspy_logger.engine.tracebacks import COMPACT_MAX_FRAMES, TracebackTiers, format_compact, format_line, \
+    format_record, tiered_rich_handler_class, traceback_signature
+
+
+def fail(message='boom', depth=0):
+    if depth:
+        return fail(message, depth - 1)
+
+    raise ValueError(message)
+
+
+def capture(message='boom', depth=0):
+    try:
+        fail(message, depth)
+    except ValueError as error:
+        return type(error), error, error.__traceback__
+
+
+def capture_elsewhere():
+    try:
+        fail()
+    except ValueError as error:
+        return type(error), error, error.__traceback__
+
+
+def make_record(exc_info, message='failed'):
+    return logging.LogRecord('tests.tracebacks', logging.ERROR, __file__, 1, message, None, exc_info)
+
+
+def test_signature_ignores_the_message_but_not_the_path():
+    assert traceback_signature(capture('one')) == traceback_signature(capture('two'))
+    assert traceback_signature(capture()) != traceback_signature(capture_elsewhere())
+    assert traceback_signature(capture())[:2] == ('builtins', 'ValueError')
+
+
+def test_tiers_render_in_full_once_per_signature():
+    tiers = TracebackTiers('line')
+
+    assert [tiers.tier(capture()) for _ in range(3)] == ['full', 'line', 'line']
+    assert tiers.tier(capture_elsewhere()) == 'full'
+    assert tiers.to_dict() == {'Repeat Tier': 'line', 'Full': 2, 'Repeated': 2, 'Signatures': 2}
+
+
+def test_full_repeat_tier_always_renders_in_full():
+    tiers = TracebackTiers('full')
+
+    assert [tiers.tier(capture()) for _ in range(2)] == ['full', 'full']
+
+
+def test_signatures_expire_after_the_ttl():
+    tiers = TracebackTiers(ttl=0.01)
+
+    assert tiers.tier(capture()) == 'full'
+    assert tiers.tier(capture()) == 'compact'
+
+    time.sleep(0.02)
+
+    assert tiers.tier(capture()) == 'full'
+
+
+def test_invalid_tier_is_rejected():
+    with pytest.raises(ValueError):
+        TracebackTiers('verbose')
+
+
+def test_line_and_compact_formats():
+    exc_info = capture('bad value', depth=10)
+
+    raise_line = fail.__code__.co_firstlineno + 4
+
+    assert format_line(exc_info) == f'ValueError: bad value ({__file__}:{raise_line})'
+
+    # `capture`, then `fail` recursing ten times before raising.
+    compact = format_compact(exc_info).splitlines()
+
+    assert compact[0] == 'Traceback (most recent call last, 12 frame(s), repeated):'
+    assert compact[1] == f'  ... {12 - COMPACT_MAX_FRAMES} frame(s) hidden ...'
+    assert compact[-2] == f'  File "{__file__}", line {raise_line}, in fail'
+    assert len(compact) == 2 + COMPACT_MAX_FRAMES + 1
+    assert compact[-1] == 'ValueError: bad value'
+
+
+def test_format_record_leaves_the_full_traceback_to_other_handlers():
+    record = make_record(capture())
+    formatter = logging.Formatter('%(message)s')
+
+    assert format_record(formatter, record, 'line').splitlines()[1].startswith('ValueError: boom (')
+    assert record.exc_text is None
+    assert 'Traceback (most recent call last):' in formatter.format(record)
+
+
+def test_plain_console_handler_renders_repeats_compactly():
+    stream = io.StringIO()
+    handler = PlainConsoleHandler(stream, show_time=False, show_path=False, traceback_tiers=TracebackTiers('line'))
+
+    for _ in range(2):
+        handler.handle(make_record(capture()))
+
+    handler.close()
+    output = stream.getvalue()
+
+    assert output.count('Traceback (most recent call last):') == 1
+    assert output.splitlines()[-1].startswith('ValueError: boom (')
+
+
+def test_tiered_rich_handler_shows_locals_only_the_first_time():
+    from rich.console import Console
+
+    stream = io.StringIO()
+    handler = tiered_rich_handler_class()(
+            console=Console(file=stream, width=200), rich_tracebacks=True, tracebacks_show_locals=True,
+            traceback_tiers=TracebackTiers('compact')
+            )
+
+    handler.handle(make_record(capture()))
+    first = stream.getvalue()
+    handler.handle(make_record(capture()))
+    second = stream.getvalue()[len(first):]
+
+    assert 'locals' in first
+    assert 'locals' not in second
+    assert 'ValueError: boom' in second
@@ -0,0 +1,133 @@
+"""
+Tests for one-time warnings (`OnceCache` and `Logger.warn_once`).
+"""
+import logging
+
+import pytest
+
+from inspy_logger.engine import cache
+from inspy_logger.engine.cache import OnceCache
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.NOTSET)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache, 'monotonic', clock)
+
+    return clock
+
+
+def warn_from_one_line(logger, message):
+    return logger.warn_once(message, per_call_site=True)
+
+
+def test_cache_issues_each_key_once():
+    once = OnceCache()
+
+    assert once.issue('a')
+    assert not once.issue('a')
+    assert once.issue('b')
+
+    assert (once.hits, once.misses) == (1, 2)
+    assert list(once) == ['a', 'b']
+
+
+def test_cache_forgets_the_least_recently_used_key_past_max_size():
+    once = OnceCache(max_size=2)
+
+    once.issue('a')
+    once.issue('b')
+    once.issue('a')
+    once.issue('c')
+
+    assert 'b' not in once
+    assert once.evictions == 1
+    assert once.issue('b')
+
+
+def test_cache_issues_keys_again_after_their_ttl(clock):
+    once = OnceCache(ttl=10)
+    once.issue('a')
+
+    clock.now += 9.9
+    assert not once.issue('a')
+
+    clock.now += 0.1
+    assert once.issue('a')
+    assert once.expirations == 1
+
+    clock.now += 5
+    assert not once.issue('a')
+
+
+def test_invalid_cache_size_is_rejected():
+    with pytest.raises(ValueError):
+        OnceCache(max_size=0)
+
+
+def test_warn_once_logs_each_message_once(make_logger):
+    logger = make_logger(no_file_logging=True)
+    handler = ListHandler()
+    logger.logger.addHandler(handler)
+
+    assert logger.warn_once('disk almost full')
+    assert not logger.warn_once('disk almost full')
+    assert logger.warn_once('disk full')
+
+    assert handler.messages == ['disk almost full', 'disk full']
+
+
+def test_warn_once_identifies_warnings_by_key(make_logger):
+    logger = make_logger(no_file_logging=True)
+    handler = ListHandler()
+    logger.logger.addHandler(handler)
+
+    for request_id in range(3):
+        logger.warn_once('request %d retried', request_id, key='retry')
+
+    assert handler.messages == ['request 0 retried']
+
+
+def test_warn_once_identifies_warnings_by_call_site(make_logger):
+    logger = make_logger(no_file_logging=True)
+    handler = ListHandler()
+    logger.logger.addHandler(handler)
+
+    for request_id in range(3):
+        warn_from_one_line(logger, f'request {request_id} retried')
+
+    logger.warn_once('request 0 retried', per_call_site=True)
+
+    assert handler.messages == ['request 0 retried', 'request 0 retried']
+
+
+def test_warn_once_repeats_after_the_ttl(make_logger, clock):
+    logger = make_logger(no_file_logging=True, warn_once_ttl=60)
+    handler = ListHandler()
+    logger.logger.addHandler(handler)
+
+    logger.warn_once('stale cache')
+    clock.now += 30
+    logger.warn_once('stale cache')
+    clock.now += 30
+    logger.warn_once('stale cache')
+
+    assert handler.messages == ['stale cache', 'stale cache']
+    assert logger.warnings_issued.expirations == 1
@@ -0,0 +1,109 @@
+"""
+Tests for the shared file and stream writers of `inspy_logger.engine.writers`.
+"""
+import io
+
+from inspy_logger.engine.writers import SharedStreamWriter, SharedWriter, WriterPool
+
+
+def test_same_path_shares_one_writer(tmp_path):
+    pool = WriterPool()
+    path = tmp_path / 'app.log'
+
+    first = pool.acquire(path)
+    second = pool.acquire(str(path))
+
+    assert first is second
+    assert isinstance(first, SharedWriter)
+    assert first.references == 2
+    assert path in pool
+
+
+def test_file_is_closed_with_the_last_reference(tmp_path):
+    pool = WriterPool()
+    writer = pool.acquire(tmp_path / 'app.log')
+    pool.acquire(tmp_path / 'app.log')
+
+    writer.stream.write('line\n')
+
+    pool.release(writer)
+    assert writer.is_open
+
+    pool.release(writer)
+    assert not writer.is_open
+    assert len(pool) == 0
+    assert (tmp_path / 'app.log').read_text() == 'line\n'
+
+
+def test_same_stream_shares_one_writer():
+    pool = WriterPool()
+    stream = io.StringIO()
+
+    first = pool.acquire_stream(stream)
+    second = pool.acquire_stream(stream)
+
+    assert first is second
+    assert isinstance(first, SharedStreamWriter)
+    assert stream in pool
+    assert pool.acquire_stream(io.StringIO()) is not first
+
+
+def test_stream_writer_keeps_order_across_buffered_and_direct_writes():
+    pool = WriterPool()
+    stream = io.StringIO()
+    buffering, direct = pool.acquire_stream(stream), pool.acquire_stream(stream)
+
+    buffering.append(b'1\n')
+    direct.write(b'2\n')
+    buffering.append(b'3\n')
+
+    assert stream.getvalue() == '1\n2\n'
+
+    buffering.flush()
+
+    assert stream.getvalue() == '1\n2\n3\n'
+
+
+def test_stream_writer_keeps_order_with_text_written_directly():
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding='utf-8')
+    writer = WriterPool().acquire_stream(stream)
+
+    stream.write('text first\n')
+    writer.write('then bytes ✓\n'.encode())
+
+    assert raw.getvalue().decode() == 'text first\nthen bytes ✓\n'
+
+
+def test_stream_writer_lets_the_stream_translate_newlines():
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding='utf-8', newline='\r\n')
+    writer = WriterPool().acquire_stream(stream)
+
+    writer.write(b'first\nsecond\n')
+
+    assert raw.getvalue() == b'first\r\nsecond\r\n'
+
+
+def test_stream_writer_uses_the_stream_encoding():
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding='latin-1')
+    writer = WriterPool().acquire_stream(stream)
+
+    writer.write('café\n'.encode(writer.encoding))
+
+    assert writer.encoding == 'latin-1'
+    assert raw.getvalue() == 'café\n'.encode('latin-1')
+
+
+def test_releasing_a_stream_flushes_but_does_not_close_it():
+    pool = WriterPool()
+    stream = io.StringIO()
+    writer = pool.acquire_stream(stream)
+
+    writer.append(b'pending\n')
+    pool.release(writer)
+
+    assert stream.getvalue() == 'pending\n'
+    assert not stream.closed
+    assert stream not in pool